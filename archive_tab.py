@@ -0,0 +1,212 @@
+# --- START OF FILE archive_tab.py ---
+
+import tkinter as tk
+from tkinter import ttk, scrolledtext, messagebox
+import os
+import sys
+import time
+import typing
+
+import numpy as np
+import sounddevice as sd
+import soundfile
+
+from transcript_archive import TranscriptArchive
+from utils import format_duration
+
+if typing.TYPE_CHECKING:
+    from gui import ModernTranscriptionApp
+
+class ArchiveTab:
+    """GUI Tab for searching archived transcripts and jumping to the matching segments."""
+    SEARCH_DELAY = 250 # ms after the last keystroke before searching
+    COLUMNS = ("file", "time", "text")
+    PLAY_SECONDS = 30 # Audio played from a segment's start
+
+    def __init__(self, parent_notebook: ttk.Notebook, gui_app: 'ModernTranscriptionApp', archive: TranscriptArchive):
+        self.parent_notebook = parent_notebook
+        self.gui_app = gui_app
+        self.archive = archive
+
+        self.frame = ttk.Frame(parent_notebook, padding="10")
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(1, weight=1) # Results and transcript expand
+
+        # --- Variables ---
+        self.query_var = tk.StringVar(value="")
+        self.summary_var = tk.StringVar(value="")
+        self._results: dict[str, dict] = {} # Tree item id -> search result
+        self._shown_transcript: typing.Optional[dict] = None
+        self._search_id = None
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        # --- Search Bar ---
+        search_frame = ttk.Frame(self.frame)
+        search_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        search_frame.columnconfigure(1, weight=1)
+        self.search_label = ttk.Label(search_frame, text="") # TEXT REMOVED
+        self.search_label.grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.query_var)
+        self.search_entry.grid(row=0, column=1, sticky="ew", padx=5)
+        self.search_entry.bind("<KeyRelease>", self._schedule_search)
+        self.search_entry.bind("<Return>", lambda event: self._search())
+        self.search_button = ttk.Button(search_frame, text="", command=self._search, style="Primary.TButton") # TEXT REMOVED
+        self.search_button.grid(row=0, column=2, padx=5)
+        self.summary_label = ttk.Label(search_frame, textvariable=self.summary_var, anchor="w")
+        self.summary_label.grid(row=1, column=0, columnspan=3, sticky="ew", padx=5, pady=(5, 0))
+
+        paned = ttk.PanedWindow(self.frame, orient=tk.VERTICAL)
+        paned.grid(row=1, column=0, sticky="nsew")
+
+        # --- Matching Segments ---
+        list_frame = ttk.Frame(paned, borderwidth=1, relief="sunken")
+        list_frame.rowconfigure(0, weight=1); list_frame.columnconfigure(0, weight=1)
+        self.result_tree = ttk.Treeview(list_frame, columns=self.COLUMNS, show="headings", selectmode="browse", height=8)
+        for column, width, anchor in zip(self.COLUMNS, (200, 110, 520), (tk.W, tk.E, tk.W)):
+            self.result_tree.column(column, width=width, anchor=anchor, stretch=(column == "text"))
+        self.result_tree.grid(row=0, column=0, sticky="nsew")
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.result_tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.result_tree.configure(yscrollcommand=scrollbar.set)
+        self.result_tree.bind("<<TreeviewSelect>>", self._on_result_selected)
+        self.result_tree.bind("<Double-1>", lambda event: self._play_selected())
+        paned.add(list_frame, weight=1)
+
+        # --- Transcript of the Selected Match ---
+        self.transcript_frame = ttk.LabelFrame(paned, text="", padding=10) # TEXT REMOVED
+        self.transcript_frame.columnconfigure(0, weight=1); self.transcript_frame.rowconfigure(0, weight=1)
+        text_frame = ttk.Frame(self.transcript_frame, borderwidth=1, relief="sunken")
+        text_frame.grid(row=0, column=0, sticky="nsew")
+        text_frame.rowconfigure(0, weight=1); text_frame.columnconfigure(0, weight=1)
+        self.transcript_text = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD, width=80, height=10, font=("Segoe UI", 11), background="white",
+                                                         foreground=self.gui_app.text_color, borderwidth=0, relief="flat", state=tk.DISABLED)
+        self.transcript_text.grid(row=0, column=0, sticky="nsew", padx=1, pady=1)
+        self.transcript_text.tag_configure("timestamp", foreground="#888888")
+        self.transcript_text.tag_configure("match", background="#fff3b0")
+        buttons_frame = ttk.Frame(self.transcript_frame)
+        buttons_frame.grid(row=1, column=0, sticky="ew", pady=(10, 0))
+        self.play_button = ttk.Button(buttons_frame, text="", command=self._play_selected, style="Action.TButton", state=tk.DISABLED) # TEXT REMOVED
+        self.play_button.pack(side=tk.LEFT, padx=5)
+        self.stop_button = ttk.Button(buttons_frame, text="", command=self._stop_playback, style="Action.TButton") # TEXT REMOVED
+        self.stop_button.pack(side=tk.LEFT, padx=5)
+        self.delete_button = ttk.Button(buttons_frame, text="", command=self._delete_selected, style="Action.TButton", state=tk.DISABLED) # TEXT REMOVED
+        self.delete_button.pack(side=tk.RIGHT, padx=5)
+        paned.add(self.transcript_frame, weight=2)
+
+    def update_ui_text(self):
+        """Updates widget text based on GUI language."""
+        if not self.frame.winfo_exists(): return
+        try:
+            self.search_label.config(text=self.gui_app.translate("archive_search_label"))
+            self.search_button.config(text=self.gui_app.translate("archive_search_button"))
+            self.transcript_frame.config(text=self.gui_app.translate("archive_transcript_frame"))
+            self.play_button.config(text=self.gui_app.translate("archive_play_button"))
+            self.stop_button.config(text=self.gui_app.translate("archive_stop_button"))
+            self.delete_button.config(text=self.gui_app.translate("archive_delete_button"))
+            for column in self.COLUMNS:
+                self.result_tree.heading(column, text=self.gui_app.translate(f"archive_column_{column}"))
+            if not self.query_var.get().strip(): self._show_archive_summary()
+        except tk.TclError as e:
+            print(f"Archive Tab: TclError during update_ui_text: {e}", file=sys.__stderr__)
+        except Exception as e:
+            import traceback
+            print(f"Archive Tab: Unexpected error during update_ui_text: {e}\n{traceback.format_exc()}", file=sys.__stderr__)
+
+    def _show_archive_summary(self):
+        stats = self.archive.stats()
+        self.summary_var.set(self.gui_app.translate("archive_summary").format(transcripts=stats["transcripts"], segments=stats["segments"], size_mb=stats["size_mb"]))
+
+    def _schedule_search(self, event=None):
+        """Search as you type, once typing pauses."""
+        if event is not None and event.keysym == "Return": return
+        if self._search_id:
+            try: self.frame.after_cancel(self._search_id)
+            except (ValueError, tk.TclError): pass
+        self._search_id = self.frame.after(self.SEARCH_DELAY, self._search)
+
+    def _search(self):
+        self._search_id = None
+        query = self.query_var.get().strip()
+        self.result_tree.delete(*self.result_tree.get_children()); self._results.clear()
+        if not query: self._show_archive_summary(); return
+        start = time.perf_counter()
+        results = self.archive.search(query)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for index, result in enumerate(results):
+            item = f"r{index}"
+            time_range = f"{format_duration(result['start'] or 0)} - {format_duration(result['end'] or 0)}"
+            self.result_tree.insert("", tk.END, iid=item, values=(result["file"], time_range, result["snippet"]))
+            self._results[item] = result
+        transcripts = len({result["transcript_id"] for result in results})
+        self.summary_var.set(self.gui_app.translate("archive_results_summary").format(count=len(results), transcripts=transcripts, elapsed_ms=elapsed_ms))
+
+    def _selected_result(self) -> typing.Optional[dict]:
+        selection = self.result_tree.selection()
+        return self._results.get(selection[0]) if selection else None
+
+    def _on_result_selected(self, event=None):
+        result = self._selected_result()
+        self.play_button.config(state=tk.NORMAL if result else tk.DISABLED)
+        self.delete_button.config(state=tk.NORMAL if result else tk.DISABLED)
+        if result: self._show_transcript(result["transcript_id"], result["segment_id"])
+
+    def _show_transcript(self, transcript_id: int, segment_id: int):
+        """Shows the whole transcript with timestamps, scrolled to the matching segment."""
+        if self._shown_transcript is None or self._shown_transcript["id"] != transcript_id:
+            transcript = self.archive.get_transcript(transcript_id)
+            if transcript is None: return
+            self._shown_transcript = transcript
+            self.transcript_text.config(state=tk.NORMAL)
+            self.transcript_text.delete("1.0", tk.END)
+            for segment in transcript["segments"]:
+                tag = f"seg{segment['segment_id']}"
+                self.transcript_text.insert(tk.END, f"[{format_duration(segment['start'] or 0)}] ", ("timestamp", tag))
+                self.transcript_text.insert(tk.END, segment["text"] + "\n", (tag,))
+            self.transcript_text.config(state=tk.DISABLED)
+        self.transcript_text.tag_remove("match", "1.0", tk.END)
+        ranges = self.transcript_text.tag_ranges(f"seg{segment_id}")
+        if ranges:
+            self.transcript_text.tag_add("match", ranges[0], ranges[-1])
+            self.transcript_text.see(ranges[0])
+
+    def _play_selected(self):
+        """Plays the archived audio file from the selected segment's start."""
+        result = self._selected_result()
+        if not result: return
+        path = result["path"]
+        if not path or not os.path.exists(path):
+            messagebox.showwarning(self.gui_app.translate("warning_title"), self.gui_app.translate("archive_file_missing").format(path=path), parent=self.frame)
+            return
+        try:
+            with soundfile.SoundFile(path) as f:
+                f.seek(min(int((result["start"] or 0) * f.samplerate), f.frames))
+                excerpt = f.read(int(self.PLAY_SECONDS * f.samplerate), dtype='float32')
+                sample_rate = f.samplerate
+            sd.stop(); sd.play(np.ascontiguousarray(excerpt), sample_rate) # Non-blocking; Stop or the next play interrupts it
+        except Exception as e: # Formats libsndfile cannot read (M4A, ...) or no output device
+            messagebox.showerror(self.gui_app.translate("error_title"), self.gui_app.translate("archive_play_error").format(file=result["file"], error=e), parent=self.frame)
+
+    def _stop_playback(self):
+        try: sd.stop()
+        except Exception as e: print(f"Archive Tab: error stopping playback: {e}", file=sys.__stderr__)
+
+    def _delete_selected(self):
+        result = self._selected_result()
+        if not result: return
+        if not messagebox.askyesno(self.gui_app.translate("warning_title"), self.gui_app.translate("archive_confirm_delete").format(file=result["file"]), parent=self.frame): return
+        self.archive.delete(result["transcript_id"])
+        self._shown_transcript = None
+        self.transcript_text.config(state=tk.NORMAL); self.transcript_text.delete("1.0", tk.END); self.transcript_text.config(state=tk.DISABLED)
+        self._search()
+
+    def on_close(self):
+        print("Archive Tab closing.")
+        if self._search_id:
+            try: self.frame.after_cancel(self._search_id)
+            except (ValueError, tk.TclError): pass
+        self._stop_playback()
+        self.archive.close()
+
+# --- END OF FILE archive_tab.py ---
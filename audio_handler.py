@@ -42,6 +42,7 @@ class AudioHandler:
         self.audio_data = None # Holds current audio (recorded or loaded) as float32 numpy array
         self.stream = None
         self.audio_queue = queue.Queue()
+        self.chunk_listeners = [] # Called from the audio callback with (chunk, sample_rate), e.g. LiveTranscriber.feed
 
         self.status_callback = status_callback
         # self.waveform_callback = waveform_callback # Not used
@@ -84,6 +85,9 @@ class AudioHandler:
             chunk_copy = indata.copy()
             if self.audio_queue: self.audio_queue.put(chunk_copy)
             if hasattr(self, 'recorded_frames') and isinstance(self.recorded_frames, list): self.recorded_frames.append(chunk_copy)
+            for listener in self.chunk_listeners:
+                try: listener(chunk_copy, self.sample_rate)
+                except Exception as e: print(f"AUDIO HANDLER ERROR: chunk listener failed: {e}", file=sys.stderr)
 
             # --- Optional: Print queue size for debugging buffer issues ---
             # if DEBUG_AUDIO and hasattr(self, '_callback_print_counter') and self._callback_print_counter % 50 == 0:
@@ -0,0 +1,268 @@
+# --- START OF FILE audio_loader.py ---
+"""
+In-process audio decoding for transcription.
+
+WAV, FLAC and OGG files are read with soundfile block by block, downmixed and resampled to
+Whisper's 16 kHz mono float32 with a polyphase filter, straight into a preallocated array.
+This avoids the ffmpeg subprocess and its full-file pipe. Other formats (MP3, M4A, ...),
+or files libsndfile cannot read, still go through whisper.load_audio.
+
+AudioStream serves long files without decoding them whole: slices are decoded on demand
+from a memory-mapped WAV data chunk (or libsndfile blocks for other formats), so peak
+memory stays at a few blocks however long the recording is.
+"""
+
+import os
+import sys
+import math
+import time
+import struct
+import typing
+
+import numpy as np
+import soundfile
+import whisper
+
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE # 16 kHz
+NATIVE_EXTENSIONS = (".wav", ".flac", ".ogg") # Decoded by libsndfile without ffmpeg
+READ_BLOCK_SECONDS = 30 # Input read per block (bounds the temporary buffers, not the result)
+KAISER_BETA = 5.0 # Same window as scipy.signal.resample_poly
+FILTER_HALF_LENGTH_FACTOR = 10 # Filter half-length in units of max(up, down), also as in resample_poly
+OUTPUT_BLOCK = 1 << 18 # Output samples per matrix product (bounds the temporary copy of the input windows)
+# WAV sample encodings read straight from a memory map: (format tag, bits) -> (numpy dtype, scale to [-1, 1])
+WAV_MAPPED_ENCODINGS = {(1, 16): ("<i2", 1.0 / 32768), (1, 32): ("<i4", 1.0 / 2**31), (3, 32): ("<f4", 1.0)}
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler (up/down by integers from the rate ratio) with a Kaiser-windowed
+    sinc low-pass, equivalent to scipy.signal.resample_poly. Feed mono blocks to process() and
+    call flush() once at the end; the outputs concatenate to ceil(len(input) * up / down) samples.
+
+    Every 'up' consecutive outputs read a window of input that advances by exactly 'down'
+    samples, so a whole block is one matrix product of strided input windows (a view, no copy
+    of the signal) with an (up x window) matrix holding all filter phases.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int = SAMPLE_RATE):
+        divisor = math.gcd(int(input_rate), int(output_rate))
+        self.up, self.down = int(output_rate) // divisor, int(input_rate) // divisor
+        max_rate = max(self.up, self.down)
+        half_length = FILTER_HALF_LENGTH_FACTOR * max_rate
+        taps = np.arange(2 * half_length + 1) - half_length
+        cutoff = 1.0 / max_rate # Of the upsampled rate's Nyquist frequency
+        fir = cutoff * np.sinc(cutoff * taps) * np.kaiser(len(taps), KAISER_BETA) * self.up # Gain 'up' restores the zero-stuffed level
+        taps_per_phase = -(-len(fir) // self.up)
+        # Output n = g*up + r reads inputs g*down + offsets[r] - k (k < taps_per_phase) weighted by fir[phase[r] + k*up]
+        residues = np.arange(self.up)
+        offsets = (residues * self.down + half_length) // self.up; phases = (residues * self.down + half_length) % self.up
+        self._first_offset = int(offsets[0]) - taps_per_phase + 1 # Window start relative to g*down
+        self._last_offset = int(offsets[-1])
+        self.window = self._last_offset - self._first_offset + 1
+        self._weights = np.zeros((self.window, self.up), dtype=np.float32)
+        for r in range(self.up):
+            for k in range(taps_per_phase):
+                if phases[r] + k * self.up < len(fir): self._weights[offsets[r] - k - self._first_offset, r] = fir[phases[r] + k * self.up]
+        self._buffer = np.zeros(max(0, -self._first_offset), dtype=np.float32) # Implicit zeros before the signal
+        self._buffer_start = -len(self._buffer) # Input index of _buffer[0]
+        self._input_count = 0
+        self._next_group = 0
+
+    def output_length(self, input_length: int) -> int:
+        return -(-input_length * self.up // self.down)
+
+    def _produce(self, groups_limit: int = sys.maxsize) -> np.ndarray:
+        available = max(0, (self._input_count - 1 - self._last_offset) // self.down + 1) # Groups whose inputs have all arrived
+        end = max(self._next_group, min(groups_limit, available))
+        parts = []; groups_per_block = max(1, OUTPUT_BLOCK // self.up)
+        for block_start in range(self._next_group, end, groups_per_block):
+            count = min(groups_per_block, end - block_start)
+            first = block_start * self.down + self._first_offset - self._buffer_start
+            span = self._buffer[first:first + (count - 1) * self.down + self.window]
+            windows = np.lib.stride_tricks.sliding_window_view(span, self.window)[::self.down]
+            parts.append((windows @ self._weights).ravel())
+        self._next_group = end
+        keep_from = end * self.down + self._first_offset - self._buffer_start # Oldest input the next group reads
+        if keep_from > 0: self._buffer = self._buffer[keep_from:]; self._buffer_start += keep_from
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        self._buffer = np.concatenate([self._buffer, block.astype(np.float32, copy=False)])
+        self._input_count += len(block)
+        return self._produce()
+
+    def flush(self) -> np.ndarray:
+        """Returns the remaining outputs (the filter's tail over implicit trailing zeros)."""
+        final_length = self.output_length(self._input_count)
+        produced = self._next_group * self.up
+        padding = self._last_offset + self.down + 1
+        self._buffer = np.concatenate([self._buffer, np.zeros(padding, dtype=np.float32)]); self._input_count += padding
+        return self._produce(groups_limit=-(-final_length // self.up))[:max(0, final_length - produced)]
+
+
+def decode_native(path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Reads a libsndfile-supported file as mono float32 at sample_rate (raises soundfile errors)."""
+    with soundfile.SoundFile(path) as f:
+        resampler = PolyphaseResampler(f.samplerate, sample_rate) if f.samplerate != sample_rate else None
+        total = resampler.output_length(f.frames) if resampler else f.frames
+        audio = np.empty(total, dtype=np.float32); filled = 0
+        def put(samples: np.ndarray):
+            nonlocal filled
+            count = min(len(samples), total - filled)
+            audio[filled:filled + count] = samples[:count]; filled += count
+        for block in f.blocks(blocksize=max(1, READ_BLOCK_SECONDS * f.samplerate), dtype='float32', always_2d=True):
+            mono = block[:, 0] if block.shape[1] == 1 else block.mean(axis=1, dtype=np.float32) # Same downmix as ffmpeg -ac 1
+            put(resampler.process(mono) if resampler else mono)
+        if resampler: put(resampler.flush())
+    return audio[:filled]
+
+
+def _wav_layout(path: str) -> typing.Optional[dict]:
+    """
+    Position and encoding of a RIFF/WAVE file's data chunk, or None if the file is not a WAV
+    numpy can map directly (8/24-bit PCM, RF64, compressed WAV, ... go through libsndfile).
+    """
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE': return None
+        encoding = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8: return None
+            chunk_id, size = chunk_header[:4], struct.unpack('<I', chunk_header[4:])[0]
+            if chunk_id == b'fmt ':
+                fmt = f.read(size)
+                if len(fmt) < 16: return None
+                tag, channels, rate = struct.unpack('<HHI', fmt[:8]); bits = struct.unpack('<H', fmt[14:16])[0]
+                if tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26: tag = struct.unpack('<H', fmt[24:26])[0] # SubFormat GUID starts with the tag
+                encoding = (tag, bits, channels, rate)
+                if size % 2: f.seek(1, 1)
+            elif chunk_id == b'data':
+                if encoding is None or (encoding[0], encoding[1]) not in WAV_MAPPED_ENCODINGS or encoding[2] < 1 or encoding[3] < 1: return None
+                tag, bits, channels, rate = encoding
+                offset = f.tell(); frame_bytes = channels * bits // 8
+                size = min(size, os.path.getsize(path) - offset) # Truncated recordings declare more data than they hold
+                dtype, scale = WAV_MAPPED_ENCODINGS[(tag, bits)]
+                return {"offset": offset, "frames": size // frame_bytes, "channels": channels, "rate": rate, "dtype": dtype, "scale": scale, "frame_bytes": frame_bytes}
+            else: f.seek(size + size % 2, 1)
+
+
+def _downmix(block: np.ndarray) -> np.ndarray:
+    """(frames, channels) block to mono float32, same downmix as ffmpeg -ac 1."""
+    return block[:, 0].astype(np.float32) if block.shape[1] == 1 else block.mean(axis=1, dtype=np.float32)
+
+
+class AudioStream:
+    """
+    A file's 16 kHz mono float32 samples as a read-only sliceable sequence (len() and
+    stream[start:stop]), decoded on demand instead of held in memory.
+
+    16 kHz WAV files are sliced directly from a memory map of the data chunk. Anything else
+    is decoded block by block (mapped WAV blocks or libsndfile reads) through the polyphase
+    resampler, keeping only the samples from the last requested start onward: reads are
+    expected to move forward, as the transcriber's windows do, and a read before the kept
+    samples restarts decoding from the top of the file.
+    """
+
+    def __init__(self, path: str, sample_rate: int = SAMPLE_RATE):
+        self.path = path
+        self.sample_rate = sample_rate
+        self._wav = _wav_layout(path)
+        if self._wav: self.input_rate, self.input_frames, self.channels = self._wav["rate"], self._wav["frames"], self._wav["channels"]
+        else:
+            with soundfile.SoundFile(path) as f: self.input_rate, self.input_frames, self.channels = f.samplerate, f.frames, f.channels
+        self._resampled = self.input_rate != sample_rate
+        self._length = PolyphaseResampler(self.input_rate, sample_rate).output_length(self.input_frames) if self._resampled else self.input_frames
+        self.restarts = 0 # Backward reads that re-decoded from the top (for logging)
+        self._reset()
+
+    @property
+    def source(self) -> str:
+        return "memory-mapped WAV" if self._wav else "libsndfile blocks"
+
+    def reopened(self) -> 'AudioStream':
+        """A new stream on the same file, positioned at the top (for a second forward pass)."""
+        return AudioStream(self.path, self.sample_rate)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _read_wav(self, start: int, count: int) -> np.ndarray:
+        """Mono float32 input frames [start, start + count) mapped from the WAV data chunk (unmapped again on return)."""
+        count = max(0, min(count, self._wav["frames"] - start))
+        if count == 0: return np.zeros(0, dtype=np.float32)
+        frames = np.memmap(self.path, dtype=self._wav["dtype"], mode='r', offset=self._wav["offset"] + start * self._wav["frame_bytes"],
+                           shape=(count, self._wav["channels"]))
+        mono = _downmix(frames); del frames
+        if self._wav["scale"] != 1.0: mono *= np.float32(self._wav["scale"])
+        return mono
+
+    def _input_blocks(self) -> typing.Iterator[np.ndarray]:
+        block_frames = max(1, READ_BLOCK_SECONDS * self.input_rate)
+        if self._wav:
+            for start in range(0, self.input_frames, block_frames): yield self._read_wav(start, block_frames)
+            return
+        with soundfile.SoundFile(self.path) as f:
+            for block in f.blocks(blocksize=block_frames, dtype='float32', always_2d=True): yield _downmix(block)
+
+    def iter_blocks(self) -> typing.Iterator[np.ndarray]:
+        """One pass over the whole file in consecutive output-rate blocks (independent of slicing)."""
+        resampler = PolyphaseResampler(self.input_rate, self.sample_rate) if self._resampled else None
+        emitted = 0
+        for block in self._input_blocks():
+            samples = resampler.process(block) if resampler else block
+            samples = samples[:self._length - emitted]; emitted += len(samples)
+            if len(samples): yield samples
+        if resampler:
+            tail = resampler.flush()[:self._length - emitted]
+            if len(tail): yield tail
+
+    def _reset(self):
+        self._blocks = self.iter_blocks() if (self._resampled or not self._wav) else None
+        self._buffer = np.zeros(0, dtype=np.float32); self._buffer_start = 0 # Output index of _buffer[0]
+
+    def __getitem__(self, index: slice) -> np.ndarray:
+        if not isinstance(index, slice): raise TypeError("AudioStream only supports slices")
+        start, stop, step = index.indices(self._length)
+        if step != 1: raise ValueError("AudioStream only supports contiguous slices")
+        if stop <= start: return np.zeros(0, dtype=np.float32)
+        if self._blocks is None: return self._read_wav(start, stop - start) # Random access, nothing to resample
+        if start < self._buffer_start: self.restarts += 1; self._reset()
+        while self._buffer_start + len(self._buffer) < stop:
+            block = next(self._blocks, None)
+            if block is None: break
+            if self._buffer_start + len(self._buffer) + len(block) <= start: # Entirely before the read: skip without keeping
+                self._buffer_start += len(self._buffer) + len(block); self._buffer = np.zeros(0, dtype=np.float32); continue
+            self._buffer = np.concatenate([self._buffer, block])
+        drop = min(start - self._buffer_start, len(self._buffer)) # Samples before start are never read again
+        if drop > 0: self._buffer = self._buffer[drop:]; self._buffer_start += drop
+        return self._buffer[:stop - start].copy()
+
+
+def open_stream(path: str, sample_rate: int = SAMPLE_RATE) -> typing.Optional[AudioStream]:
+    """An AudioStream for the file, or None if neither the WAV mapper nor libsndfile can read it."""
+    try: return AudioStream(path, sample_rate)
+    except (OSError, RuntimeError, ValueError) as e: # LibsndfileError is a RuntimeError
+        print(f"AudioLoader Warning: cannot stream {os.path.basename(path)} ({e}), decoding it whole.", file=sys.__stderr__)
+        return None
+
+
+def load_audio(path: str, sample_rate: int = SAMPLE_RATE, log: typing.Optional[typing.Callable[[str], None]] = None) -> np.ndarray:
+    """
+    16 kHz mono float32 samples of an audio file: in-process for WAV/FLAC/OGG, ffmpeg
+    (whisper.load_audio) for other formats or when libsndfile cannot read the file.
+    """
+    start = time.time()
+    if path.lower().endswith(NATIVE_EXTENSIONS):
+        try:
+            audio = decode_native(path, sample_rate)
+            if log: log(f"Audio decoded in-process in {(time.time() - start) * 1000:.0f} ms ({len(audio) / sample_rate:.1f}s).\n")
+            return audio
+        except (RuntimeError, ValueError) as e: # LibsndfileError is a RuntimeError
+            print(f"AudioLoader Warning: native decode of {os.path.basename(path)} failed ({e}), using ffmpeg.", file=sys.__stderr__)
+    audio = whisper.load_audio(path, sr=sample_rate)
+    if log: log(f"Audio decoded with ffmpeg in {(time.time() - start) * 1000:.0f} ms ({len(audio) / sample_rate:.1f}s).\n")
+    return audio
+
+# --- END OF FILE audio_loader.py ---
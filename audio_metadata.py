@@ -0,0 +1,267 @@
+# --- START OF FILE audio_metadata.py ---
+"""
+Duration, sample rate and channels of audio files, read from the container headers only.
+
+Covers every format the file dialogs offer (WAV/RF64, FLAC, OGG Vorbis/Opus, MP3, M4A/MP4)
+with small header parsers, so a multi-hour file is described in a few reads and nothing is
+decoded. Other libsndfile formats fall back to soundfile.info. Results are cached by path,
+modification time and size, so the batch queue and repeated selections do not re-open files.
+"""
+
+import os
+import sys
+import struct
+import threading
+import typing
+from collections import OrderedDict
+
+import soundfile
+
+MAX_CACHE_ENTRIES = 4096
+MP3_SYNC_SEARCH_BYTES = 1 << 16 # Leading junk (beyond the ID3 tag) skipped while looking for the first frame
+OGG_MAX_PAGE_BYTES = 65307 # The last page (with the final granule position) is within this many bytes of the end
+MP4_CONTAINER_ATOMS = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+WAV_UNCOMPRESSED_TAGS = {1, 3} # PCM and IEEE float: frames = data bytes / block align
+WAV_ADPCM_TAGS = {2, 0x11} # MS and IMA ADPCM: fixed-size blocks of a known number of frames
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# MPEG audio: bitrates (kbit/s) by (version is 1, layer) and index; sample rates by version
+_MP3_BITRATES = {
+    (True, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (True, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (True, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (False, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (False, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (False, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]} # Version bits: 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+
+
+def _info(duration: float, channels: int, rate: int, container: str) -> dict:
+    return {"duration": max(0.0, float(duration)), "channels": int(channels), "rate": int(rate), "format": container}
+
+
+def _skip_id3v2(f: typing.BinaryIO) -> int:
+    """Offset of the first byte after a leading ID3v2 tag (0 if there is none)."""
+    f.seek(0); header = f.read(10)
+    if len(header) < 10 or header[:3] != b"ID3": return 0
+    size = (header[6] & 0x7F) << 21 | (header[7] & 0x7F) << 14 | (header[8] & 0x7F) << 7 | (header[9] & 0x7F) # Syncsafe
+    return 10 + size + (10 if header[5] & 0x10 else 0) # Optional footer
+
+
+def _wav_info(f: typing.BinaryIO, file_size: int) -> dict:
+    header = f.read(12)
+    rf64 = header[:4] == b"RF64"
+    encoding = None; data_size_64 = None; fact_frames = None
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8: raise ValueError("WAV file has no data chunk")
+        chunk_id, size = chunk_header[:4], struct.unpack("<I", chunk_header[4:])[0]
+        if chunk_id == b"fmt ":
+            fmt = f.read(size)
+            if len(fmt) < 16: raise ValueError("WAV fmt chunk is too short")
+            tag, channels, rate, byte_rate, block_align = struct.unpack("<HHIIH", fmt[:14])
+            if tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26: tag = struct.unpack("<H", fmt[24:26])[0]
+            frames_per_block = struct.unpack("<H", fmt[18:20])[0] if tag in WAV_ADPCM_TAGS and len(fmt) >= 20 else 0
+            encoding = (tag, channels, rate, byte_rate, block_align, frames_per_block)
+            if size % 2: f.seek(1, 1)
+        elif chunk_id == b"ds64":
+            ds64 = f.read(size); data_size_64 = struct.unpack("<Q", ds64[8:16])[0] if len(ds64) >= 16 else None
+            if size % 2: f.seek(1, 1)
+        elif chunk_id == b"fact":
+            fact = f.read(size); fact_frames = struct.unpack("<I", fact[:4])[0] if len(fact) >= 4 else None
+            if size % 2: f.seek(1, 1)
+        elif chunk_id == b"data":
+            if encoding is None: raise ValueError("WAV data chunk before fmt chunk")
+            tag, channels, rate, byte_rate, block_align, frames_per_block = encoding
+            if rate <= 0: raise ValueError("WAV sample rate is 0")
+            if rf64 and size == 0xFFFFFFFF and data_size_64 is not None: size = data_size_64
+            size = min(size, file_size - f.tell()) # Truncated recordings declare more data than they hold
+            if tag in WAV_UNCOMPRESSED_TAGS and block_align: frames = size // block_align
+            elif frames_per_block and block_align: frames = size // block_align * frames_per_block
+            elif fact_frames is not None: frames = fact_frames # Other compressed encodings: the fact chunk counts frames
+            elif byte_rate: return _info(size / byte_rate, channels, rate, "wav")
+            else: raise ValueError("WAV length cannot be determined from the header")
+            return _info(frames / rate, channels, rate, "wav")
+        else: f.seek(size + size % 2, 1)
+
+
+def _flac_info(f: typing.BinaryIO, start: int) -> dict:
+    f.seek(start + 4)
+    block_header = f.read(4)
+    if len(block_header) < 4 or block_header[0] & 0x7F != 0: raise ValueError("FLAC file does not start with STREAMINFO")
+    streaminfo = f.read(34)
+    if len(streaminfo) < 18: raise ValueError("FLAC STREAMINFO is too short")
+    packed = int.from_bytes(streaminfo[10:18], "big") # 20 bits rate, 3 bits channels-1, 5 bits bps-1, 36 bits samples
+    rate = packed >> 44; channels = ((packed >> 41) & 0x7) + 1; total = packed & ((1 << 36) - 1)
+    if rate <= 0: raise ValueError("FLAC sample rate is 0")
+    if total == 0: raise ValueError("FLAC stream length is not stored in STREAMINFO") # Allowed for streams; let libsndfile count
+    return _info(total / rate, channels, rate, "flac")
+
+
+def _ogg_info(f: typing.BinaryIO, file_size: int) -> dict:
+    f.seek(0); page = f.read(27)
+    if len(page) < 27: raise ValueError("OGG page header is too short")
+    f.seek(27 + page[26]) # Skip the segment table; the first packet is the codec identification header
+    packet = f.read(64)
+    if packet[:7] == b"\x01vorbis":
+        channels, rate = packet[11], struct.unpack("<I", packet[12:16])[0]; pre_skip = 0; granule_rate = rate; container = "ogg/vorbis"
+    elif packet[:8] == b"OpusHead":
+        channels, pre_skip = packet[9], struct.unpack("<H", packet[10:12])[0]; rate = granule_rate = 48000; container = "ogg/opus" # Opus always decodes at 48 kHz
+    else: raise ValueError("OGG stream is not Vorbis or Opus")
+    if rate <= 0: raise ValueError("OGG sample rate is 0")
+    tail_start = max(0, file_size - OGG_MAX_PAGE_BYTES)
+    f.seek(tail_start); tail = f.read()
+    last_page = tail.rfind(b"OggS")
+    if last_page < 0 or last_page + 14 > len(tail): raise ValueError("OGG last page not found")
+    granule = struct.unpack("<q", tail[last_page + 6:last_page + 14])[0]
+    return _info((granule - pre_skip) / granule_rate, channels, rate, container)
+
+
+def _mp3_frame_header(header: bytes) -> typing.Optional[dict]:
+    """Fields of a 4-byte MPEG audio frame header, or None if it is not a valid one."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0: return None
+    version = (header[1] >> 3) & 0x3; layer_bits = (header[1] >> 1) & 0x3
+    bitrate_index = header[2] >> 4; rate_index = (header[2] >> 2) & 0x3
+    if version == 1 or layer_bits == 0 or bitrate_index == 0xF or rate_index == 3: return None # Reserved values
+    layer = 4 - layer_bits; mpeg1 = version == 3
+    samples_per_frame = 384 if layer == 1 else (1152 if mpeg1 or layer == 2 else 576)
+    return {"mpeg1": mpeg1, "layer": layer, "bitrate": _MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000,
+            "rate": _MP3_SAMPLE_RATES[version][rate_index], "channels": 1 if header[3] >> 6 == 3 else 2,
+            "samples_per_frame": samples_per_frame, "padding": (header[2] >> 1) & 0x1}
+
+
+def _mp3_frame_length(frame: dict) -> int:
+    slot = 4 if frame["layer"] == 1 else 1
+    return (frame["samples_per_frame"] // 8 * frame["bitrate"] // frame["rate"] // slot + frame["padding"]) * slot
+
+
+def _mp3_info(f: typing.BinaryIO, file_size: int) -> dict:
+    start = _skip_id3v2(f)
+    f.seek(start); data = f.read(MP3_SYNC_SEARCH_BYTES)
+    position = 0; frame = None
+    while True:
+        position = data.find(b"\xFF", position)
+        if position < 0 or position + 4 > len(data): raise ValueError("no MPEG audio frame found")
+        frame = _mp3_frame_header(data[position:position + 4])
+        if frame and frame["bitrate"]: # A real frame is followed by another one (rules out stray 0xFF bytes)
+            following = position + _mp3_frame_length(frame)
+            if following + 4 <= len(data) and not _mp3_frame_header(data[following:following + 4]): frame = None
+        if frame: break
+        position += 1
+    # A VBR file's first frame carries a Xing/Info or VBRI header with the frame count
+    side_info = (32 if frame["channels"] == 2 else 17) if frame["mpeg1"] else (17 if frame["channels"] == 2 else 9)
+    xing = position + 4 + side_info
+    frames = None
+    if data[xing:xing + 4] in (b"Xing", b"Info") and struct.unpack(">I", data[xing + 4:xing + 8])[0] & 0x1:
+        frames = struct.unpack(">I", data[xing + 8:xing + 12])[0]
+    elif data[position + 36:position + 40] == b"VBRI":
+        frames = struct.unpack(">I", data[position + 50:position + 54])[0]
+    if frames: return _info(frames * frame["samples_per_frame"] / frame["rate"], frame["channels"], frame["rate"], "mp3")
+    if not frame["bitrate"]: raise ValueError("free-format MP3 without a VBR header")
+    audio_bytes = file_size - start - position
+    f.seek(max(0, file_size - 128))
+    if f.read(3) == b"TAG": audio_bytes -= 128 # ID3v1 tag at the end
+    return _info(audio_bytes * 8 / frame["bitrate"], frame["channels"], frame["rate"], "mp3") # Constant bitrate
+
+
+def _mp4_atoms(f: typing.BinaryIO, start: int, end: int) -> typing.Iterator[tuple[bytes, int, int]]:
+    """(type, payload start, payload end) of the atoms between start and end, without reading payloads."""
+    position = start
+    while position + 8 <= end:
+        f.seek(position); header = f.read(8)
+        if len(header) < 8: return
+        size, kind = struct.unpack(">I", header[:4])[0], header[4:8]; header_size = 8
+        if size == 1: size = struct.unpack(">Q", f.read(8))[0]; header_size = 16 # 64-bit size
+        elif size == 0: size = end - position # Runs to the end of the file
+        if size < header_size: return
+        yield kind, position + header_size, min(position + size, end)
+        position += size
+
+
+def _mp4_info(f: typing.BinaryIO, file_size: int) -> dict:
+    tracks = []
+    def walk(start: int, end: int, track: dict):
+        for kind, payload, payload_end in _mp4_atoms(f, start, end):
+            if kind == b"trak":
+                track = {}; tracks.append(track); walk(payload, payload_end, track)
+            elif kind in MP4_CONTAINER_ATOMS: walk(payload, payload_end, track)
+            elif kind == b"mdhd":
+                f.seek(payload); body = f.read(32)
+                if body[0] == 1: track["timescale"], track["duration"] = struct.unpack(">IQ", body[20:32]) # Version 1: 64-bit times
+                else: track["timescale"], track["duration"] = struct.unpack(">II", body[12:20])
+            elif kind == b"hdlr":
+                f.seek(payload + 8); track["handler"] = f.read(4)
+            elif kind == b"stsd":
+                f.seek(payload + 8); entry = f.read(36) # First sample entry: AudioSampleEntry fields follow its 16-byte header
+                if len(entry) >= 36: track["channels"] = struct.unpack(">H", entry[24:26])[0]; track["rate"] = struct.unpack(">I", entry[32:36])[0] >> 16
+    walk(0, file_size, {})
+    for track in tracks:
+        if track.get("handler") == b"soun" and track.get("timescale"):
+            return _info(track["duration"] / track["timescale"], track.get("channels") or 2, track.get("rate") or track["timescale"], "mp4")
+    raise ValueError("no audio track in the MP4 container")
+
+
+def read_audio_info(path: str) -> dict:
+    """
+    Reads {'duration' (seconds), 'channels', 'rate', 'format'} from the file's headers.
+    The container is recognized from its signature, not the extension. Raises ValueError
+    (unrecognized or damaged header) or OSError.
+    """
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        head = f.read(12)
+        try:
+            if head[:4] in (b"RIFF", b"RF64") and head[8:12] == b"WAVE": f.seek(0); return _wav_info(f, file_size)
+            if head[:4] == b"OggS": return _ogg_info(f, file_size)
+            if head[4:8] == b"ftyp": return _mp4_info(f, file_size)
+            start = _skip_id3v2(f) # FLAC and MP3 files may both start with an ID3 tag
+            f.seek(start)
+            if f.read(4) == b"fLaC": return _flac_info(f, start)
+            if path.lower().endswith((".mp3", ".mp2", ".mpga")) or head[:3] == b"ID3": return _mp3_info(f, file_size)
+        except (ValueError, struct.error, IndexError) as e:
+            header_error = e
+        else: header_error = None
+    try: # Other libsndfile formats (AIFF, CAF, ...) or headers the parsers above do not handle
+        info = soundfile.info(path)
+        return _info(info.duration, info.channels, info.samplerate, info.format.lower())
+    except RuntimeError as e: # LibsndfileError is a RuntimeError
+        raise ValueError(str(header_error or e)) from None
+
+
+class AudioMetadataCache:
+    """Header metadata of audio files keyed by (absolute path, mtime, size); failures are cached too."""
+
+    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES):
+        self._entries: 'OrderedDict[tuple, typing.Union[dict, ValueError]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str) -> dict:
+        """Metadata of the file (a copy). Raises ValueError for unreadable audio and OSError for missing files."""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None: self._entries.move_to_end(key); self.hits += 1
+        if entry is None:
+            try: entry = read_audio_info(path)
+            except ValueError as e:
+                print(f"AudioMetadata Warning: cannot read the header of {os.path.basename(path)} - {e}", file=sys.__stderr__)
+                entry = e
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries: self._entries.popitem(last=False)
+        if isinstance(entry, ValueError): raise ValueError(str(entry))
+        return dict(entry)
+
+    def clear(self):
+        with self._lock: self._entries.clear()
+
+# Process-wide instance shared by the GUI, the batch queue and the transcriber
+audio_metadata = AudioMetadataCache()
+
+# --- END OF FILE audio_metadata.py ---
@@ -0,0 +1,390 @@
+# --- START OF FILE audioscript.py ---
+"""
+Headless command-line entry point (no tkinter).
+
+    python -m audioscript transcribe meeting.wav "recordings/**/*.mp3" -m small -l italian -o out/ -w 2
+    python -m audioscript serve --preload large
+    python -m audioscript transcribe meeting.wav --daemon http://127.0.0.1:8765
+    python -m audioscript calibrate -m small
+    python -m audioscript benchmark -m tiny base --seconds 120 -o bench.json
+    python -m audioscript search "quarterly budget"
+    python -m audioscript models install large --dir D:/whisper-models
+
+Logs go to stderr; one JSON line with timings per file goes to stdout. With --daemon the
+engine (torch, Whisper, models) lives in the daemon and is not imported here.
+"""
+
+import argparse
+import glob
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import typing
+
+from utils import transcription_output_path, AUDIO_EXTENSIONS
+from translations import translations_dict
+from daemon_client import DaemonClient, DaemonUnavailable, DaemonError, DEFAULT_DAEMON_URL
+
+if typing.TYPE_CHECKING:
+    from transcriber import AudioTranscriber
+
+MODELS = ["tiny", "base", "small", "medium", "large"]
+PRECISIONS = ["fp32", "int8"] # Same values as quantization.PRECISIONS (not imported: it pulls in torch)
+PRESETS = ["fast", "balanced", "accurate"] # decode_presets.DECODE_PRESET_NAMES
+
+
+def detect_system_type() -> str:
+    """Same platform tag the GUI passes to AudioTranscriber.get_device."""
+    if sys.platform == "darwin": return "mac"
+    if sys.platform == "win32": return "windows"
+    return "linux"
+
+
+class ConsoleHost:
+    """
+    Stands in for the GUI app for a headless AudioTranscriber: translated console output
+    goes to stderr (prefixed per worker), errors are captured for the JSON report.
+    """
+
+    def __init__(self, worker_index: int = 0, quiet: bool = False, ui_language: str = "English"):
+        self.worker_index = worker_index
+        self.quiet = quiet
+        self.translations = translations_dict.get(ui_language, translations_dict["English"])
+        self.last_error: typing.Optional[str] = None
+        self._print_lock = threading.Lock()
+
+    def translate(self, key):
+        return self.translations.get(key, translations_dict["English"].get(key, f"<{key}>"))
+
+    def _print(self, message):
+        if self.quiet or not message.strip(): return
+        with self._print_lock:
+            print(f"[{self.worker_index + 1}] {message.strip()}", file=sys.stderr, flush=True)
+
+    def _show_error(self, error_key, **kwargs):
+        self.last_error = self.translate(error_key).format(**kwargs)
+
+    # GUI hooks that have no meaning without a window
+    def _update_progress(self, *args, **kwargs): pass
+    def _finalize_ui(self, *args, **kwargs): pass
+    def _show_info(self, *args, **kwargs): pass
+    def _set_progress_value(self, percent): pass
+    def result_text_set(self, text): pass
+    def result_text_append(self, text): pass
+
+
+def expand_inputs(patterns: list[str], roots: typing.Optional[dict] = None) -> list[str]:
+    """
+    Expands files, globs (** allowed) and directories (audio files inside, recursively) without duplicates.
+    'roots', if given, receives the directory argument each file was found under.
+    """
+    files: list[str] = []; seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or ([pattern] if os.path.exists(pattern) else [])
+        if not matches: print(f"Warning: no files match '{pattern}'", file=sys.stderr)
+        for match in matches:
+            if os.path.isdir(match):
+                candidates = []
+                for root, dirs, names in os.walk(match):
+                    dirs.sort()
+                    candidates.extend(os.path.join(root, name) for name in sorted(names) if name.lower().endswith(AUDIO_EXTENSIONS))
+            else: candidates = [match]
+            for path in candidates:
+                path = os.path.abspath(path)
+                if path not in seen:
+                    seen.add(path); files.append(path)
+                    if roots is not None and os.path.isdir(match): roots[path] = os.path.abspath(match)
+    return files
+
+
+def output_paths_for(files: list[str], output_dir: str, roots: typing.Optional[dict] = None) -> dict[str, str]:
+    """
+    Transcript path for every input (utils.transcription_output_path, same naming as the Batch tab).
+    Inputs that would share a file (a.wav and a.flac) get a numeric suffix and a warning.
+    """
+    claimed: dict = {}; outputs = {}
+    for input_file in files:
+        outputs[input_file], other_file = transcription_output_path(input_file, output_dir, (roots or {}).get(input_file, ""), claimed)
+        if other_file: print(f"Warning: {other_file} and {input_file} have the same name, writing {outputs[input_file]}", file=sys.stderr)
+    return outputs
+
+
+def _transcribe_one(transcriber: typing.Union['AudioTranscriber', DaemonClient], host: ConsoleHost, input_file: str, output_file: str,
+                    args, options: dict) -> dict:
+    host.last_error = None
+    start = time.time()
+    if isinstance(transcriber, DaemonClient):
+        try:
+            done = transcriber.transcribe(input_file, args.model, args.language, args.gpu, options,
+                                          on_event=lambda event: host._print(event["message"]) if event.get("event") == "print" else None)
+        except (DaemonUnavailable, DaemonError) as e:
+            done = {"text": str(e), "success": False, "interrupted": False}
+        text, success, interrupted, run = done.get("text", ""), bool(done.get("success")), bool(done.get("interrupted")), done.get("run", {})
+    else:
+        text, success, interrupted = transcriber.transcribe_audio(input_file, args.model, args.language, args.gpu, detect_system_type(), **options)
+        run = transcriber.last_run
+    elapsed = time.time() - start
+    report = {"file": input_file, "status": "done" if success and not interrupted else ("interrupted" if interrupted else "error"),
+              "output": None, "model": args.model, "duration": round(run.get("duration", 0.0), 3),
+              "elapsed": round(elapsed, 3), "load_time": round(run.get("load_time", 0.0), 3),
+              "transcribe_time": round(run.get("transcribe_time", 0.0), 3), "cached": run.get("cached", False),
+              "segments": run.get("segments", 0),
+              "rtf": round(elapsed / run["duration"], 4) if run.get("duration") else None,
+              "worker": host.worker_index}
+    if success and not interrupted:
+        try:
+            os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+            with open(output_file, "w", encoding="utf-8") as f: f.write(text)
+            report["output"] = output_file
+        except OSError as e:
+            report.update(status="error", error=f"Could not write {output_file}: {e}")
+    elif not interrupted:
+        report["error"] = host.last_error or text
+    return report
+
+
+def cmd_transcribe(args) -> int:
+    roots: dict = {}; files = expand_inputs(args.inputs, roots)
+    if not files: print("Error: no input files.", file=sys.stderr); return 2
+    output_files = output_paths_for(files, args.output_dir, roots)
+    options = {"parallel_workers": args.parallel, "skip_silence": not args.no_vad, "use_cache": not args.no_cache, "precision": args.precision,
+               "threads": args.threads, "preset": args.preset, "draft_model": args.draft}
+    workers = max(1, min(args.workers, len(files)))
+    pending: 'queue.Queue[str]' = queue.Queue()
+    for path in files: pending.put(path)
+    transcribers: list = []
+    if args.daemon:
+        try: DaemonClient(args.daemon).status()
+        except DaemonUnavailable as e: print(f"Error: daemon not reachable - {e}", file=sys.stderr); return 2
+    else:
+        from transcriber import AudioTranscriber # Imported here so --daemon runs stay light
+        _configure_model_store(args)
+    output_lock = threading.Lock(); failures = 0
+
+    stop_event = threading.Event()
+    def worker_loop(transcriber, host: ConsoleHost):
+        nonlocal failures
+        while not stop_event.is_set():
+            try: input_file = pending.get_nowait()
+            except queue.Empty: return
+            report = _transcribe_one(transcriber, host, input_file, output_files[input_file], args, options)
+            with output_lock:
+                if report["status"] != "done": failures += 1
+                emit(report)
+
+    # Library code logs with print(); keep stdout for the JSON report lines only
+    report_stream = sys.stdout; sys.stdout = sys.stderr
+    def emit(report: dict):
+        print(json.dumps(report, ensure_ascii=False), file=report_stream, flush=True)
+
+    threads = []; start = time.time()
+    try:
+        for index in range(workers):
+            host = ConsoleHost(index, quiet=args.quiet)
+            if args.daemon: transcriber = DaemonClient(args.daemon) # The daemon shares one model instance between jobs
+            else:
+                transcriber = AudioTranscriber(host)
+                transcriber.model_replica = index # Each worker decodes on its own model instance
+                transcriber.concurrent_jobs = workers
+            transcribers.append(transcriber)
+            thread = threading.Thread(target=worker_loop, args=(transcriber, host), name=f"CLIWorker-{index + 1}", daemon=True)
+            threads.append(thread); thread.start()
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads: thread.join(timeout=0.2)
+    except KeyboardInterrupt:
+        print("Interrupted, stopping after the current decoding step...", file=sys.stderr)
+        stop_event.set()
+        for transcriber in transcribers:
+            if not isinstance(transcriber, DaemonClient): transcriber.request_stop() # Daemon jobs stop when the connection closes
+        for thread in threads: thread.join()
+        return 130
+    finally:
+        sys.stdout = report_stream
+    if not args.quiet: print(f"Done: {len(files) - failures}/{len(files)} files in {time.time() - start:.1f}s.", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def _configure_model_store(args):
+    from model_store import model_store
+    model_store.configure(args.model_dir, args.offline or None)
+
+
+def cmd_serve(args) -> int:
+    from daemon import serve
+    _configure_model_store(args)
+    serve(args.host, args.port, preload=args.preload, use_gpu=args.gpu, precision=args.precision,
+          idle_unload_minutes=args.idle_unload, memory_limit_mb=args.memory_limit)
+    return 0
+
+
+def cmd_compare_precision(args) -> int:
+    from audio_loader import load_audio, SAMPLE_RATE
+    from quantization import compare_precisions
+    audio = load_audio(args.input)[:int(args.seconds * SAMPLE_RATE)]
+    report = compare_precisions(audio, args.model, args.language, log=lambda message: print(message.strip(), file=sys.stderr))
+    report["file"] = os.path.abspath(args.input)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+def cmd_calibrate(args) -> int:
+    from transcriber import AudioTranscriber
+    from model_cache import model_cache
+    from thread_tuning import thread_profiles
+    transcriber = AudioTranscriber(ConsoleHost())
+    model = transcriber._get_model(args.model, "cpu", args.precision)
+    with model_cache.inference_lock(args.model, "cpu", args.precision):
+        profile = thread_profiles.calibrate(args.model, "cpu", args.precision, lambda: transcriber._warm_up(model),
+                                            log=lambda message: print(message.strip(), file=sys.stderr))
+    print(json.dumps({"model": args.model, "precision": args.precision, **(profile or {})}, ensure_ascii=False, indent=2))
+    return 0 if profile else 1
+
+
+def cmd_benchmark(args) -> int:
+    from benchmark import run_benchmark
+    report = run_benchmark(args.models, seconds=args.seconds, language=args.language, use_gpu=args.gpu, precision=args.precision,
+                           threads=args.threads, preset=args.preset, skip_silence=not args.no_vad, repeats=args.repeats, clips_dir=args.clips,
+                           isolate=not args.in_process)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f: f.write(output + "\n")
+        print(f"Benchmark report written to {args.output}", file=sys.stderr)
+    else: print(output)
+    return 1 if any("error" in result for result in report["results"]) else 0
+
+
+def cmd_search(args) -> int:
+    from transcript_archive import transcript_archive
+    start = time.perf_counter()
+    results = transcript_archive.search(args.query, limit=args.limit)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for result in results:
+        print(json.dumps({key: result[key] for key in ("file", "path", "model", "language", "start", "end", "text")}, ensure_ascii=False))
+    stats = transcript_archive.stats()
+    print(f"{len(results)} matching segments in {elapsed_ms:.1f} ms ({stats['transcripts']} transcripts, {stats['segments']} segments archived).", file=sys.stderr)
+    return 0 if results else 1
+
+
+def cmd_models(args) -> int:
+    from model_store import model_store, ModelStoreError
+    _configure_model_store(args)
+    log = lambda message: print(message.strip(), file=sys.stderr)
+    if args.action in ("install", "import", "remove") and not args.names:
+        print(f"Error: 'models {args.action}' needs at least one model name.", file=sys.stderr); return 2
+    if args.action == "import" and (len(args.names) != 1 or not args.file):
+        print("Error: 'models import' takes one model name and --file.", file=sys.stderr); return 2
+    failures = 0
+    try:
+        if args.action == "list":
+            for manifest in model_store.installed():
+                print(json.dumps({"name": manifest["name"], "size_mb": round(manifest["size"] / 2**20, 1), "sha256": manifest["sha256"],
+                                  "source_sha256": manifest["source_sha256"]}, ensure_ascii=False))
+        elif args.action == "install":
+            for name in args.names: model_store.ensure(name, log=log)
+        elif args.action == "import": model_store.install(args.names[0], source=args.file, log=log)
+        elif args.action == "verify":
+            for name in args.names or [manifest["name"] for manifest in model_store.installed()]:
+                ok = model_store.verify(name, full=True); failures += not ok
+                print(json.dumps({"name": name, "ok": ok}))
+        elif args.action == "remove":
+            for name in args.names: failures += not model_store.remove(name)
+    except ModelStoreError as e:
+        print(f"Error: {e}", file=sys.stderr); return 1
+    return 1 if failures else 0
+
+
+def _add_model_store_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--model-dir", default="", metavar="DIR", help="Model store folder (default: ./models).")
+    parser.add_argument("--offline", action="store_true", help="Never download models; use only the model store.")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="audioscript", description="AudioScript headless tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    transcribe = subparsers.add_parser("transcribe", help="Transcribe audio files without the GUI.")
+    transcribe.add_argument("inputs", nargs="+", help="Audio files, directories or glob patterns (quote them to use **).")
+    transcribe.add_argument("-m", "--model", default="large", choices=MODELS, help="Whisper model (default: large).")
+    transcribe.add_argument("-l", "--language", default="italian", help="Whisper language name or code (default: italian).")
+    transcribe.add_argument("-o", "--output-dir", default="", help="Output folder (default: next to each audio file).")
+    transcribe.add_argument("-w", "--workers", type=int, default=1, help="Files transcribed at the same time (default: 1).")
+    transcribe.add_argument("--parallel", type=int, default=1, help="Worker processes per long file on CPU (default: 1 = off).")
+    transcribe.add_argument("--gpu", action="store_true", help="Use GPU acceleration if available.")
+    transcribe.add_argument("--precision", default="fp32", choices=PRECISIONS, help="int8 = dynamic quantization, CPU only (default: fp32).")
+    transcribe.add_argument("--threads", type=int, default=0, help="Torch CPU threads per job (default: 0 = calibrated value).")
+    transcribe.add_argument("--preset", default="balanced", choices=PRESETS, help="Decode preset: fast = greedy, no fallback; accurate = beam search (default: balanced).")
+    transcribe.add_argument("--draft", default="", choices=["", "tiny", "base"], metavar="MODEL",
+                            help="Draft with tiny/base first, then re-decode only low-confidence segments with --model.")
+    transcribe.add_argument("--no-vad", action="store_true", help="Decode silent regions too.")
+    transcribe.add_argument("--no-cache", action="store_true", help="Ignore cached results and transcribe again.")
+    transcribe.add_argument("--daemon", nargs="?", const=DEFAULT_DAEMON_URL, default="", metavar="URL",
+                            help=f"Send the jobs to a running daemon (default URL: {DEFAULT_DAEMON_URL}).")
+    transcribe.add_argument("-q", "--quiet", action="store_true", help="Only print the JSON report lines.")
+    _add_model_store_arguments(transcribe)
+    transcribe.set_defaults(func=cmd_transcribe)
+
+    serve = subparsers.add_parser("serve", help="Run the local transcription daemon with resident models.")
+    serve.add_argument("--host", default="127.0.0.1", help="Listen address (default: 127.0.0.1, local only).")
+    serve.add_argument("--port", type=int, default=8765, help="Listen port (default: 8765).")
+    serve.add_argument("--preload", nargs="*", default=[], choices=MODELS, metavar="MODEL", help="Models to load and warm at startup.")
+    serve.add_argument("--gpu", action="store_true", help="Preload on the GPU if available.")
+    serve.add_argument("--precision", default="fp32", choices=PRECISIONS, help="Precision of the preloaded models.")
+    serve.add_argument("--idle-unload", type=float, default=15, metavar="MINUTES", help="Unload models unused for this long (default: 15, 0 = never).")
+    serve.add_argument("--memory-limit", type=int, default=0, metavar="MB", help="RSS at which memory is freed and idle models unloaded (default: 85%% of RAM).")
+    _add_model_store_arguments(serve)
+    serve.set_defaults(func=cmd_serve)
+
+    compare = subparsers.add_parser("compare-precision", help="Measure int8 vs fp32 speed and word error rate on CPU.")
+    compare.add_argument("input", help="Audio file to test with.")
+    compare.add_argument("-m", "--model", default="large", choices=MODELS, help="Whisper model (default: large).")
+    compare.add_argument("-l", "--language", default="italian", help="Whisper language name or code (default: italian).")
+    compare.add_argument("--seconds", type=float, default=120, help="Audio to use from the start of the file (default: 120).")
+    compare.set_defaults(func=cmd_compare_precision)
+
+    calibrate = subparsers.add_parser("calibrate", help="Measure and store the fastest CPU thread count for a model.")
+    calibrate.add_argument("-m", "--model", default="large", choices=MODELS, help="Whisper model (default: large).")
+    calibrate.add_argument("--precision", default="fp32", choices=PRECISIONS, help="Model precision to calibrate (default: fp32).")
+    calibrate.set_defaults(func=cmd_calibrate)
+
+    bench = subparsers.add_parser("benchmark", help="Offline speed benchmark on generated audio, JSON report.")
+    bench.add_argument("-m", "--models", nargs="+", default=["tiny", "base"], choices=MODELS, metavar="MODEL", help="Models to measure (default: tiny base).")
+    bench.add_argument("--seconds", type=float, default=60, help="Length of the generated audio (default: 60).")
+    bench.add_argument("-l", "--language", default="en", help="Decoding language (default: en).")
+    bench.add_argument("--gpu", action="store_true", help="Use GPU acceleration if available.")
+    bench.add_argument("--precision", default="fp32", choices=PRECISIONS, help="Model precision (default: fp32).")
+    bench.add_argument("--threads", type=int, default=0, help="Torch CPU threads (default: 0 = calibrated value).")
+    bench.add_argument("--preset", default="balanced", choices=PRESETS, help="Decode preset (default: balanced).")
+    bench.add_argument("--no-vad", action="store_true", help="Decode silent regions too.")
+    bench.add_argument("--repeats", type=int, default=1, help="Transcriptions per model; the report gives the median (default: 1).")
+    bench.add_argument("--clips", default="", metavar="DIR", help="Folder of WAV speech clips to mix into the generated audio.")
+    bench.add_argument("--in-process", action="store_true", help="Run all models in this process (warm loads, shared peak RSS).")
+    bench.add_argument("-o", "--output", default="", help="Write the JSON report to this file instead of stdout.")
+    bench.set_defaults(func=cmd_benchmark)
+
+    search = subparsers.add_parser("search", help="Search the archived transcripts (one JSON line per matching segment).")
+    search.add_argument("query", help='Words to find (the last one as a prefix); "quoted words" match a phrase.')
+    search.add_argument("-n", "--limit", type=int, default=50, help="Maximum number of segments (default: 50).")
+    search.set_defaults(func=cmd_search)
+
+    models = subparsers.add_parser("models", help="Manage the local model store (converted, checksummed, memory-mapped models).")
+    models.add_argument("action", choices=["list", "install", "import", "verify", "remove"],
+                        help="install: convert (downloading if needed); import: convert --file; verify: full SHA-256 check.")
+    models.add_argument("names", nargs="*", metavar="MODEL", help="Model names (verify: default all installed).")
+    models.add_argument("--file", default="", help="Whisper checkpoint (.pt) to import.")
+    models.add_argument("--dir", dest="model_dir", default="", metavar="DIR", help="Model store folder (default: ./models).")
+    models.add_argument("--offline", action="store_true", help="Never download; install only from Whisper's download cache.")
+    models.set_defaults(func=cmd_models)
+    return parser
+
+
+def main(argv: typing.Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# --- END OF FILE audioscript.py ---
@@ -0,0 +1,212 @@
+# --- START OF FILE batch_tab.py ---
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import os
+import sys
+import typing
+
+from job_queue import JobQueue, AUDIO_EXTENSIONS
+from utils import format_duration
+
+if typing.TYPE_CHECKING:
+    from gui import ModernTranscriptionApp
+
+class BatchTab:
+    """GUI Tab for the batch transcription job queue."""
+    REFRESH_INTERVAL = 1000 # ms
+    COLUMNS = ("file", "status", "progress", "duration", "elapsed")
+
+    def __init__(self, parent_notebook: ttk.Notebook, gui_app: 'ModernTranscriptionApp', job_queue: JobQueue):
+        self.parent_notebook = parent_notebook
+        self.gui_app = gui_app
+        self.job_queue = job_queue
+
+        self.frame = ttk.Frame(parent_notebook, padding="10")
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(2, weight=1) # Job list expands
+
+        # --- Variables ---
+        self.workers_var = tk.IntVar(value=self.gui_app.loaded_config.get("batch_workers", job_queue.workers))
+        self.output_dir_var = tk.StringVar(value=self.gui_app.loaded_config.get("batch_output_dir", ""))
+        self.summary_var = tk.StringVar(value="")
+        self._refresh_id = None
+
+        self._create_widgets()
+        self._refresh()
+
+    def _create_widgets(self):
+        # --- Queue Controls ---
+        controls_frame = ttk.Frame(self.frame)
+        controls_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        self.add_files_button = ttk.Button(controls_frame, text="", command=self._add_files, style="Action.TButton") # TEXT REMOVED
+        self.add_files_button.pack(side=tk.LEFT, padx=5)
+        self.add_folder_button = ttk.Button(controls_frame, text="", command=self._add_folder, style="Action.TButton") # TEXT REMOVED
+        self.add_folder_button.pack(side=tk.LEFT, padx=5)
+        self.start_button = ttk.Button(controls_frame, text="", command=self._start, style="Primary.TButton") # TEXT REMOVED
+        self.start_button.pack(side=tk.LEFT, padx=5)
+        self.stop_button = ttk.Button(controls_frame, text="", command=self._stop, style="Action.TButton", state=tk.DISABLED) # TEXT REMOVED
+        self.stop_button.pack(side=tk.LEFT, padx=5)
+        self.retry_button = ttk.Button(controls_frame, text="", command=self._retry_failed, style="Action.TButton") # TEXT REMOVED
+        self.retry_button.pack(side=tk.RIGHT, padx=5)
+        self.clear_button = ttk.Button(controls_frame, text="", command=self._clear_finished, style="Action.TButton") # TEXT REMOVED
+        self.clear_button.pack(side=tk.RIGHT, padx=5)
+
+        # --- Options ---
+        self.options_frame = ttk.LabelFrame(self.frame, text="", padding=10) # TEXT REMOVED
+        self.options_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
+        self.options_frame.columnconfigure(3, weight=1)
+        self.workers_label = ttk.Label(self.options_frame, text="") # TEXT REMOVED
+        self.workers_label.grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.workers_spinbox = ttk.Spinbox(self.options_frame, from_=1, to=max(1, os.cpu_count() or 1), textvariable=self.workers_var, width=5, state="readonly")
+        self.workers_spinbox.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
+        self.output_dir_label = ttk.Label(self.options_frame, text="") # TEXT REMOVED
+        self.output_dir_label.grid(row=0, column=2, sticky=tk.W, padx=(20, 5), pady=5)
+        self.output_dir_entry = ttk.Entry(self.options_frame, textvariable=self.output_dir_var)
+        self.output_dir_entry.grid(row=0, column=3, sticky="ew", padx=5, pady=5)
+        self.output_dir_button = ttk.Button(self.options_frame, text="", command=self._select_output_dir, style="Action.TButton") # TEXT REMOVED
+        self.output_dir_button.grid(row=0, column=4, sticky="e", padx=5, pady=5)
+
+        # --- Job List ---
+        list_frame = ttk.Frame(self.frame, borderwidth=1, relief="sunken")
+        list_frame.grid(row=2, column=0, sticky="nsew")
+        list_frame.rowconfigure(0, weight=1); list_frame.columnconfigure(0, weight=1)
+        self.job_tree = ttk.Treeview(list_frame, columns=self.COLUMNS, show="headings", selectmode="browse")
+        for column, width, anchor in zip(self.COLUMNS, (380, 90, 70, 80, 80), (tk.W, tk.W, tk.E, tk.E, tk.E)):
+            self.job_tree.column(column, width=width, anchor=anchor, stretch=(column == "file"))
+        self.job_tree.grid(row=0, column=0, sticky="nsew")
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.job_tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.job_tree.configure(yscrollcommand=scrollbar.set)
+
+        # --- Summary (counts, throughput, ETA) ---
+        self.summary_label = ttk.Label(self.frame, textvariable=self.summary_var, anchor="w")
+        self.summary_label.grid(row=3, column=0, sticky="ew", pady=(5, 0))
+
+    def update_ui_text(self):
+        """Updates widget text based on GUI language."""
+        if not self.frame.winfo_exists(): return
+        try:
+            self.add_files_button.config(text=self.gui_app.translate("batch_add_files_button"))
+            self.add_folder_button.config(text=self.gui_app.translate("batch_add_folder_button"))
+            self.start_button.config(text=self.gui_app.translate("batch_start_button"))
+            self.stop_button.config(text=self.gui_app.translate("batch_stop_button"))
+            self.retry_button.config(text=self.gui_app.translate("batch_retry_button"))
+            self.clear_button.config(text=self.gui_app.translate("batch_clear_button"))
+            self.options_frame.config(text=self.gui_app.translate("batch_options_frame"))
+            self.workers_label.config(text=self.gui_app.translate("batch_workers_label"))
+            self.output_dir_label.config(text=self.gui_app.translate("batch_output_dir_label"))
+            self.output_dir_button.config(text=self.gui_app.translate("browse_button"))
+            for column in self.COLUMNS:
+                self.job_tree.heading(column, text=self.gui_app.translate(f"batch_column_{column}"))
+            self._refresh_jobs()
+        except tk.TclError as e:
+            print(f"Batch Tab: TclError during update_ui_text: {e}", file=sys.__stderr__)
+        except Exception as e:
+            import traceback
+            print(f"Batch Tab: Unexpected error during update_ui_text: {e}\n{traceback.format_exc()}", file=sys.__stderr__)
+
+    def _current_options(self) -> dict:
+        """Transcription options shared with the Transcription tab."""
+        return {
+            "model_type": self.gui_app.model_var.get(),
+            "language": self.gui_app.get_language_code(self.gui_app.transcription_language_var.get()),
+            "use_gpu": self.gui_app.use_gpu_var.get(),
+            "system_type": self.gui_app.system_type,
+            "output_dir": self.output_dir_var.get().strip(),
+            "options": self.gui_app.get_transcription_options(),
+        }
+
+    def _add_files(self):
+        extensions = " ".join(f"*{ext}" for ext in AUDIO_EXTENSIONS)
+        files = filedialog.askopenfilenames(
+            title=self.gui_app.translate("batch_add_files_button"),
+            filetypes=[(self.gui_app.translate("audio_files_label"), extensions), (self.gui_app.translate("all_files_label"), "*.*")],
+            parent=self.frame
+        )
+        if files:
+            added = self.job_queue.add_files(files, **self._current_options())
+            self.gui_app._print(self.gui_app.translate("batch_jobs_added_info").format(count=added) + "\n")
+            self._refresh_jobs()
+
+    def _add_folder(self):
+        folder = filedialog.askdirectory(title=self.gui_app.translate("batch_add_folder_button"), parent=self.frame)
+        if folder:
+            added = self.job_queue.add_folder(folder, **self._current_options())
+            self.gui_app._print(self.gui_app.translate("batch_jobs_added_info").format(count=added) + "\n")
+            self._refresh_jobs()
+
+    def _select_output_dir(self):
+        folder = filedialog.askdirectory(title=self.gui_app.translate("batch_output_dir_label"), parent=self.frame)
+        if folder: self.output_dir_var.set(folder)
+
+    def _start(self):
+        if not self.job_queue.count("pending"):
+            messagebox.showwarning(self.gui_app.translate("warning_title"), self.gui_app.translate("batch_warning_no_jobs"), parent=self.frame)
+            return
+        try: workers = int(self.workers_var.get())
+        except (tk.TclError, ValueError): workers = 1
+        self.job_queue.start(workers)
+        self._refresh()
+
+    def _stop(self):
+        self.job_queue.stop()
+        self.gui_app._print(self.gui_app.translate("batch_stop_requested_info") + "\n")
+
+    def _clear_finished(self):
+        self.job_queue.clear_finished(); self._refresh_jobs()
+
+    def _retry_failed(self):
+        self.job_queue.retry_failed(); self._refresh_jobs()
+
+    def resume_if_needed(self):
+        """Resumes processing if the previous session was closed while the queue was running."""
+        if self.job_queue.resume_on_start and self.job_queue.count("pending"):
+            self.gui_app._print(self.gui_app.translate("batch_resuming_info").format(count=self.job_queue.count("pending")) + "\n")
+            self.job_queue.start(self.job_queue.workers)
+
+    def _refresh(self):
+        """Periodic refresh of the job list and summary while the tab exists."""
+        self._refresh_id = None
+        try:
+            if not self.frame.winfo_exists(): return
+            self._refresh_jobs()
+            running = self.job_queue.is_running()
+            self.start_button.config(state=tk.DISABLED if running else tk.NORMAL)
+            self.stop_button.config(state=tk.NORMAL if running else tk.DISABLED)
+            self._refresh_id = self.frame.after(self.REFRESH_INTERVAL, self._refresh)
+        except tk.TclError:
+            print("Batch Tab: TclError during refresh (widget destroyed?)", file=sys.__stderr__)
+
+    def _refresh_jobs(self):
+        jobs = self.job_queue.snapshot()
+        existing = set(self.job_tree.get_children())
+        current = set()
+        for job in jobs:
+            values = (
+                job["file"],
+                self.gui_app.translate(f"batch_status_{job['status']}"),
+                f"{job.get('progress', 0.0):.0f}%",
+                format_duration(job["duration"]) if job.get("duration") else "-",
+                format_duration(job["elapsed"]) if job.get("elapsed") else "-",
+            )
+            current.add(job["id"])
+            if job["id"] in existing: self.job_tree.item(job["id"], values=values)
+            else: self.job_tree.insert("", tk.END, iid=job["id"], values=values)
+        for stale in existing - current: self.job_tree.delete(stale)
+
+        stats = self.job_queue.stats()
+        eta = format_duration(stats["eta_seconds"]) if stats["eta_seconds"] is not None else "-"
+        self.summary_var.set(self.gui_app.translate("batch_summary").format(
+            done=stats["done"], total=stats["total"], failed=stats["error"], running=stats["running"],
+            throughput=stats["throughput"], eta=eta))
+
+    def on_close(self):
+        """Stops workers; a queue that was running resumes on the next launch."""
+        print("Batch Tab closing.")
+        if self._refresh_id:
+            try: self.frame.after_cancel(self._refresh_id)
+            except (ValueError, tk.TclError): pass
+        if self.job_queue.is_running(): self.job_queue.stop(resume_on_restart=True)
+
+# --- END OF FILE batch_tab.py ---
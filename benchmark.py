@@ -0,0 +1,190 @@
+# --- START OF FILE benchmark.py ---
+"""
+Offline transcription benchmark.
+
+Builds a deterministic test file (tones, silence and synthetic speech-like syllables, plus
+any WAV clips passed with --clips) and runs each model through AudioTranscriber. Each model
+runs in a fresh process, so load time is a cold load and peak RSS belongs to that model alone.
+
+    python -m audioscript benchmark -m tiny base small --seconds 120 -o bench.json
+"""
+
+import os
+import sys
+import time
+import wave
+import glob
+import platform
+import subprocess
+import statistics
+import multiprocessing
+import concurrent.futures
+import typing
+
+import numpy as np
+
+SAMPLE_RATE = 16000 # Whisper's input rate (whisper.audio.SAMPLE_RATE, not imported to keep the parent light)
+BENCHMARK_SEED = 1234
+# Formants (F1, F2, F3 in Hz) of five vowels, for the synthetic syllables
+VOWEL_FORMANTS = [(730, 1090, 2440), (530, 1840, 2480), (270, 2290, 3010), (570, 840, 2410), (300, 870, 2240)]
+
+
+def _tone_block(rng: np.random.Generator, seconds: float) -> np.ndarray:
+    """A few steady sine tones and a sweep (music-like, no speech)."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    freqs = rng.choice([220.0, 330.0, 440.0, 660.0, 880.0], size=3, replace=False)
+    block = sum(0.1 * np.sin(2 * np.pi * f * t) for f in freqs)
+    sweep_rate = (2000.0 - 200.0) / seconds
+    block += 0.1 * np.sin(2 * np.pi * (200.0 * t + 0.5 * sweep_rate * t ** 2))
+    return block.astype(np.float32)
+
+
+def _syllable(rng: np.random.Generator, seconds: float, f0: float) -> np.ndarray:
+    """One voiced syllable: harmonics of a wavering pitch shaped by a vowel's formants, with an attack/decay envelope."""
+    n = int(seconds * SAMPLE_RATE); t = np.arange(n) / SAMPLE_RATE
+    pitch = f0 * (1.0 + 0.03 * np.sin(2 * np.pi * 5.0 * t) - 0.1 * t / max(seconds, 1e-3)) # Vibrato and falling intonation
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    formants = VOWEL_FORMANTS[rng.integers(len(VOWEL_FORMANTS))]
+    signal = np.zeros(n)
+    for k in range(1, int(4000 // f0) + 1):
+        gain = sum(1.0 / (1.0 + ((k * f0 - formant) / (80.0 + 0.05 * formant)) ** 2) for formant in formants) / k ** 0.5
+        signal += gain * np.sin(k * phase)
+    envelope = np.minimum(1.0, t / 0.03) * np.minimum(1.0, (seconds - t) / 0.06)
+    return (0.15 * signal * envelope / max(np.abs(signal).max(), 1e-6)).astype(np.float32)
+
+
+def _speech_like_block(rng: np.random.Generator, seconds: float) -> np.ndarray:
+    """Syllables with fricative bursts and short pauses, at a talking rate of ~4 syllables/s."""
+    parts = []; total = 0; target = int(seconds * SAMPLE_RATE)
+    f0 = rng.uniform(100.0, 220.0) # One "speaker" per block
+    while total < target:
+        if rng.random() < 0.3: # Fricative (s/f-like): differentiated noise
+            noise = np.diff(rng.standard_normal(int(rng.uniform(0.05, 0.12) * SAMPLE_RATE) + 1))
+            parts.append((0.03 * noise).astype(np.float32))
+        parts.append(_syllable(rng, rng.uniform(0.12, 0.3), f0 * rng.uniform(0.9, 1.1)))
+        if rng.random() < 0.15: parts.append(np.zeros(int(rng.uniform(0.2, 0.5) * SAMPLE_RATE), dtype=np.float32)) # Pause between phrases
+        total = sum(len(part) for part in parts)
+    return np.concatenate(parts)[:target]
+
+
+def generate_benchmark_audio(seconds: float, seed: int = BENCHMARK_SEED, clips: typing.Optional[list[np.ndarray]] = None) -> np.ndarray:
+    """
+    Deterministic 16 kHz mono test signal: repeating blocks of tones, silence and speech-like
+    audio, with the given clips (real speech) interleaved. Same seed and clips give the same samples.
+    """
+    rng = np.random.default_rng(seed)
+    blocks = []; total = 0; target = int(seconds * SAMPLE_RATE); clip_index = 0
+    while total < target:
+        blocks.append(_tone_block(rng, 4.0))
+        blocks.append(np.zeros(int(3.0 * SAMPLE_RATE), dtype=np.float32))
+        if clips:
+            blocks.append(clips[clip_index % len(clips)].astype(np.float32)); clip_index += 1
+        blocks.append(_speech_like_block(rng, 15.0))
+        blocks.append((0.002 * rng.standard_normal(int(2.0 * SAMPLE_RATE))).astype(np.float32)) # Room-noise "silence"
+        total = sum(len(block) for block in blocks)
+    return np.clip(np.concatenate(blocks)[:target], -1.0, 1.0)
+
+
+def write_wav(path: str, audio: np.ndarray):
+    with wave.open(path, 'wb') as wf:
+        wf.setnchannels(1); wf.setsampwidth(2); wf.setframerate(SAMPLE_RATE)
+        wf.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+
+def _peak_rss_mb() -> typing.Optional[float]:
+    """Peak resident memory of this process (None where the resource module is missing, e.g. Windows)."""
+    try: import resource
+    except ImportError: return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 2**20 if sys.platform == "darwin" else peak / 2**10, 1) # Bytes on macOS, KiB on Linux
+
+
+def benchmark_model(model_type: str, audio_path: str, language: str = "en", use_gpu: bool = False, precision: str = "fp32",
+                    threads: int = 0, preset: str = "balanced", skip_silence: bool = True, repeats: int = 1) -> dict:
+    """Measures one model on the benchmark file (runs in the calling process). Returns the report entry."""
+    import whisper
+    from audioscript import ConsoleHost, detect_system_type
+    from transcriber import AudioTranscriber
+    from audio_loader import load_audio
+
+    host = ConsoleHost(quiet=True)
+    transcriber = AudioTranscriber(host)
+    transcriber.record_results = False # Synthetic audio: keep it out of the ETA history and the archive
+    device = transcriber.get_device(use_gpu, detect_system_type())
+    precision = transcriber._effective_precision(precision, device)
+    start = time.perf_counter(); model = transcriber._get_model(model_type, device, precision); load_time = time.perf_counter() - start
+    start = time.perf_counter(); audio = load_audio(audio_path); audio_decode_time = time.perf_counter() - start
+    duration = len(audio) / SAMPLE_RATE
+    tokenizer = whisper.tokenizer.get_tokenizer(model.is_multilingual, num_languages=model.num_languages, language=language, task="transcribe")
+
+    runs = []
+    for _ in range(max(1, repeats)):
+        text, success, _ = transcriber.transcribe_audio(audio_path, model_type, language, use_gpu, detect_system_type(),
+                                                        skip_silence=skip_silence, use_cache=False, precision=precision, threads=threads, preset=preset)
+        if not success: raise RuntimeError(host.last_error or text)
+        transcribe_time = transcriber.last_run["transcribe_time"]
+        tokens = len(tokenizer.encode(" " + text.strip())) if text.strip() else 0
+        runs.append({"transcribe_time": round(transcribe_time, 3), "rtf": round(transcribe_time / duration, 4),
+                     "tokens": tokens, "tokens_per_second": round(tokens / transcribe_time, 2) if transcribe_time else None,
+                     "segments": transcriber.last_run["segments"]})
+    return {"model": model_type, "device": str(device), "precision": precision, "preset": preset, "threads": transcriber.last_run.get("threads"),
+            "skip_silence": skip_silence, "load_time": round(load_time, 3), "audio_decode_time": round(audio_decode_time, 3),
+            "rtf": statistics.median(run["rtf"] for run in runs),
+            "tokens_per_second": statistics.median(run["tokens_per_second"] or 0.0 for run in runs),
+            "peak_rss_mb": _peak_rss_mb(), "runs": runs}
+
+
+def _git_commit() -> typing.Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError): return None
+
+
+def _environment() -> dict:
+    import torch, whisper
+    return {"commit": _git_commit(), "host": platform.node(), "platform": platform.platform(), "python": platform.python_version(),
+            "cpu_count": os.cpu_count(), "torch": torch.__version__, "whisper": getattr(whisper, "__version__", None),
+            "torch_threads": torch.get_num_threads(), "cuda": torch.cuda.is_available()}
+
+
+def run_benchmark(models: list[str], seconds: float = 60.0, language: str = "en", use_gpu: bool = False, precision: str = "fp32",
+                  threads: int = 0, preset: str = "balanced", skip_silence: bool = True, repeats: int = 1, clips_dir: str = "", work_dir: str = "",
+                  isolate: bool = True, log: typing.Optional[typing.Callable[[str], None]] = None) -> dict:
+    """
+    Generates the benchmark file and measures each model. With isolate=True every model runs
+    in its own spawned process (cold load, separate peak RSS); errors are reported per model.
+    """
+    log = log or (lambda message: print(message, file=sys.stderr))
+    clips = []
+    if clips_dir:
+        from audio_loader import load_audio
+        clips = [load_audio(path) for path in sorted(glob.glob(os.path.join(clips_dir, "*.wav")))]
+        log(f"Benchmark: {len(clips)} speech clips from {clips_dir}.")
+    work_dir = work_dir or os.path.join(os.path.abspath("."), "benchmark_audio")
+    os.makedirs(work_dir, exist_ok=True)
+    audio_path = os.path.join(work_dir, f"benchmark_{int(seconds)}s_seed{BENCHMARK_SEED}_{len(clips)}clips.wav")
+    write_wav(audio_path, generate_benchmark_audio(seconds, clips=clips))
+
+    report = {"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "environment": _environment(),
+              "audio": {"file": audio_path, "seconds": seconds, "seed": BENCHMARK_SEED, "clips": len(clips)},
+              "settings": {"language": language, "use_gpu": use_gpu, "precision": precision, "threads": threads, "preset": preset,
+                           "skip_silence": skip_silence, "repeats": repeats, "isolated": isolate},
+              "results": []}
+    arguments = dict(language=language, use_gpu=use_gpu, precision=precision, threads=threads, preset=preset, skip_silence=skip_silence, repeats=repeats)
+    for model_type in models:
+        log(f"Benchmark: {model_type}...")
+        try:
+            if isolate:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    result = pool.submit(benchmark_model, model_type, audio_path, **arguments).result()
+            else: result = benchmark_model(model_type, audio_path, **arguments)
+            log(f"Benchmark: {model_type} load {result['load_time']:.2f}s, RTF {result['rtf']:.3f}, "
+                f"{result['tokens_per_second']:.1f} tokens/s, peak RSS {result['peak_rss_mb']} MB.")
+        except Exception as e:
+            result = {"model": model_type, "error": f"{type(e).__name__}: {e}"}
+            log(f"Benchmark: {model_type} failed - {e}")
+        report["results"].append(result)
+    return report
+
+# --- END OF FILE benchmark.py ---
@@ -0,0 +1,121 @@
+# --- START OF FILE checkpoints.py ---
+
+import os
+import sys
+import json
+import time
+import typing
+
+CHECKPOINT_DIR = "transcription_checkpoints" # Created next to config.json
+CHECKPOINT_FORMAT_VERSION = 1 # Bump when the stored window format changes
+MAX_CHECKPOINT_AGE_DAYS = 30 # Older unfinished checkpoints are deleted when a new one is started
+
+
+class CheckpointWriter:
+    """Appends finished windows to one checkpoint file, flushed to disk after every window."""
+
+    def __init__(self, path: str, file: typing.TextIO):
+        self.path = path
+        self._file = file
+        self.windows = 0
+
+    def write_window(self, seek: int, segments: list[dict], previous_text: str):
+        """Records one decoded window: the audio offset after it, its segments and the prompt context for the next window."""
+        try:
+            self._file.write(json.dumps({"seek": seek, "segments": segments, "previous_text": previous_text}, ensure_ascii=False) + "\n")
+            self._file.flush(); os.fsync(self._file.fileno())
+            self.windows += 1
+        except (OSError, ValueError) as e: # ValueError: file already closed
+            print(f"Checkpoint Warning: could not write to {self.path} - {e}", file=sys.__stderr__)
+
+    def close(self):
+        try: self._file.close()
+        except OSError: pass
+
+
+class CheckpointStore:
+    """
+    Checkpoints of transcriptions in progress, so a crash, sleep or Stop does not lose the
+    windows already decoded.
+
+    One append-only JSON-lines file per job, keyed like the result cache (audio content plus
+    every option that changes the text), so only a re-run of the same audio with the same
+    settings resumes. The first line describes the job; each following line is one finished
+    window with the audio offset reached, its segments and the decoder's prompt context. A
+    crash can only cut the line being written: load() ignores it and a resumed run truncates
+    it away before appending. The file is deleted once the transcription completes.
+    """
+
+    def __init__(self, checkpoint_dir: str = CHECKPOINT_DIR):
+        self.checkpoint_dir = checkpoint_dir
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{key}.jsonl")
+
+    def load(self, key: str, total_samples: int) -> typing.Optional[dict]:
+        """
+        Returns {"seek", "segments", "previous_text", "windows", "valid_bytes"} from the last complete
+        window, or None if there is no usable checkpoint (missing, other format, or audio of another
+        length). valid_bytes is the length of the file up to the end of that window's line.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f: lines = f.read().split(b"\n")
+        except FileNotFoundError: return None
+        except OSError as e: print(f"Checkpoint Warning: could not read {path} - {e}", file=sys.__stderr__); return None
+        try: header = json.loads(lines[0])
+        except (ValueError, IndexError): header = {}
+        if header.get("version") != CHECKPOINT_FORMAT_VERSION or header.get("total_samples") != total_samples:
+            self.discard(key); return None
+        state = {"seek": 0, "segments": [], "previous_text": "", "windows": 0, "valid_bytes": len(lines[0]) + 1}
+        complete = lines[1:-1] # The last piece has no newline after it: empty, or a line cut off by a crash
+        for index, line in enumerate(complete):
+            try: window = json.loads(line)
+            except ValueError: # JSONDecodeError or invalid UTF-8
+                print(f"Checkpoint Warning: {path} has an unreadable record, keeping the {state['windows']} windows before it.", file=sys.__stderr__)
+                break
+            state["seek"] = int(window["seek"]); state["segments"].extend(window["segments"]); state["previous_text"] = window["previous_text"]
+            state["windows"] += 1; state["valid_bytes"] += len(line) + 1
+        if lines[-1].strip(): print(f"Checkpoint Warning: {path} ends with an incomplete record (interrupted write), ignoring it.", file=sys.__stderr__)
+        return state if state["windows"] else None
+
+    def open(self, key: str, total_samples: int, resume: typing.Optional[dict] = None, **metadata) -> typing.Optional[CheckpointWriter]:
+        """
+        Starts a new checkpoint, or appends to the existing one when resuming it (after cutting off
+        anything past the windows load() accepted). Returns None if it cannot be written.
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            if resume:
+                with open(path, 'r+b') as f: f.truncate(resume["valid_bytes"]) # A torn last line would swallow the next record
+                return CheckpointWriter(path, open(path, 'a', encoding='utf-8'))
+            self._prune()
+            f = open(path, 'w', encoding='utf-8')
+            f.write(json.dumps({"version": CHECKPOINT_FORMAT_VERSION, "created": time.time(), "total_samples": total_samples, **metadata}, ensure_ascii=False) + "\n")
+            f.flush()
+            return CheckpointWriter(path, f)
+        except OSError as e:
+            print(f"Checkpoint Warning: could not create {path} - {e}", file=sys.__stderr__)
+            return None
+
+    def discard(self, key: str):
+        try: os.remove(self._path(key))
+        except FileNotFoundError: pass
+        except OSError as e: print(f"Checkpoint Warning: could not delete {self._path(key)} - {e}", file=sys.__stderr__)
+
+    def _prune(self):
+        """Deletes checkpoints of jobs abandoned long ago."""
+        cutoff = time.time() - MAX_CHECKPOINT_AGE_DAYS * 86400
+        try: names = os.listdir(self.checkpoint_dir)
+        except OSError: return
+        for name in names:
+            path = os.path.join(self.checkpoint_dir, name)
+            try:
+                if name.endswith(".jsonl") and os.path.getmtime(path) < cutoff: os.remove(path)
+            except OSError: pass
+
+# Single store shared by every AudioTranscriber in the process
+checkpoint_store = CheckpointStore()
+
+# --- END OF FILE checkpoints.py ---
@@ -33,10 +33,30 @@ class ConfigManager:
             "transcription_model": "large",
             "transcription_language": "italiano",
             "transcription_use_gpu": False,
+            "transcription_parallel_workers": 1,
+            "transcription_skip_silence": True,
+            "transcription_bypass_cache": False,
+            "transcription_precision": "fp32",
+            "transcription_preset": "balanced", # Decode preset: fast, balanced or accurate (decode_presets.py)
+            "transcription_two_pass": False, # Quick draft with transcription_draft_model, then refine low-confidence segments
+            "transcription_draft_model": "tiny",
+            "transcription_threads": 0, # Torch CPU threads per job, 0 = calibrated automatically (thread_profiles.json)
+            "model_cache_budget_mb": 8192,
+            "model_idle_unload_minutes": 15, # Cached models unused this long are unloaded (0 = keep them loaded)
+            "memory_limit_mb": 0, # Process RSS that triggers freeing memory, 0 = 85% of physical RAM (resource_watchdog.py)
+            "model_store_dir": "models", # Converted Whisper models, memory-mapped at load (model_store.py)
+            "model_store_offline": False, # Never download: only models already in model_store_dir are used
+            "result_cache_budget_mb": 200,
+            "transcription_daemon_url": "", # e.g. http://127.0.0.1:8765 to use "python -m audioscript serve"
+            "transcription_preload_model": True,
             "llm_provider": None,
             "llm_model": None,
             "llm_api_key_obfuscated": "",
-            "custom_llm_templates": {} # **** ADDED Default for custom templates ****
+            "custom_llm_templates": {}, # **** ADDED Default for custom templates ****
+            "batch_workers": 1,
+            "batch_output_dir": "", # Empty = next to each audio file
+            "live_transcription": False, # Transcribe in the Recorder tab while recording
+            "live_latency_seconds": 2.0 # Target delay of live text (live_transcriber.py)
         }
         try:
             if os.path.exists(CONFIG_FILE):
@@ -79,7 +99,9 @@ class ConfigManager:
 
             print(f"  - Saving LLM: Provider={save_data.get('llm_provider')}, Model={save_data.get('llm_model')}, Key Saved={'Yes' if api_key else 'No'}")
             print(f"  - Saving Transcription: Model={save_data.get('transcription_model')}, Lang={save_data.get('transcription_language')}, GPU={save_data.get('transcription_use_gpu')}")
+            print(f"  - Saving Model Cache Budget: {save_data.get('model_cache_budget_mb')} MB, Result Cache Budget: {save_data.get('result_cache_budget_mb')} MB")
             print(f"  - Saving UI Language: {save_data.get('ui_language')}")
+            print(f"  - Saving Batch: Workers={save_data.get('batch_workers')}, Output Dir={save_data.get('batch_output_dir') or '(next to audio)'}")
             print(f"  - Saving {len(save_data.get('custom_llm_templates', {}))} custom templates.")
 
             with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
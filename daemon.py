@@ -0,0 +1,196 @@
+# --- START OF FILE daemon.py ---
+"""
+Long-running local transcription daemon.
+
+Models stay resident in the process-wide model cache, so a job only pays the decode time.
+All jobs share one instance per model (replica 0): concurrent jobs queue on that model's
+inference lock instead of loading a second copy of the weights. Listens on localhost only.
+
+    python -m audioscript serve --port 8765 --preload large
+"""
+
+import sys
+import json
+import time
+import uuid
+import inspect
+import threading
+import typing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from transcriber import AudioTranscriber
+from model_cache import model_cache
+from result_cache import result_cache
+from rtf_history import rtf_history
+from resource_watchdog import resource_watchdog, DEFAULT_IDLE_UNLOAD_MINUTES
+from model_store import model_store
+from translations import translations_dict
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Keyword options a /transcribe job may pass through to AudioTranscriber.transcribe_audio
+TRANSCRIBE_OPTIONS = frozenset(list(inspect.signature(AudioTranscriber.transcribe_audio).parameters)[6:]) # After self, file, model, language, use_gpu, system_type
+
+
+def _system_type() -> str:
+    if sys.platform == "darwin": return "mac"
+    if sys.platform == "win32": return "windows"
+    return "linux"
+
+
+class _EventHost:
+    """
+    Host for a daemon-side AudioTranscriber: every GUI callback becomes an event passed to
+    'emit' (streamed to the client for jobs, logged for preloads).
+    """
+
+    def __init__(self, emit: typing.Callable[[dict], None], ui_language: str = "English"):
+        self.emit = emit
+        self.translations = translations_dict.get(ui_language, translations_dict["English"])
+
+    def translate(self, key):
+        return self.translations.get(key, translations_dict["English"].get(key, f"<{key}>"))
+
+    def _print(self, message): self.emit({"event": "print", "message": message})
+    def _update_progress(self, task_key, status_key, progress_mode="start"):
+        self.emit({"event": "progress_state", "task_key": task_key, "status_key": status_key, "mode": progress_mode})
+    def _set_progress_value(self, percent): self.emit({"event": "progress", "percent": percent})
+    def _set_progress_eta(self, seconds): self.emit({"event": "eta", "seconds": seconds})
+    def result_text_append(self, text): self.emit({"event": "segment", "text": text})
+    def result_segments_replace(self, first, last, text): self.emit({"event": "segments_replace", "first": first, "last": last, "text": text})
+    def _show_error(self, error_key, **kwargs): self.emit({"event": "show_error", "key": error_key, "kwargs": {k: str(v) for k, v in kwargs.items()}})
+    def _set_background_status(self, status_key, **kwargs): self.emit({"event": "background_status", "key": status_key})
+
+    # The client finalizes its own UI when the 'done' event arrives
+    def _finalize_ui(self, *args, **kwargs): pass
+    def _show_info(self, *args, **kwargs): pass
+    def result_text_set(self, text): pass
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    server: 'TranscriptionDaemon'
+    protocol_version = "HTTP/1.0" # Job streams end when the connection closes
+
+    def log_message(self, format, *args):
+        print(f"Daemon: {self.address_string()} {format % args}", file=sys.__stderr__)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length: return {}
+        return json.loads(self.rfile.read(length).decode('utf-8'))
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json"); self.send_header("Content-Length", str(len(body)))
+        self.end_headers(); self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/status": self._send_json(200, self.server.status())
+        else: self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        try: payload = self._read_json()
+        except (ValueError, UnicodeDecodeError) as e: self._send_json(400, {"error": f"Invalid JSON: {e}"}); return
+        if self.path == "/transcribe": self._transcribe(payload)
+        elif self.path == "/preload":
+            if not payload.get("model"): self._send_json(400, {"error": "'model' is required"}); return
+            self.server.preload(payload["model"], bool(payload.get("use_gpu")), payload.get("precision", "fp32"))
+            self._send_json(200, {"status": "loading", "model": payload["model"]})
+        elif self.path == "/cancel": self._send_json(200, {"cancelled": self.server.cancel(payload.get("job_id", ""))})
+        else: self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def _transcribe(self, payload: dict):
+        missing = [key for key in ("file", "model", "language") if not payload.get(key)]
+        if missing: self._send_json(400, {"error": f"Missing fields: {', '.join(missing)}"}); return
+        options = payload.get("options") or {}
+        if not isinstance(options, dict): self._send_json(400, {"error": "'options' must be an object"}); return
+        unknown = sorted(set(options) - TRANSCRIBE_OPTIONS)
+        if unknown: self._send_json(400, {"error": f"Unknown options: {', '.join(unknown)} (accepted: {', '.join(sorted(TRANSCRIBE_OPTIONS))})"}); return
+        received_at = time.time()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+
+        write_lock = threading.Lock(); job_id = uuid.uuid4().hex[:12]
+        transcriber: typing.Optional[AudioTranscriber] = None
+        def emit(event: dict):
+            with write_lock:
+                try:
+                    self.wfile.write((json.dumps(event, ensure_ascii=False) + "\n").encode('utf-8')); self.wfile.flush()
+                except OSError:
+                    # Client went away: stop decoding for nobody
+                    if transcriber is not None and not transcriber.stop_requested: transcriber.request_stop()
+
+        transcriber = AudioTranscriber(_EventHost(emit, payload.get("ui_language", "English")))
+        self.server.register_job(job_id, transcriber, payload)
+        try:
+            emit({"event": "started", "job_id": job_id})
+            text, success, interrupted = transcriber.transcribe_audio(payload["file"], payload["model"], payload["language"],
+                                                                      bool(payload.get("use_gpu")), _system_type(), **options)
+            run = dict(transcriber.last_run, elapsed=time.time() - received_at)
+            emit({"event": "done", "job_id": job_id, "text": text, "success": success, "interrupted": interrupted, "run": run})
+            print(f"Daemon: job {job_id} {'done' if success else 'interrupted' if interrupted else 'failed'} in {run['elapsed']:.1f}s "
+                  f"(model load {run.get('load_time', 0.0):.2f}s, {run.get('segments', 0)} segments).", file=sys.__stderr__)
+        except Exception as e: # The 200 header is already out: report the failure in the stream instead of just closing it
+            print(f"Daemon Error: job {job_id} failed - {e}", file=sys.__stderr__)
+            emit({"event": "error", "job_id": job_id, "error": f"{type(e).__name__}: {e}"})
+        finally:
+            self.server.unregister_job(job_id)
+
+
+class TranscriptionDaemon(ThreadingHTTPServer):
+    """HTTP server on localhost that runs transcription jobs against resident models."""
+    daemon_threads = True
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        super().__init__((host, port), _DaemonRequestHandler)
+        self.started_at = time.time()
+        self._jobs: dict[str, dict] = {} # job_id -> {"transcriber", "file", "model", "started_at"}
+        self._jobs_lock = threading.Lock()
+        self.jobs_done = 0
+
+    def register_job(self, job_id: str, transcriber: AudioTranscriber, payload: dict):
+        with self._jobs_lock:
+            self._jobs[job_id] = {"transcriber": transcriber, "file": payload.get("file"), "model": payload.get("model"), "started_at": time.time()}
+
+    def unregister_job(self, job_id: str):
+        with self._jobs_lock:
+            if self._jobs.pop(job_id, None) is not None: self.jobs_done += 1
+
+    def cancel(self, job_id: str) -> bool:
+        with self._jobs_lock: job = self._jobs.get(job_id)
+        if job is None: return False
+        job["transcriber"].request_stop()
+        return True
+
+    def preload(self, model_type: str, use_gpu: bool, precision: str = "fp32"):
+        """Loads and warms a model in the background (no-op if already warm)."""
+        host = _EventHost(lambda event: print(f"Daemon preload: {event}", file=sys.__stderr__) if event["event"] == "print" else None)
+        AudioTranscriber(host).preload_model(model_type, use_gpu, _system_type(), precision)
+
+    def status(self) -> dict:
+        with self._jobs_lock:
+            jobs = [{"job_id": job_id, "file": job["file"], "model": job["model"], "running_for": time.time() - job["started_at"]}
+                    for job_id, job in self._jobs.items()]
+        return {"uptime": time.time() - self.started_at, "jobs_running": jobs, "jobs_done": self.jobs_done,
+                "model_cache": model_cache.stats(), "result_cache": result_cache.stats(), "rtf_history": rtf_history.stats(),
+                "resources": resource_watchdog.stats(), "model_store": model_store.stats()}
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, preload: typing.Optional[list[str]] = None, use_gpu: bool = False,
+          precision: str = "fp32", idle_unload_minutes: float = DEFAULT_IDLE_UNLOAD_MINUTES, memory_limit_mb: int = 0):
+    """Runs the daemon until interrupted. Models idle for idle_unload_minutes are unloaded (0 = keep them loaded)."""
+    daemon = TranscriptionDaemon(host, port)
+    print(f"Daemon: listening on http://{host}:{port}", file=sys.__stderr__)
+    for model_type in preload or []: daemon.preload(model_type, use_gpu, precision)
+    resource_watchdog.configure(idle_unload_minutes, memory_limit_mb); resource_watchdog.start()
+    try: daemon.serve_forever()
+    except KeyboardInterrupt: print("Daemon: shutting down.", file=sys.__stderr__)
+    finally:
+        with daemon._jobs_lock: running = list(daemon._jobs.values())
+        for job in running: job["transcriber"].request_stop()
+        resource_watchdog.stop()
+        daemon.server_close()
+
+# --- END OF FILE daemon.py ---
@@ -0,0 +1,96 @@
+# --- START OF FILE daemon_client.py ---
+"""
+Client for the local transcription daemon (daemon.py). Standard library only, so scripts
+can submit jobs without paying the torch/Whisper import cost.
+"""
+
+import json
+import http.client
+import typing
+from urllib.parse import urlparse
+
+DEFAULT_DAEMON_URL = "http://127.0.0.1:8765"
+
+
+class DaemonUnavailable(Exception):
+    """The daemon could not be reached (not running, wrong port)."""
+
+
+class DaemonError(Exception):
+    """The daemon answered with an error or the job stream broke off."""
+
+
+class DaemonClient:
+    """Talks to a TranscriptionDaemon over localhost HTTP; jobs stream back newline-delimited JSON events."""
+
+    def __init__(self, url: str = DEFAULT_DAEMON_URL, timeout: float = 2.0):
+        parsed = urlparse(url if "://" in url else f"http://{url}")
+        self.url = url
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 8765
+        self.timeout = timeout # For control requests; job streams wait as long as decoding takes
+
+    def _connect(self, method: str, path: str, payload: typing.Optional[dict] = None,
+                 timeout: typing.Optional[float] = None) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        body = json.dumps(payload or {}).encode('utf-8') if method == "POST" else None
+        try:
+            connection.request(method, path, body=body, headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+        except (ConnectionError, OSError) as e:
+            connection.close()
+            raise DaemonUnavailable(f"{self.url}: {e}") from e
+        if response.status != 200:
+            detail = response.read().decode('utf-8', errors='replace'); connection.close()
+            try: detail = json.loads(detail).get("error", detail)
+            except (ValueError, AttributeError): pass
+            raise DaemonError(f"HTTP {response.status}: {detail}")
+        return connection, response
+
+    def _request(self, method: str, path: str, payload: typing.Optional[dict] = None) -> dict:
+        connection, response = self._connect(method, path, payload, timeout=self.timeout)
+        try: return json.loads(response.read().decode('utf-8'))
+        except (OSError, ValueError) as e: raise DaemonError(f"Invalid reply from {self.url}{path}: {e}") from e
+        finally: connection.close()
+
+    def ping(self) -> bool:
+        try: self.status(); return True
+        except (DaemonUnavailable, DaemonError): return False
+
+    def status(self) -> dict:
+        """Resident models, cache counters and running jobs."""
+        return self._request("GET", "/status")
+
+    def preload(self, model_type: str, use_gpu: bool = False, precision: str = "fp32") -> dict:
+        """Asks the daemon to load and warm a model in the background."""
+        return self._request("POST", "/preload", {"model": model_type, "use_gpu": use_gpu, "precision": precision})
+
+    def cancel(self, job_id: str) -> bool:
+        """Requests a stop of a running job. Returns False if the job is unknown (already finished)."""
+        return bool(self._request("POST", "/cancel", {"job_id": job_id}).get("cancelled"))
+
+    def transcribe(self, input_file: str, model_type: str, language: str, use_gpu: bool = False,
+                   options: typing.Optional[dict] = None, ui_language: str = "English",
+                   on_event: typing.Optional[typing.Callable[[dict], None]] = None) -> dict:
+        """
+        Runs one job on the daemon. Every streamed event (started, print, progress, segment, ...)
+        is passed to on_event; the final 'done' event is returned, an 'error' event raises DaemonError.
+        The file path must be readable by the daemon (same machine).
+        """
+        payload = {"file": input_file, "model": model_type, "language": language, "use_gpu": use_gpu,
+                   "options": options or {}, "ui_language": ui_language}
+        connection, response = self._connect("POST", "/transcribe", payload)
+        try:
+            for line in response:
+                if not line.strip(): continue
+                event = json.loads(line.decode('utf-8'))
+                if event.get("event") == "done": return event
+                if event.get("event") == "error": raise DaemonError(f"Job failed on {self.url}: {event.get('error', 'unknown error')}")
+                if on_event: on_event(event)
+        except (OSError, ValueError) as e:
+            raise DaemonError(f"Job stream from {self.url} broke off: {e}") from e
+        finally:
+            connection.close()
+        raise DaemonError(f"Job stream from {self.url} ended without a result.")
+
+# --- END OF FILE daemon_client.py ---
@@ -0,0 +1,51 @@
+# --- START OF FILE decode_presets.py ---
+"""
+Named speed/accuracy presets mapped to Whisper decode options (model.transcribe keywords).
+
+    fast:     greedy, no temperature fallback, no conditioning on the previous window
+    balanced: Whisper's transcribe() defaults (greedy at T=0, fallback with best_of=5)
+    accurate: beam search (5 beams) at T=0, same fallback schedule as balanced
+"""
+
+PRESET_FAST = "fast"
+PRESET_BALANCED = "balanced"
+PRESET_ACCURATE = "accurate"
+DECODE_PRESET_NAMES = [PRESET_FAST, PRESET_BALANCED, PRESET_ACCURATE] # Display order
+DEFAULT_DECODE_PRESET = PRESET_BALANCED # Same output as before presets existed
+
+_TEMPERATURE_FALLBACK = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0) # Whisper's default schedule
+
+DECODE_PRESETS = {
+    PRESET_FAST: {
+        "beam_size": None, "best_of": None,
+        "temperature": (0.0,), # One greedy pass per window, never re-decoded
+        "condition_on_previous_text": False, # Shorter decoder context, and no repetition loops carried across windows
+        "compression_ratio_threshold": 2.4, "logprob_threshold": -1.0, # No fallback left to trigger; logprob still vetoes no-speech skips
+        "no_speech_threshold": 0.6,
+    },
+    PRESET_BALANCED: {
+        "beam_size": None, "best_of": 5,
+        "temperature": _TEMPERATURE_FALLBACK,
+        "condition_on_previous_text": True,
+        "compression_ratio_threshold": 2.4, "logprob_threshold": -1.0,
+        "no_speech_threshold": 0.6,
+    },
+    PRESET_ACCURATE: {
+        "beam_size": 5, "best_of": 5, "patience": 1.0,
+        "temperature": _TEMPERATURE_FALLBACK,
+        "condition_on_previous_text": True,
+        "compression_ratio_threshold": 2.4, "logprob_threshold": -1.0,
+        "no_speech_threshold": 0.6,
+    },
+}
+
+
+def decode_options_for(preset: str) -> dict:
+    """model.transcribe keyword options of a preset (unknown names fall back to the default preset)."""
+    return dict(DECODE_PRESETS.get(preset, DECODE_PRESETS[DEFAULT_DECODE_PRESET]))
+
+
+def normalize_preset(preset: str) -> str:
+    return preset if preset in DECODE_PRESETS else DEFAULT_DECODE_PRESET
+
+# --- END OF FILE decode_presets.py ---
@@ -8,14 +8,22 @@ import sys
 import typing
 
 # Backend/Logic Imports
-from transcriber import AudioTranscriber
+from transcriber import AudioTranscriber, RemoteTranscriber
+from model_cache import model_cache
+from result_cache import result_cache
 from llm_processor import LLMProcessor
+from job_queue import JobQueue
+from transcript_archive import transcript_archive
+from resource_watchdog import resource_watchdog, DEFAULT_IDLE_UNLOAD_MINUTES
+from model_store import model_store, MODEL_STORE_DIR
 
 # UI Component Imports
 from header_frame import HeaderFrame
 from transcription_tab_ui import TranscriptionTabUI
 from recorder_tab import RecorderTab
 from llm_tab import LLMTab
+from batch_tab import BatchTab
+from archive_tab import ArchiveTab
 from status_bar import StatusBar
 
 # Utility/Data Imports
@@ -62,8 +70,17 @@ class ModernTranscriptionApp:
         self.model_var = tk.StringVar(value="large") # Default, overwritten by config
         self.transcription_language_var = tk.StringVar(value="italiano") # Default, overwritten by config
         self.use_gpu_var = tk.BooleanVar(value=False) # Default, overwritten by config
+        self.parallel_workers_var = tk.IntVar(value=1) # Worker processes for long files (1 = off), overwritten by config
+        self.skip_silence_var = tk.BooleanVar(value=True) # Voice activity pre-pass, overwritten by config
+        self.bypass_cache_var = tk.BooleanVar(value=False) # Recompute even if a cached result exists, overwritten by config
+        self.precision_var = tk.StringVar(value="fp32") # fp32 or int8 (CPU dynamic quantization), overwritten by config
+        self.threads_var = tk.IntVar(value=0) # Torch CPU threads (0 = calibrated), overwritten by config
+        self.preset_var = tk.StringVar(value="balanced") # Decode preset (fast/balanced/accurate), overwritten by config
+        self.two_pass_var = tk.BooleanVar(value=False) # Draft with a small model, refine low-confidence segments, overwritten by config
+        self.draft_model_var = tk.StringVar(value="tiny") # Model of the draft pass, overwritten by config
         self.progress_var = tk.DoubleVar(value=0)
         self.model_desc_var = tk.StringVar() # Set dynamically
+        self._preload_after_id = None # Debounce id for re-warming after model/GPU changes
 
         # --- Load Config & Apply Language FIRST ---
         print("Loading config...")
@@ -77,8 +94,11 @@ class ModernTranscriptionApp:
         self.status_var.set(self.translate("status_ready"))
 
         # --- Instantiate Backend Logic ---
-        self.transcriber = AudioTranscriber(self)
+        # With a daemon URL configured, jobs run in the shared daemon (falls back to in-process if it is not running)
+        daemon_url = self.loaded_config.get("transcription_daemon_url", "")
+        self.transcriber = RemoteTranscriber(self, daemon_url) if daemon_url else AudioTranscriber(self)
         self.llm_processor = LLMProcessor()
+        self.job_queue = JobQueue(self)
 
         # --- UI Setup ---
         self.setup_ui_styles()
@@ -118,6 +138,15 @@ class ModernTranscriptionApp:
 
             # Setup stdout redirection (needs console widget to exist and be updated)
             self._setup_stdout_redirect()
+
+            # Load and warm up the configured model in the background, re-warm when it changes
+            self._start_model_preload()
+            self.model_var.trace_add("write", self._on_model_settings_change)
+            self.use_gpu_var.trace_add("write", self._on_model_settings_change)
+            self.precision_var.trace_add("write", self._on_model_settings_change)
+
+            # Resume a batch queue that was running when the app was last closed
+            if hasattr(self, 'batch_tab'): self.batch_tab.resume_if_needed()
             print("Post-init setup finished successfully.")
         except Exception as e:
             import traceback
@@ -131,22 +160,76 @@ class ModernTranscriptionApp:
         self.model_var.set(config.get("transcription_model", "large"))
         self.transcription_language_var.set(config.get("transcription_language", "italiano"))
         self.use_gpu_var.set(config.get("transcription_use_gpu", False))
+        self.parallel_workers_var.set(config.get("transcription_parallel_workers", 1))
+        self.skip_silence_var.set(config.get("transcription_skip_silence", True))
+        self.bypass_cache_var.set(config.get("transcription_bypass_cache", False))
+        self.precision_var.set(config.get("transcription_precision", "fp32"))
+        self.threads_var.set(config.get("transcription_threads", 0))
+        self.preset_var.set(config.get("transcription_preset", "balanced"))
+        self.two_pass_var.set(config.get("transcription_two_pass", False))
+        self.draft_model_var.set(config.get("transcription_draft_model", "tiny"))
+        model_cache.set_budget_mb(config.get("model_cache_budget_mb", 8192))
+        resource_watchdog.configure(config.get("model_idle_unload_minutes", DEFAULT_IDLE_UNLOAD_MINUTES), config.get("memory_limit_mb", 0))
+        resource_watchdog.start()
+        model_store.configure(config.get("model_store_dir", MODEL_STORE_DIR), config.get("model_store_offline", False))
+        result_cache.set_budget_mb(config.get("result_cache_budget_mb", 200))
 
         # Apply LLM config - now uses _apply_loaded_llm_config_to_tab which handles existence
         self._apply_loaded_llm_config_to_tab()
         print("Finished applying rest of config.")
 
+    def _start_model_preload(self):
+        """Starts the background load + warm-up of the currently selected model."""
+        self._preload_after_id = None
+        if not self.loaded_config.get("transcription_preload_model", True): return
+        self.transcriber.preload_model(self.model_var.get(), self.use_gpu_var.get(), self.system_type, self.precision_var.get())
+
+    def _on_model_settings_change(self, *args):
+        """Re-warms the model when model or GPU selection changes (debounced)."""
+        if self._preload_after_id:
+            try: self.root.after_cancel(self._preload_after_id)
+            except ValueError: pass
+        self._preload_after_id = self.root.after(500, self._start_model_preload)
+
     def _gather_current_config(self) -> dict:
         settings = {
             "ui_language": self.current_language.get(),
             "transcription_model": self.model_var.get(),
             "transcription_language": self.transcription_language_var.get(),
             "transcription_use_gpu": self.use_gpu_var.get(),
+            "transcription_parallel_workers": self._get_int_var(self.parallel_workers_var, 1),
+            "transcription_skip_silence": self.skip_silence_var.get(),
+            "transcription_bypass_cache": self.bypass_cache_var.get(),
+            "transcription_precision": self.precision_var.get(),
+            "transcription_threads": self._get_int_var(self.threads_var, 0),
+            "transcription_preset": self.preset_var.get(),
+            "transcription_two_pass": self.two_pass_var.get(),
+            "transcription_draft_model": self.draft_model_var.get(),
+            "model_cache_budget_mb": self.loaded_config.get("model_cache_budget_mb", 8192),
+            "model_idle_unload_minutes": self.loaded_config.get("model_idle_unload_minutes", DEFAULT_IDLE_UNLOAD_MINUTES),
+            "memory_limit_mb": self.loaded_config.get("memory_limit_mb", 0),
+            "model_store_dir": self.loaded_config.get("model_store_dir", MODEL_STORE_DIR),
+            "model_store_offline": self.loaded_config.get("model_store_offline", False),
+            "result_cache_budget_mb": self.loaded_config.get("result_cache_budget_mb", 200),
+            "transcription_daemon_url": self.loaded_config.get("transcription_daemon_url", ""),
+            "transcription_preload_model": self.loaded_config.get("transcription_preload_model", True),
             "llm_provider": None,
             "llm_model": None,
             "llm_api_key": "", # Raw key, will be obfuscated on save
-            "custom_llm_templates": {}
+            "custom_llm_templates": {},
+            "batch_workers": self.loaded_config.get("batch_workers", 1),
+            "batch_output_dir": self.loaded_config.get("batch_output_dir", ""),
+            "live_transcription": self.loaded_config.get("live_transcription", False),
+            "live_latency_seconds": self.loaded_config.get("live_latency_seconds", 2.0)
         }
+        if hasattr(self, 'batch_tab') and self.batch_tab:
+            try: settings["batch_workers"] = int(self.batch_tab.workers_var.get())
+            except (tk.TclError, ValueError): pass
+            settings["batch_output_dir"] = self.batch_tab.output_dir_var.get()
+        if hasattr(self, 'recorder_tab') and self.recorder_tab:
+            settings["live_transcription"] = self.recorder_tab.live_var.get()
+            try: settings["live_latency_seconds"] = float(self.recorder_tab.live_latency_var.get())
+            except ValueError: pass
         if hasattr(self, 'llm_tab') and self.llm_tab:
             # Safely get values from LLM tab widgets if they exist
             if hasattr(self.llm_tab, 'llm_provider_var'): settings["llm_provider"] = self.llm_tab.llm_provider_var.get()
@@ -156,6 +239,22 @@ class ModernTranscriptionApp:
 
         return settings
 
+    def _get_int_var(self, var, default):
+        try: return int(var.get())
+        except (tk.TclError, ValueError): return default
+
+    def get_transcription_options(self) -> dict:
+        """Extra keyword options for AudioTranscriber.transcribe_audio, shared by single and batch jobs."""
+        return {
+            "parallel_workers": max(1, self._get_int_var(self.parallel_workers_var, 1)),
+            "skip_silence": self.skip_silence_var.get(),
+            "use_cache": not self.bypass_cache_var.get(),
+            "precision": self.precision_var.get(),
+            "threads": max(0, self._get_int_var(self.threads_var, 0)),
+            "preset": self.preset_var.get(),
+            "draft_model": self.draft_model_var.get() if self.two_pass_var.get() else "",
+        }
+
     def translate(self, key):
         lang_code = self.current_language.get()
         selected_lang_dict = self.translations.get(lang_code, self.translations.get('English', {})) # Fallback to English dict
@@ -195,11 +294,15 @@ class ModernTranscriptionApp:
         self.transcription_tab = TranscriptionTabUI(self.main_notebook, self)
         self.recorder_tab = RecorderTab(self.main_notebook, self, self.update_transcription_path_callback) # Pass self (gui_app)
         self.llm_tab = LLMTab(self.main_notebook, self, self.llm_processor)
+        self.batch_tab = BatchTab(self.main_notebook, self, self.job_queue)
+        self.archive_tab = ArchiveTab(self.main_notebook, self, transcript_archive)
 
         # Add tabs to notebook (text will be set in update_ui_text)
         self.main_notebook.add(self.transcription_tab.frame, text="")
         self.main_notebook.add(self.recorder_tab.frame, text="")
         self.main_notebook.add(self.llm_tab.frame, text="")
+        self.main_notebook.add(self.batch_tab.frame, text="")
+        self.main_notebook.add(self.archive_tab.frame, text="")
 
         self.status_bar = StatusBar(self.root, self)
         # LLM config applied in _apply_rest_of_config scheduled from _post_init_setup
@@ -268,6 +371,10 @@ class ModernTranscriptionApp:
 
             if hasattr(self, 'llm_tab') and self.llm_tab.frame.winfo_exists():
                  self.llm_tab.update_ui_text()
+            if hasattr(self, 'batch_tab') and self.batch_tab.frame.winfo_exists():
+                 self.batch_tab.update_ui_text()
+            if hasattr(self, 'archive_tab') and self.archive_tab.frame.winfo_exists():
+                 self.archive_tab.update_ui_text()
 
             # Update Main Notebook Tab Titles
             if hasattr(self, 'main_notebook') and self.main_notebook.winfo_exists():
@@ -276,6 +383,8 @@ class ModernTranscriptionApp:
                     if len(tabs) > 0: self.main_notebook.tab(tabs[0], text=self.translate("tab_transcription"))
                     if len(tabs) > 1: self.main_notebook.tab(tabs[1], text=self.translate("tab_recorder"))
                     if len(tabs) > 2: self.main_notebook.tab(tabs[2], text=self.translate("tab_llm"))
+                    if len(tabs) > 3: self.main_notebook.tab(tabs[3], text=self.translate("tab_batch"))
+                    if len(tabs) > 4: self.main_notebook.tab(tabs[4], text=self.translate("tab_archive"))
                 except tk.TclError as e: print(f"Error updating main notebook tabs: {e}", file=sys.__stderr__)
 
             # Update main status bar text only if it's currently "Ready"
@@ -327,6 +436,7 @@ class ModernTranscriptionApp:
 
     # --- Methods for Transcriber Backend Communication ---
     # (Unchanged methods: _print, _update_progress, _finalize_ui, _show_error, _show_info, result_text_set)
+    # (Streaming additions: _set_progress_value, result_text_append)
     def _print(self, message):
         if hasattr(self, 'transcription_tab') and self.transcription_tab and hasattr(self.transcription_tab, 'console_output'):
             # Delegate to ConsoleOutput instance via stdout redirection
@@ -365,10 +475,37 @@ class ModernTranscriptionApp:
              self.root.after_idle(lambda: messagebox.showinfo(t, m, parent=self.root))
          else: print(f"INFO (no GUI): {t} - {m}", file=sys.__stderr__)
 
+    def _set_progress_value(self, percent):
+         if hasattr(self, 'root') and self.root.winfo_exists():
+             self.root.after_idle(self.progress_var.set, percent)
+
+    def _set_progress_eta(self, seconds):
+         text = self.translate("progress_label_transcribing_eta").format(minutes=int(seconds // 60), seconds=int(seconds % 60))
+         def apply():
+             if getattr(self.transcriber, 'is_running', False): self.current_task.set(text)
+         if hasattr(self, 'root') and self.root.winfo_exists():
+             self.root.after_idle(apply)
+
+    def _set_background_status(self, status_key, **kwargs):
+         # Background activity (e.g. model preload) must not overwrite the status of a running job
+         def apply():
+             if getattr(self.transcriber, 'is_running', False): return
+             self.status_var.set(self.translate(status_key).format(**kwargs))
+         if hasattr(self, 'root') and self.root.winfo_exists():
+             self.root.after_idle(apply)
+
     def result_text_set(self, text):
          if hasattr(self, 'transcription_tab'):
              self.root.after_idle(self.transcription_tab.result_text_set, text)
 
+    def result_text_append(self, text):
+         if hasattr(self, 'transcription_tab'):
+             self.root.after_idle(self.transcription_tab.result_text_append, text)
+
+    def result_segments_replace(self, first, last, text):
+         if hasattr(self, 'transcription_tab'):
+             self.root.after_idle(self.transcription_tab.result_segments_replace, first, last, text)
+
     # --- Method to get transcription text for LLM tab ---
     def get_transcription_text(self):
         if hasattr(self, 'transcription_tab'):
@@ -394,6 +531,23 @@ class ModernTranscriptionApp:
                 except Exception as e:
                     print(f"Error during recorder tab cleanup: {e}", file=sys.__stderr__)
 
+            if hasattr(self, 'batch_tab') and self.batch_tab:
+                try:
+                    print("Cleaning up batch tab...")
+                    self.batch_tab.on_close()
+                except Exception as e:
+                    print(f"Error during batch tab cleanup: {e}", file=sys.__stderr__)
+
+            if hasattr(self, 'archive_tab') and self.archive_tab:
+                try:
+                    print("Cleaning up archive tab...")
+                    self.archive_tab.on_close()
+                except Exception as e:
+                    print(f"Error during archive tab cleanup: {e}", file=sys.__stderr__)
+
+            resource_watchdog.stop()
+            if hasattr(self, 'status_bar') and self.status_bar: self.status_bar.on_close()
+
             if hasattr(self, 'llm_tab') and self.llm_tab:
                 try:
                     print("Cleaning up LLM tab...")
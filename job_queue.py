@@ -0,0 +1,338 @@
+# --- START OF FILE job_queue.py ---
+
+import os
+import sys
+import json
+import time
+import uuid
+import threading
+import typing
+
+from transcriber import AudioTranscriber
+from utils import get_audio_duration, transcription_output_path, AUDIO_EXTENSIONS
+from rtf_history import rtf_history
+
+JOB_QUEUE_FILE = "job_queue.json" # Persisted next to config.json
+
+# Job states
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_ERROR = "error"
+
+
+class _BatchHost:
+    """
+    Stands in for the main app for one batch worker's AudioTranscriber.
+
+    Console output is forwarded with a worker prefix, errors are captured instead of
+    opening message boxes, and the result pane is left alone (the job writes its own file).
+    """
+
+    def __init__(self, app, job_queue: 'JobQueue', worker_index: int):
+        self.app = app
+        self.job_queue = job_queue
+        self.worker_index = worker_index
+        self.current_job_id: typing.Optional[str] = None
+        self.last_error: typing.Optional[str] = None
+
+    def translate(self, key):
+        return self.app.translate(key)
+
+    def _print(self, message):
+        if message.strip(): self.app._print(f"[Batch {self.worker_index + 1}] {message.lstrip()}")
+
+    def _show_error(self, error_key, **kwargs):
+        self.last_error = self.translate(error_key).format(**kwargs)
+
+    def _set_progress_value(self, percent):
+        if self.current_job_id: self.job_queue._set_job_progress(self.current_job_id, percent)
+
+    # Single-job UI hooks that have no meaning for a batch worker
+    def _update_progress(self, *args, **kwargs): pass
+    def _finalize_ui(self, *args, **kwargs): pass
+    def _show_info(self, *args, **kwargs): pass
+    def result_text_set(self, text): pass
+    def result_text_append(self, text): pass
+
+
+class JobQueue:
+    """
+    Persistent queue of batch transcription jobs.
+
+    Jobs are plain dicts saved to JOB_QUEUE_FILE after every state change, so a restart
+    resumes where the previous session stopped. Jobs are processed by one or more worker
+    threads; every worker keeps its own AudioTranscriber and model replica from the shared
+    model cache, so models stay loaded across jobs.
+    """
+
+    def __init__(self, app, state_file: str = JOB_QUEUE_FILE):
+        self.app = app # Provides translate() and _print()
+        self.state_file = state_file
+        self.jobs: list[dict] = []
+        self.workers = 1
+        self.resume_on_start = False # True if the previous session was closed while processing
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._worker_threads: list[threading.Thread] = []
+        self._transcribers: list[AudioTranscriber] = []
+        self._active_workers = 0
+        self._resume_on_restart = False
+        self._restart_workers = 0 # Worker count for a start() requested while stopped workers were still finishing
+        # Session statistics for throughput / ETA
+        self._session_start = 0.0
+        self._session_audio_seconds = 0.0
+        self._session_jobs_done = 0
+        self._session_job_time = 0.0
+        self.load_state()
+
+    # --- Persistence ---
+    def load_state(self):
+        """Loads the queue from disk. Jobs interrupted mid-run go back to pending."""
+        if not os.path.exists(self.state_file): return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            with self._lock:
+                self.jobs = state.get("jobs", [])
+                self.workers = max(1, int(state.get("workers", 1)))
+                self.resume_on_start = bool(state.get("running", False))
+                for job in self.jobs:
+                    if job.get("status") == STATUS_RUNNING: job["status"] = STATUS_PENDING; job["progress"] = 0.0
+            print(f"JobQueue: Restored {len(self.jobs)} jobs ({self.count(STATUS_PENDING)} pending) from {self.state_file}.")
+        except (json.JSONDecodeError, OSError, ValueError) as e:
+            print(f"JobQueue Error: Failed to load {self.state_file} - {e}", file=sys.__stderr__)
+
+    def save_state(self, running: typing.Optional[bool] = None):
+        """Writes the queue atomically (temp file + rename)."""
+        with self._lock:
+            state = {"version": 1, "workers": self.workers,
+                     "running": self.is_running() if running is None else running,
+                     "jobs": self.jobs}
+            tmp_file = self.state_file + ".tmp"
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_file, self.state_file)
+            except OSError as e:
+                print(f"JobQueue Error: Failed to save {self.state_file} - {e}", file=sys.__stderr__)
+
+    # --- Queue management ---
+    def add_files(self, paths: typing.Iterable[str], model_type: str, language: str, use_gpu: bool,
+                  system_type: str, output_dir: str = "", options: typing.Optional[dict] = None, source_root: str = "") -> int:
+        """
+        Enqueues audio files. Files already waiting with the same options are skipped. Returns the number added.
+        'options' are extra keyword arguments for AudioTranscriber.transcribe_audio; files under
+        'source_root' keep their subfolders below output_dir.
+        """
+        added = 0
+        with self._lock:
+            waiting = {(j["file"], j["model"], j["language"]) for j in self.jobs if j["status"] in (STATUS_PENDING, STATUS_RUNNING)}
+            for path in paths:
+                path = os.path.abspath(path)
+                if not os.path.isfile(path) or (path, model_type, language) in waiting: continue
+                self.jobs.append({
+                    "id": uuid.uuid4().hex,
+                    "file": path,
+                    "model": model_type,
+                    "language": language,
+                    "use_gpu": use_gpu,
+                    "system_type": system_type,
+                    "output_dir": output_dir,
+                    "source_root": os.path.abspath(source_root) if source_root else "",
+                    "options": dict(options or {}),
+                    "status": STATUS_PENDING,
+                    "progress": 0.0,
+                    "duration": get_audio_duration(path), # 0 if unknown
+                    "elapsed": 0.0,
+                    "output_file": "",
+                    "error": "",
+                    "added_at": time.time(),
+                })
+                waiting.add((path, model_type, language)); added += 1
+            if added: self.save_state()
+        return added
+
+    def add_folder(self, folder: str, model_type: str, language: str, use_gpu: bool, system_type: str,
+                   output_dir: str = "", options: typing.Optional[dict] = None, recursive: bool = True) -> int:
+        """Enqueues every audio file in a folder (sorted by path)."""
+        paths = []
+        for root, dirs, files in os.walk(folder):
+            dirs.sort()
+            paths.extend(os.path.join(root, name) for name in sorted(files) if name.lower().endswith(AUDIO_EXTENSIONS))
+            if not recursive: break
+        return self.add_files(paths, model_type, language, use_gpu, system_type, output_dir, options, source_root=folder)
+
+    def clear_finished(self):
+        """Removes completed and failed jobs from the queue."""
+        with self._lock:
+            self.jobs = [j for j in self.jobs if j["status"] in (STATUS_PENDING, STATUS_RUNNING)]
+            self.save_state()
+
+    def retry_failed(self):
+        """Puts failed jobs back to pending."""
+        with self._lock:
+            for job in self.jobs:
+                if job["status"] == STATUS_ERROR: job.update(status=STATUS_PENDING, progress=0.0, error="")
+            self.save_state()
+
+    def snapshot(self) -> list[dict]:
+        """Returns a copy of the jobs for display."""
+        with self._lock:
+            return [dict(job) for job in self.jobs]
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            return sum(1 for job in self.jobs if job["status"] == status)
+
+    # --- Processing ---
+    def is_running(self) -> bool:
+        return self._active_workers > 0
+
+    def start(self, workers: typing.Optional[int] = None):
+        """
+        Starts processing pending jobs with the given number of workers. If a stop() is still
+        waiting for running jobs to return, the restart is queued: the last worker out starts it.
+        """
+        with self._lock:
+            if self.is_running():
+                if self._stop_event.is_set():
+                    self._restart_workers = max(1, int(workers or self.workers))
+                    print("JobQueue: Restart queued until the stopped workers finish their current job.")
+                return
+            if workers: self.workers = max(1, int(workers))
+            self._stop_event.clear(); self._resume_on_restart = False; self._restart_workers = 0
+            self._session_start = time.time(); self._session_audio_seconds = 0.0
+            self._session_jobs_done = 0; self._session_job_time = 0.0
+            self._worker_threads = []; self._transcribers = []
+            for index in range(self.workers):
+                transcriber = AudioTranscriber(_BatchHost(self.app, self, index))
+                transcriber.model_replica = index # Each worker gets its own model instance
+                transcriber.concurrent_jobs = self.workers
+                self._transcribers.append(transcriber)
+                thread = threading.Thread(target=self._worker_loop, args=(transcriber,), daemon=True)
+                self._worker_threads.append(thread)
+            self._active_workers = self.workers
+            self.save_state(running=True)
+        print(f"JobQueue: Started {self.workers} worker(s) for {self.count(STATUS_PENDING)} pending jobs.")
+        for thread in self._worker_threads: thread.start()
+
+    def stop(self, resume_on_restart: bool = False):
+        """
+        Stops processing. Running jobs are interrupted and go back to pending.
+
+        Args:
+            resume_on_restart: Keep the 'running' flag on disk so the next launch resumes
+                               automatically (used when the application closes).
+        """
+        self._resume_on_restart = resume_on_restart; self._restart_workers = 0 # A stop also cancels a queued restart
+        self._stop_event.set()
+        for transcriber in self._transcribers: transcriber.request_stop()
+        self.save_state(running=resume_on_restart)
+
+    def _claim_next_job(self) -> typing.Optional[dict]:
+        with self._lock:
+            if self._stop_event.is_set(): return None
+            for job in self.jobs:
+                if job["status"] == STATUS_PENDING:
+                    job["status"] = STATUS_RUNNING; job["progress"] = 0.0; job["error"] = ""
+                    self.save_state(running=True)
+                    return job
+        return None
+
+    def _set_job_progress(self, job_id: str, percent: float):
+        with self._lock:
+            for job in self.jobs:
+                if job["id"] == job_id: job["progress"] = percent; break
+
+    def _output_path(self, job: dict, host: _BatchHost) -> str:
+        """Picks the job's transcript path and reserves it, so two jobs in the queue never write the same file."""
+        with self._lock:
+            claimed = {os.path.normcase(os.path.abspath(j["output_file"])): j["file"] for j in self.jobs if j.get("output_file") and j is not job}
+            output_file, other_file = transcription_output_path(job["file"], job.get("output_dir", ""), job.get("source_root", ""), claimed)
+            job["output_file"] = output_file
+        if other_file:
+            host._print(self.app.translate("batch_output_renamed_warning").format(file=os.path.basename(job["file"]), other=os.path.basename(other_file), output=output_file))
+        return output_file
+
+    def _worker_loop(self, transcriber: AudioTranscriber):
+        host: _BatchHost = transcriber.gui
+        while True:
+            job = self._claim_next_job()
+            if job is None: break
+            self._run_job(transcriber, host, job)
+        with self._lock:
+            self._active_workers -= 1
+            if self._active_workers > 0: return
+            # Last worker out: persist the final state, or hand over to a restart queued during the stop
+            restart_workers = self._restart_workers; self._restart_workers = 0
+            if not restart_workers: self.save_state(running=self._stop_event.is_set() and self._resume_on_restart)
+        print(f"JobQueue: Finished. {self.count(STATUS_DONE)} done, {self.count(STATUS_ERROR)} failed, {self.count(STATUS_PENDING)} pending.")
+        if restart_workers: self.start(restart_workers)
+
+    def _run_job(self, transcriber: AudioTranscriber, host: _BatchHost, job: dict):
+        host.current_job_id = job["id"]; host.last_error = None
+        start_time = time.time()
+        text, success, interrupted = transcriber.transcribe_audio(job["file"], job["model"], job["language"], job["use_gpu"], job["system_type"], **job.get("options", {}))
+        elapsed = time.time() - start_time
+        output_file = ""; error = ""
+        if success and not interrupted:
+            output_file = self._output_path(job, host)
+            try:
+                os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(text)
+            except OSError as e:
+                success = False; error = f"Could not write {output_file}: {e}"
+        with self._lock:
+            if interrupted:
+                job.update(status=STATUS_PENDING, progress=0.0) # Re-run from scratch on the next start
+            elif success:
+                job.update(status=STATUS_DONE, progress=100.0, elapsed=elapsed, output_file=output_file, finished_at=time.time())
+                self._session_audio_seconds += job.get("duration", 0.0)
+                self._session_jobs_done += 1; self._session_job_time += elapsed
+            else:
+                job.update(status=STATUS_ERROR, elapsed=elapsed, output_file="", error=error or host.last_error or text)
+            self.save_state(running=not self._stop_event.is_set() or self._resume_on_restart)
+        host.current_job_id = None
+
+    # --- Statistics ---
+    def _job_device(self, job: dict) -> str:
+        """The device a job runs on, as RTF history records it (the probed GPU backend: CUDA, MPS, DirectML or CPU)."""
+        if not job.get("use_gpu"): return "cpu"
+        device = AudioTranscriber.probed_device(True, job["system_type"])
+        if device is None and self._transcribers: device = self._transcribers[0].get_device(True, job["system_type"]) # Probed once per process
+        return str(device) if device is not None else "cpu"
+
+    def _estimate_job_time(self, job: dict) -> float:
+        """Remaining time of one job from the RTF history of the device it runs on."""
+        options = job.get("options", {})
+        parallel_workers = options.get("parallel_workers", 1) if not job.get("use_gpu") else 1
+        estimate, _ = rtf_history.estimate(job["model"], self._job_device(job), options.get("precision", "fp32"),
+                                           job.get("duration", 0.0), parallel_workers, preset=options.get("preset", "balanced"))
+        return estimate * (1.0 - job.get("progress", 0.0) / 100.0)
+
+    def stats(self) -> dict:
+        """
+        Returns counts, throughput (audio seconds per wall-clock second) and ETA in seconds.
+        ETA uses measured throughput when durations are known; before the first job of the
+        session finishes it comes from the speed of past jobs with the same settings.
+        """
+        with self._lock:
+            counts = {status: self.count(status) for status in (STATUS_PENDING, STATUS_RUNNING, STATUS_DONE, STATUS_ERROR)}
+            wall_time = time.time() - self._session_start if self._session_start and self.is_running() else 0.0
+            throughput = self._session_audio_seconds / wall_time if wall_time > 0 else 0.0
+            remaining_audio = sum(job.get("duration", 0.0) * (1.0 - job.get("progress", 0.0) / 100.0)
+                                  for job in self.jobs if job["status"] in (STATUS_PENDING, STATUS_RUNNING))
+            eta = None
+            if self.is_running():
+                if throughput > 0 and remaining_audio > 0:
+                    eta = remaining_audio / throughput
+                elif remaining_audio > 0:
+                    eta = sum(self._estimate_job_time(job) for job in self.jobs if job["status"] in (STATUS_PENDING, STATUS_RUNNING)) / self.workers
+                elif self._session_jobs_done:
+                    remaining_jobs = counts[STATUS_PENDING] + counts[STATUS_RUNNING]
+                    eta = (self._session_job_time / self._session_jobs_done) * remaining_jobs / self.workers
+            return {**counts, "total": len(self.jobs), "throughput": throughput, "eta_seconds": eta}
+
+# --- END OF FILE job_queue.py ---
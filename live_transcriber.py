@@ -0,0 +1,283 @@
+# --- START OF FILE live_transcriber.py ---
+"""
+Live microphone transcription over a rolling audio window.
+
+Microphone chunks (any rate/channels) are downmixed and resampled to 16 kHz into a buffer of
+at most MAX_BUFFER_SECONDS. Every pass re-decodes the whole buffer, so words keep improving as
+more context arrives; a word is committed only when two consecutive passes agree on it
+(local agreement), everything after the agreed prefix is shown as partial text. Once the
+buffer grows past TRIM_BUFFER_SECONDS it is cut at the end of the last fully committed
+segment and the committed text becomes the prompt for the following passes.
+
+Word times are interpolated inside Whisper's segments rather than computed with
+word_timestamps=True: that would add an alignment pass to every decode, and cuts only happen
+at segment ends, whose timestamps are exact.
+
+Inference never queues up: audio arriving during a pass is appended to the buffer and decoded
+by the next pass together, and audio that would overflow the buffer is committed from the
+last hypothesis or skipped (counted in stats()).
+"""
+
+import re
+import sys
+import time
+import threading
+import typing
+
+import numpy as np
+
+from audio_loader import SAMPLE_RATE, PolyphaseResampler
+from decode_presets import PRESET_FAST, decode_options_for
+from model_cache import model_cache
+from quantization import PRECISION_FP32
+
+if typing.TYPE_CHECKING:
+    from transcriber import AudioTranscriber
+
+LATENCY_CHOICES = (1.0, 2.0, 3.0, 5.0) # Seconds, offered in the Recorder tab
+DEFAULT_LATENCY_SECONDS = 2.0
+MIN_PASS_SECONDS = 0.5 # Shortest interval between passes, whatever the latency target
+MAX_BUFFER_SECONDS = 30.0 # Whisper's window: older audio is committed or skipped
+TRIM_BUFFER_SECONDS = 15.0 # Past this the buffer is cut at the last committed word
+PROMPT_CHARS = 200 # Committed text passed as prompt once its audio left the buffer
+REPEAT_NGRAM_MAX = 5 # Longest run of already committed words recognized again at the start of a pass
+_WORD_CHARS = re.compile(r"[^\w']+")
+_WORDS = re.compile(r"\s*\S+")
+
+
+def _normalize(word: str) -> str:
+    return _WORD_CHARS.sub("", word).lower()
+
+
+class LocalAgreement:
+    """
+    Stable-prefix commit policy over successive hypotheses of the same audio (LocalAgreement-2):
+    the longest common prefix of the last two hypotheses is committed, the rest stays tentative.
+    Words are dicts with 'start'/'end' (seconds of the stream) and 'word'.
+    """
+
+    def __init__(self):
+        self.last_committed_end = 0.0
+        self.in_buffer: list[dict] = [] # Committed words whose audio is still in the buffer
+        self._committed_tail: list[str] = [] # Normalized last committed words, to drop repeats
+        self.tentative: list[dict] = [] # Uncommitted words of the last hypothesis
+
+    def insert(self, words: list[dict]) -> list[dict]:
+        """Takes a new hypothesis of the whole buffer and returns the words it commits."""
+        words = [word for word in words if _normalize(word["word"])]
+        # Every pass decodes from the buffer start, so the committed words normally come back as the prefix
+        known = 0
+        while known < min(len(words), len(self.in_buffer)) and _normalize(words[known]["word"]) == _normalize(self.in_buffer[known]["word"]): known += 1
+        new = words[known:]
+        if known < len(self.in_buffer): new = [word for word in new if word["start"] > self.last_committed_end - 0.2] # Committed words were revised: go by time
+        if new and abs(new[0]["start"] - self.last_committed_end) < 1.0:
+            # After a trim the prompt often makes Whisper repeat the end of the committed text
+            for n in range(min(REPEAT_NGRAM_MAX, len(new), len(self._committed_tail)), 0, -1):
+                if [_normalize(word["word"]) for word in new[:n]] == self._committed_tail[-n:]: new = new[n:]; break
+        agreed = 0
+        while agreed < min(len(new), len(self.tentative)) and _normalize(new[agreed]["word"]) == _normalize(self.tentative[agreed]["word"]): agreed += 1
+        committed, self.tentative = new[:agreed], new[agreed:]
+        self._remember(committed)
+        return committed
+
+    def commit_until(self, time_limit: float) -> list[dict]:
+        """Commits tentative words ending before time_limit (their audio is leaving the buffer)."""
+        count = 0
+        while count < len(self.tentative) and self.tentative[count]["end"] <= time_limit: count += 1
+        committed, self.tentative = self.tentative[:count], self.tentative[count:]
+        self._remember(committed)
+        return committed
+
+    def flush(self) -> list[dict]:
+        """Commits every tentative word (end of the stream)."""
+        committed, self.tentative = self.tentative, []
+        self._remember(committed)
+        return committed
+
+    def forget_until(self, time_limit: float):
+        """Drops committed words whose audio left the buffer."""
+        self.in_buffer = [word for word in self.in_buffer if word["end"] > time_limit]
+
+    def _remember(self, committed: list[dict]):
+        if not committed: return
+        self.in_buffer.extend(committed)
+        self.last_committed_end = committed[-1]["end"]
+        self._committed_tail = (self._committed_tail + [_normalize(word["word"]) for word in committed])[-REPEAT_NGRAM_MAX:]
+
+
+class LiveTranscriber:
+    """
+    Transcribes microphone audio while it is recorded (see the module docstring).
+
+    feed() is called from the audio callback and only queues the chunk; a worker thread loads
+    the model and runs the passes. on_update(committed, partial) receives the newly committed
+    text and the current partial text after every pass; on_status(status_key, **kwargs)
+    receives translation keys for the status line. Both are called from the worker thread.
+    """
+
+    def __init__(self, transcriber: 'AudioTranscriber', model_type: str, language: str, use_gpu: bool, system_type: str,
+                 precision: str = PRECISION_FP32, latency: float = DEFAULT_LATENCY_SECONDS,
+                 on_update: typing.Optional[typing.Callable[[str, str], None]] = None,
+                 on_status: typing.Optional[typing.Callable[..., None]] = None):
+        self.transcriber = transcriber
+        self.model_type = model_type; self.language = language; self.use_gpu = use_gpu; self.system_type = system_type; self.precision = precision
+        self.latency = max(MIN_PASS_SECONDS, float(latency))
+        self.on_update = on_update or (lambda committed, partial: None)
+        self.on_status = on_status or (lambda status_key, **kwargs: None)
+        self.options = {**decode_options_for(PRESET_FAST), 'language': language, 'fp16': False, 'verbose': None}
+
+        self._lock = threading.Lock() # Guards the pending input, written by the audio callback
+        self._pending: list[np.ndarray] = []; self._pending_frames = 0; self._input_rate = 0; self._dropped_frames = 0
+        self._wake = threading.Event()
+        self._stopping = False; self._flush_on_stop = True
+        self._thread: typing.Optional[threading.Thread] = None
+
+        self._resampler: typing.Optional[PolyphaseResampler] = None; self._resampler_rate = 0
+        self._audio = np.zeros(0, dtype=np.float32); self._audio_start = 0.0 # Stream time of _audio[0]
+        self._agreement = LocalAgreement()
+        self._segment_end = 0.0 # End of the last segment whose words are all committed (safe cut point)
+        self._committed_text = ""
+        self._stats = {"passes": 0, "pass_time": 0.0, "max_pass_time": 0.0, "skipped_seconds": 0.0, "lag_seconds": 0.0}
+
+    @property
+    def text(self) -> str:
+        return self._committed_text
+
+    def stats(self) -> dict:
+        passes = self._stats["passes"]
+        return {**self._stats, "avg_pass_time": self._stats["pass_time"] / passes if passes else 0.0}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name="LiveTranscriber"); self._thread.start()
+
+    def feed(self, chunk: np.ndarray, sample_rate: int):
+        """Queues one microphone chunk (frames x channels or mono). Cheap enough for the audio callback."""
+        with self._lock:
+            if self._stopping: return
+            self._input_rate = sample_rate
+            self._pending.append(chunk); self._pending_frames += len(chunk)
+            while self._pending_frames > MAX_BUFFER_SECONDS * sample_rate and len(self._pending) > 1: # Worker stalled (model still loading, busy device)
+                dropped = self._pending.pop(0); self._pending_frames -= len(dropped); self._dropped_frames += len(dropped)
+            ready = self._pending_frames >= self._pass_interval() * sample_rate
+        if ready: self._wake.set()
+
+    def stop(self, flush: bool = True, timeout: typing.Optional[float] = None):
+        """Stops after a last pass over the buffered audio (flush=True commits all of it). Blocks until the worker exits."""
+        with self._lock: self._stopping = True; self._flush_on_stop = flush
+        self._wake.set()
+        if self._thread is not None: self._thread.join(timeout)
+
+    def _pass_interval(self) -> float:
+        # A word is committed by the second pass that hears it, so a pass every half target keeps commits near the target
+        return max(MIN_PASS_SECONDS, self.latency / 2)
+
+    def _take_pending(self) -> tuple[list[np.ndarray], int, int]:
+        with self._lock:
+            chunks, self._pending, self._pending_frames = self._pending, [], 0
+            dropped, self._dropped_frames = self._dropped_frames, 0
+            return chunks, self._input_rate, dropped
+
+    def _append_input(self, chunks: list[np.ndarray], input_rate: int, dropped_frames: int, final: bool = False) -> list[dict]:
+        """
+        Moves queued input into the 16 kHz buffer, enforcing its size limit (final=True also drains
+        the resampler). Returns the words committed to make room.
+        """
+        committed = []
+        if dropped_frames:
+            # Input was lost while the worker was stalled: commit what was heard and restart the buffer after the gap
+            committed += self._agreement.flush()
+            self._stats["skipped_seconds"] += dropped_frames / input_rate
+            self._audio_start += len(self._audio) / SAMPLE_RATE + dropped_frames / input_rate
+            self._audio = np.zeros(0, dtype=np.float32); self._resampler = None
+            self._agreement.forget_until(self._audio_start)
+        if chunks:
+            block = np.concatenate(chunks)
+            if block.ndim > 1: block = block.mean(axis=1)
+            if input_rate != SAMPLE_RATE:
+                if self._resampler is None or self._resampler_rate != input_rate:
+                    self._resampler = PolyphaseResampler(input_rate, SAMPLE_RATE); self._resampler_rate = input_rate
+                block = self._resampler.process(block)
+        else: block = np.zeros(0, dtype=np.float32)
+        if final and self._resampler is not None: block = np.concatenate([block, self._resampler.flush()]); self._resampler = None
+        self._audio = np.concatenate([self._audio, block.astype(np.float32, copy=False)])
+        overflow = len(self._audio) - int(MAX_BUFFER_SECONDS * SAMPLE_RATE)
+        if overflow > 0:
+            cut_time = self._audio_start + overflow / SAMPLE_RATE
+            committed += self._agreement.commit_until(cut_time)
+            self._stats["skipped_seconds"] += max(0.0, cut_time - max(self._agreement.last_committed_end, self._audio_start))
+            self._audio = self._audio[overflow:]; self._audio_start = cut_time
+            self._agreement.forget_until(cut_time)
+        return committed
+
+    def _decode(self, model, inference_lock) -> typing.Optional[list[dict]]:
+        """One pass over the buffer. Returns its words, or None if the model is busy with another job."""
+        if not inference_lock.acquire(timeout=self._pass_interval()): return None # A file transcription holds the model: try again with more audio
+        start = time.time()
+        try:
+            prompt = self._committed_text[-PROMPT_CHARS:].strip()
+            result = model.transcribe(self._audio, initial_prompt=prompt or None, **self.options)
+        finally: inference_lock.release()
+        pass_time = time.time() - start
+        with self._lock: waiting = self._pending_frames / self._input_rate if self._input_rate else 0.0
+        self._stats["passes"] += 1; self._stats["pass_time"] += pass_time; self._stats["max_pass_time"] = max(self._stats["max_pass_time"], pass_time)
+        self._stats["lag_seconds"] = waiting
+        words = []
+        for segment in result.get("segments", []):
+            text = segment.get("text", ""); start = self._audio_start + segment["start"]; end = self._audio_start + segment["end"]
+            pieces = [(match.start(), match.end(), match.group()) for match in _WORDS.finditer(text)]
+            for index, (first, last, word) in enumerate(pieces): # Times spread over the segment by character position
+                words.append({"start": start + (end - start) * first / len(text), "end": start + (end - start) * last / len(text),
+                              "word": word, "segment_end": end if index == len(pieces) - 1 else None})
+        return words
+
+    def _trim(self):
+        """Cuts the buffer at the end of the last fully committed segment once it is long enough."""
+        if len(self._audio) < TRIM_BUFFER_SECONDS * SAMPLE_RATE: return
+        cut = int((self._segment_end - self._audio_start) * SAMPLE_RATE)
+        if cut > 0:
+            self._audio = self._audio[cut:]; self._audio_start += cut / SAMPLE_RATE
+            self._agreement.forget_until(self._audio_start)
+
+    def _publish(self, committed: list[dict]):
+        for word in committed:
+            if word.get("segment_end"): self._segment_end = max(self._segment_end, word["segment_end"])
+        new_text = "".join(word["word"] for word in committed)
+        if not self._committed_text: new_text = new_text.lstrip()
+        self._committed_text += new_text
+        partial = "".join(word["word"] for word in self._agreement.tentative)
+        self.on_update(new_text, partial if self._committed_text else partial.lstrip())
+
+    def _run(self):
+        try:
+            self.on_status("live_status_loading", model=self.model_type)
+            device = self.transcriber.get_device(self.use_gpu, self.system_type)
+            precision = self.transcriber._effective_precision(self.precision, device)
+            model = self.transcriber._get_model(self.model_type, device, precision)
+            inference_lock = model_cache.inference_lock(self.model_type, device, precision, replica=self.transcriber.model_replica)
+            self.on_status("live_status_listening", latency=self.latency)
+            while True:
+                self._wake.wait(self._pass_interval()); self._wake.clear()
+                stopping = self._stopping
+                committed = self._append_input(*self._take_pending(), final=stopping)
+                if stopping and not self._flush_on_stop: break
+                words = self._decode(model, inference_lock) if len(self._audio) >= MIN_PASS_SECONDS * SAMPLE_RATE else None
+                if words is not None: committed += self._agreement.insert(words)
+                elif len(self._audio) >= MIN_PASS_SECONDS * SAMPLE_RATE: self.on_status("live_status_model_busy")
+                if stopping: committed += self._agreement.flush()
+                if committed or words is not None: self._publish(committed)
+                self._trim()
+                if stopping: break
+                if words is not None:
+                    # Passes slower than the target cannot keep up: say so instead of silently lagging
+                    behind = self._stats["lag_seconds"] > self.latency
+                    self.on_status("live_status_behind" if behind else "live_status_listening", latency=self.latency, lag=self._stats["lag_seconds"])
+        except Exception as e:
+            import traceback
+            print(f"LiveTranscriber Error: {e}\n{traceback.format_exc()}", file=sys.__stderr__)
+            self.on_status("live_status_error", error=str(e))
+            return
+        stats = self.stats()
+        print(f"LiveTranscriber: {stats['passes']} passes, {stats['avg_pass_time']:.2f}s average, {stats['skipped_seconds']:.1f}s skipped.")
+        self.on_status("live_status_finished", passes=stats["passes"], skipped=stats["skipped_seconds"])
+
+# --- END OF FILE live_transcriber.py ---
@@ -0,0 +1,241 @@
+# --- START OF FILE model_cache.py ---
+
+import threading
+import time
+import gc
+import sys
+import typing
+from collections import OrderedDict
+
+import torch
+
+from model_store import model_store
+
+DEFAULT_RAM_BUDGET_MB = 8192 # Enough for one 'large' plus a couple of small models
+
+class ModelCache:
+    """
+    Process-wide cache of loaded Whisper models.
+
+    Models are keyed by (model name, device, precision) and stay resident between jobs.
+    When the total size of the resident models exceeds the memory budget, the least
+    recently used models are evicted. Concurrent requests for a model that is still
+    loading wait for that load instead of starting a second one. Models idle for too long
+    are unloaded by the resource watchdog (see resource_watchdog.py).
+    """
+
+    def __init__(self, budget_mb: int = DEFAULT_RAM_BUDGET_MB):
+        self._models: 'OrderedDict[tuple, dict]' = OrderedDict() # key -> {"model", "size_bytes", "load_time", "last_used"}
+        self._loading: dict[tuple, threading.Event] = {} # key -> event set when the load finishes
+        self._inference_locks: dict[tuple, threading.Lock] = {} # key -> lock serializing use of one model instance
+        self._warm: set[tuple] = set() # keys whose model already ran a warm-up pass
+        self._lock = threading.RLock()
+        self.budget_bytes = int(budget_mb) * 1024 * 1024
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_load_time = 0.0
+        self.last_load_time = 0.0
+
+    @staticmethod
+    def make_key(model_name: str, device: typing.Union[str, object], precision: str = "fp32", replica: int = 0) -> tuple:
+        """
+        Builds the cache key. Device objects (e.g. DirectML) are keyed by their string form.
+        Replicas > 0 are extra instances of the same weights, so parallel workers do not
+        serialize on one model's inference lock.
+        """
+        return (model_name, str(device), precision, int(replica))
+
+    @staticmethod
+    def _model_size_bytes(model) -> int:
+        """Approximates the memory held by a model from its state dict (includes int8 packed weights)."""
+        def tensor_bytes(value) -> int:
+            if isinstance(value, torch.Tensor): return value.numel() * value.element_size()
+            if isinstance(value, (tuple, list)): return sum(tensor_bytes(v) for v in value)
+            return 0
+        try:
+            return int(sum(tensor_bytes(value) for value in model.state_dict().values()))
+        except Exception:
+            return 0
+
+    def set_budget_mb(self, budget_mb: int):
+        """Changes the memory budget and evicts models if the new budget is exceeded."""
+        try: budget_mb = int(budget_mb)
+        except (TypeError, ValueError): print(f"ModelCache Warning: invalid budget '{budget_mb}', keeping current.", file=sys.__stderr__); return
+        with self._lock:
+            self.budget_bytes = max(0, budget_mb) * 1024 * 1024
+            self._evict_over_budget()
+
+    def get(self, model_name: str, device: typing.Union[str, object], precision: str = "fp32",
+            loader: typing.Optional[typing.Callable[[], typing.Any]] = None, replica: int = 0):
+        """
+        Returns a resident model, loading it on a miss.
+
+        Args:
+            model_name: Whisper model name ("tiny" ... "large").
+            device: Device string or object the model is moved to.
+            precision: Precision tag, part of the cache key.
+            loader: Optional callable producing the model (defaults to the model store, see model_store.py).
+            replica: Instance number for workers that need their own copy of the model.
+        """
+        key = self.make_key(model_name, device, precision, replica)
+        while True:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    self._models.move_to_end(key) # Mark as most recently used
+                    entry["last_used"] = time.time()
+                    self.hits += 1
+                    return entry["model"]
+                pending = self._loading.get(key)
+                if pending is None:
+                    # Nobody is loading this model: this thread does it
+                    pending = threading.Event()
+                    self._loading[key] = pending
+                    self.misses += 1
+                    break
+            # Another thread is loading the same model: wait for it, then re-check the cache
+            pending.wait()
+
+        try:
+            start = time.time()
+            model = loader() if loader else model_store.load_model(model_name, device)
+            load_time = time.time() - start
+            with self._lock:
+                self._models[key] = {"model": model, "size_bytes": self._model_size_bytes(model), "load_time": load_time, "last_used": time.time()}
+                self.total_load_time += load_time
+                self.last_load_time = load_time
+                self._evict_over_budget(keep_key=key)
+            return model
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending.set()
+
+    def is_loaded(self, model_name: str, device: typing.Union[str, object], precision: str = "fp32", replica: int = 0) -> bool:
+        with self._lock:
+            return self.make_key(model_name, device, precision, replica) in self._models
+
+    def is_loading(self, model_name: str, device: typing.Union[str, object], precision: str = "fp32", replica: int = 0) -> bool:
+        with self._lock:
+            return self.make_key(model_name, device, precision, replica) in self._loading
+
+    def inference_lock(self, model_name: str, device: typing.Union[str, object], precision: str = "fp32", replica: int = 0) -> threading.Lock:
+        """
+        Returns the lock guarding one model instance.
+
+        Whisper installs per-call hooks on the decoder for its KV cache, so two decodes must
+        not run on the same instance at once (e.g. a warm-up pass and a user job).
+        """
+        key = self.make_key(model_name, device, precision, replica)
+        with self._lock:
+            return self._inference_locks.setdefault(key, threading.Lock())
+
+    def is_warm(self, model_name: str, device: typing.Union[str, object], precision: str = "fp32", replica: int = 0) -> bool:
+        with self._lock:
+            return self.make_key(model_name, device, precision, replica) in self._warm
+
+    def mark_warm(self, model_name: str, device: typing.Union[str, object], precision: str = "fp32", replica: int = 0):
+        key = self.make_key(model_name, device, precision, replica)
+        with self._lock:
+            if key in self._models: self._warm.add(key)
+
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(e["size_bytes"] for e in self._models.values())
+
+    def _evict_over_budget(self, keep_key: typing.Optional[tuple] = None):
+        """
+        Evicts least recently used models until the budget is respected (caller holds the lock).
+        Models decoding right now are skipped: their memory stays in use until the decode ends anyway.
+        """
+        evicted = False
+        while self._models and self.resident_bytes() > self.budget_bytes:
+            oldest_key = next((key for key in self._models if key != keep_key and not self._in_use(key)), None)
+            if oldest_key is None: break # Only the model just loaded and models in use are left: they stay over budget
+            entry = self._models.pop(oldest_key)
+            self._warm.discard(oldest_key)
+            self.evictions += 1; evicted = True
+            print(f"ModelCache: Evicted {oldest_key[0]} ({oldest_key[1]}, {oldest_key[2]}, {entry['size_bytes'] / 2**20:.0f} MB).")
+            del entry
+        if evicted: self.release_memory()
+
+    def evict(self, model_name: str, device: typing.Union[str, object], precision: str = "fp32", replica: int = 0) -> bool:
+        """Removes one model from the cache. Returns True if it was resident."""
+        with self._lock:
+            key = self.make_key(model_name, device, precision, replica)
+            entry = self._models.pop(key, None)
+            if entry is None: return False
+            self._warm.discard(key)
+            self.evictions += 1
+        del entry
+        self.release_memory()
+        return True
+
+    def _in_use(self, key: tuple) -> bool:
+        """True while a decode holds the model's inference lock (caller holds the cache lock)."""
+        lock = self._inference_locks.get(key)
+        return lock is not None and lock.locked()
+
+    def evict_idle(self, idle_seconds: float) -> list[tuple]:
+        """
+        Unloads the models not used for idle_seconds. A model seen decoding counts as used at
+        that moment, so the idle time of a long job starts when it ends. Returns the evicted keys.
+        """
+        now = time.time(); evicted = []
+        with self._lock:
+            for key, entry in list(self._models.items()):
+                if self._in_use(key): entry["last_used"] = now; continue
+                if now - entry["last_used"] >= idle_seconds:
+                    self._models.pop(key); self._warm.discard(key)
+                    self.evictions += 1; evicted.append(key)
+        if evicted: self.release_memory()
+        return evicted
+
+    def evict_least_recent_unused(self) -> typing.Optional[tuple]:
+        """Unloads the least recently used model that is not decoding. Returns its key, or None."""
+        with self._lock:
+            key = next((key for key in self._models if not self._in_use(key)), None)
+            if key is None: return None
+            self._models.pop(key); self._warm.discard(key)
+            self.evictions += 1
+        self.release_memory()
+        return key
+
+    def clear(self):
+        """Drops every resident model."""
+        with self._lock:
+            count = len(self._models)
+            self._models.clear()
+            self._warm.clear()
+            self.evictions += count
+        if count: self.release_memory()
+
+    @staticmethod
+    def release_memory():
+        """Collects unreferenced objects and returns cached CUDA blocks to the driver."""
+        gc.collect()
+        if torch.cuda.is_available():
+            try: torch.cuda.empty_cache()
+            except Exception as e: print(f"ModelCache Warning: empty_cache failed - {e}", file=sys.__stderr__)
+
+    def stats(self) -> dict:
+        """Returns hit/miss/load-time counters and the resident models."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "total_load_time": self.total_load_time,
+                "last_load_time": self.last_load_time,
+                "resident_mb": self.resident_bytes() / 2**20,
+                "budget_mb": self.budget_bytes / 2**20,
+                "models": [list(k) for k in self._models],
+                "warm": [list(k) for k in self._warm],
+            }
+
+# Single cache shared by every AudioTranscriber in the process
+model_cache = ModelCache()
+
+# --- END OF FILE model_cache.py ---
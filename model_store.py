@@ -0,0 +1,241 @@
+# --- START OF FILE model_store.py ---
+"""
+Local store of Whisper models, converted once for fast, shared loading.
+
+Each model lives in <store>/<name>/:
+    weights.pt     fp32 state dict, one storage per tensor (torch zip format, memory-mappable)
+    manifest.json  model dimensions, alignment heads, size and SHA-256 of weights.pt,
+                   SHA-256 of the checkpoint it was converted from
+
+Loading memory-maps weights.pt and assigns the mapped tensors to a model built without
+allocating weights, so there is no deserialization, no fp16 -> fp32 copy and no private
+copy of the weights: processes loading the same model share the OS page cache. Models
+missing from the store are converted from Whisper's download cache, downloaded (checksum
+verified), or imported from a checkpoint file; in offline mode nothing is downloaded.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import inspect
+import threading
+import itertools
+import typing
+
+import numpy as np
+import torch
+import whisper
+from whisper.model import Whisper, ModelDimensions, AudioEncoder, TextDecoder
+
+MODEL_STORE_DIR = "models" # Created next to config.json
+STORE_FORMAT_VERSION = 1 # Bump when the converted format changes: stored models are converted again
+WEIGHTS_FILE = "weights.pt"
+MANIFEST_FILE = "manifest.json"
+HASH_CHUNK_BYTES = 8 * 2**20
+MMAP_SUPPORTED = "mmap" in inspect.signature(torch.load).parameters # torch >= 2.1
+ASSIGN_SUPPORTED = "assign" in inspect.signature(torch.nn.Module.load_state_dict).parameters # torch >= 2.1
+
+
+class ModelStoreError(RuntimeError):
+    """A model is not in the store and cannot be obtained (offline, bad checksum, unknown name)."""
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_BYTES), b""): digest.update(block)
+    return digest.hexdigest()
+
+
+def _whisper_download_root() -> str:
+    """Where whisper.load_model keeps its downloads (~/.cache/whisper)."""
+    return os.path.join(os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "whisper")
+
+
+class ModelStore:
+    """
+    Managed directory of converted Whisper models.
+
+    Integrity: weights.pt is hashed when written and re-hashed whenever its size or
+    modification time differ from the last verification, so an unchanged file is trusted
+    without reading 3 GB on every load; verify(full=True) always re-hashes. A model that
+    fails verification is converted again (or reported when offline).
+    """
+
+    def __init__(self, store_dir: str = MODEL_STORE_DIR, offline: bool = False):
+        self.store_dir = store_dir
+        self.offline = offline
+        self.loads = 0; self.installs = 0; self.last_load_time = 0.0
+        self._install_lock = threading.Lock() # One conversion at a time (replicas or devices of the same model may miss together)
+
+    def configure(self, store_dir: typing.Optional[str] = None, offline: typing.Optional[bool] = None):
+        if store_dir: self.store_dir = os.path.expanduser(store_dir)
+        if offline is not None: self.offline = bool(offline)
+
+    def settings(self) -> dict:
+        """Arguments for configure(), e.g. to pass the same store to spawned worker processes."""
+        return {"store_dir": self.store_dir, "offline": self.offline}
+
+    def model_dir(self, name: str) -> str:
+        return os.path.join(self.store_dir, name)
+
+    def manifest(self, name: str) -> typing.Optional[dict]:
+        """The manifest of an installed model of the current format, or None."""
+        try:
+            with open(os.path.join(self.model_dir(name), MANIFEST_FILE), 'r', encoding='utf-8') as f: manifest = json.load(f)
+        except FileNotFoundError: return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"ModelStore Warning: unreadable manifest for '{name}' - {e}", file=sys.__stderr__); return None
+        return manifest if manifest.get("version") == STORE_FORMAT_VERSION else None
+
+    def _write_manifest(self, name: str, manifest: dict):
+        path = os.path.join(self.model_dir(name), MANIFEST_FILE); tmp_file = f"{path}.tmp{os.getpid()}"
+        with open(tmp_file, 'w', encoding='utf-8') as f: json.dump(manifest, f, indent=2)
+        os.replace(tmp_file, path)
+
+    def installed(self) -> list[dict]:
+        try: names = sorted(os.listdir(self.store_dir))
+        except OSError: return []
+        return [manifest for manifest in (self.manifest(name) for name in names) if manifest]
+
+    def verify(self, name: str, full: bool = False) -> bool:
+        """True if weights.pt matches its manifest (see the class docstring for when it is re-hashed)."""
+        manifest = self.manifest(name)
+        if manifest is None: return False
+        path = os.path.join(self.model_dir(name), WEIGHTS_FILE)
+        try: stat = os.stat(path)
+        except OSError: return False
+        if stat.st_size != manifest["size"]: return False
+        if not full and stat.st_mtime_ns == manifest.get("verified_mtime_ns"): return True
+        if _sha256(path) != manifest["sha256"]: return False
+        if manifest.get("verified_mtime_ns") != stat.st_mtime_ns:
+            manifest["verified_mtime_ns"] = stat.st_mtime_ns
+            try: self._write_manifest(name, manifest)
+            except OSError: pass # Read-only store: verified again next time
+        return True
+
+    def _source_checkpoint(self, name: str, log: typing.Callable[[str], None]) -> tuple[str, str, bool]:
+        """
+        Finds the original checkpoint of an official model: Whisper's download cache, else a download
+        unless offline. Returns (path, sha256, downloaded); downloaded files are deleted after conversion.
+        """
+        if name not in whisper._MODELS: raise ModelStoreError(f"Unknown model '{name}' (available: {', '.join(whisper.available_models())}).")
+        url = whisper._MODELS[name]; expected_sha256 = url.split("/")[-2] # Whisper's URLs carry the checkpoint's SHA-256
+        cached = os.path.join(_whisper_download_root(), os.path.basename(url))
+        if os.path.isfile(cached):
+            if _sha256(cached) == expected_sha256: return cached, expected_sha256, False
+            print(f"ModelStore Warning: {cached} does not match its checksum, ignoring it.", file=sys.__stderr__)
+        if self.offline:
+            raise ModelStoreError(f"Model '{name}' is not in the model store ({os.path.abspath(self.store_dir)}) and offline mode is on. "
+                                  f"Install it with 'python -m audioscript models install {name}' on a connected machine and copy the folder.")
+        log(f"Downloading Whisper model '{name}'...\n")
+        download_dir = os.path.join(self.store_dir, ".downloads")
+        path = whisper._download(url, download_dir, False) # Raises if the downloaded file does not match the checksum
+        return path, expected_sha256, True
+
+    def install(self, name: str, source: str = "", log: typing.Optional[typing.Callable[[str], None]] = None) -> dict:
+        """
+        Converts a model into the store and returns its manifest. source: checkpoint file to import
+        (official models are found or downloaded when it is empty).
+        """
+        log = log or (lambda message: print(message, end=""))
+        start = time.time()
+        if source:
+            if not os.path.isfile(source): raise ModelStoreError(f"Checkpoint file '{source}' not found.")
+            source_sha256 = _sha256(source); downloaded = False
+        else: source, source_sha256, downloaded = self._source_checkpoint(name, log)
+
+        model_dir = self.model_dir(name)
+        os.makedirs(model_dir, exist_ok=True)
+        weights_path = os.path.join(model_dir, WEIGHTS_FILE); tmp_file = f"{weights_path}.tmp{os.getpid()}"
+        try:
+            checkpoint = torch.load(source, map_location="cpu", weights_only=True, **({"mmap": True} if MMAP_SUPPORTED else {}))
+            dims = dict(checkpoint["dims"]); state_dict = checkpoint.pop("model_state_dict"); del checkpoint
+            for key in list(state_dict): # One fp32 copy at a time, each in its own storage so it can be mapped alone
+                tensor = state_dict.pop(key)
+                state_dict[key] = tensor.to(torch.float32, copy=True).contiguous() if tensor.is_floating_point() else tensor.clone()
+            torch.save(state_dict, tmp_file)
+            del state_dict
+            official = name in whisper._MODELS and source_sha256 == whisper._MODELS[name].split("/")[-2]
+            alignment_heads = whisper._ALIGNMENT_HEADS[name] if official else None # Known for the official checkpoints only
+            sha256 = _sha256(tmp_file)
+            os.replace(tmp_file, weights_path)
+            stat = os.stat(weights_path)
+            manifest = {"version": STORE_FORMAT_VERSION, "name": name, "dims": dims,
+                        "alignment_heads": alignment_heads.decode("ascii") if alignment_heads else None,
+                        "size": stat.st_size, "sha256": sha256, "source_sha256": source_sha256,
+                        "installed_at": time.time(), "verified_mtime_ns": stat.st_mtime_ns}
+            self._write_manifest(name, manifest)
+        finally:
+            if os.path.exists(tmp_file): os.remove(tmp_file)
+            if downloaded:
+                try: os.remove(source)
+                except OSError: pass
+        self.installs += 1
+        log(f"Model '{name}' added to the model store ({manifest['size'] / 2**20:.0f} MB, {time.time() - start:.1f}s).\n")
+        return manifest
+
+    def ensure(self, name: str, log: typing.Optional[typing.Callable[[str], None]] = None) -> dict:
+        """Returns the manifest of a verified model, installing (or repairing) it first if needed."""
+        if self.verify(name): return self.manifest(name)
+        with self._install_lock:
+            if self.verify(name): return self.manifest(name) # Installed by another thread meanwhile
+            if self.manifest(name) is not None:
+                print(f"ModelStore Warning: '{name}' in {self.store_dir} failed its checksum, converting it again.", file=sys.__stderr__)
+            return self.install(name, log=log)
+
+    def remove(self, name: str) -> bool:
+        model_dir = self.model_dir(name)
+        if not os.path.isdir(model_dir): return False
+        shutil.rmtree(model_dir, ignore_errors=True)
+        return True
+
+    @staticmethod
+    def _build(manifest: dict, state_dict: dict) -> Whisper:
+        """Builds the model around the (mapped) tensors; falls back to a regular copy on older torch versions."""
+        dims = ModelDimensions(**manifest["dims"])
+        model = None
+        if ASSIGN_SUPPORTED:
+            try:
+                with torch.device("meta"): # No weight allocation nor random init
+                    encoder = AudioEncoder(dims.n_mels, dims.n_audio_ctx, dims.n_audio_state, dims.n_audio_head, dims.n_audio_layer)
+                    decoder = TextDecoder(dims.n_vocab, dims.n_text_ctx, dims.n_text_state, dims.n_text_head, dims.n_text_layer)
+                # Whisper.__init__ would build its own submodules (and to_sparse has no meta kernel): assemble it instead
+                model = Whisper.__new__(Whisper); torch.nn.Module.__init__(model)
+                model.dims = dims; model.encoder = encoder; model.decoder = decoder
+                model.load_state_dict(state_dict, assign=True)
+                # Non-persistent buffers are not in the state dict: rebuild them as Whisper.__init__ does
+                model.decoder.register_buffer("mask", torch.empty(dims.n_text_ctx, dims.n_text_ctx).fill_(-np.inf).triu_(1), persistent=False)
+                all_heads = torch.zeros(dims.n_text_layer, dims.n_text_head, dtype=torch.bool); all_heads[dims.n_text_layer // 2:] = True
+                model.register_buffer("alignment_heads", all_heads.to_sparse(), persistent=False)
+                if any(tensor.is_meta for tensor in itertools.chain(model.parameters(), model.buffers())): model = None # Unknown Whisper version
+            except (TypeError, RuntimeError) as e:
+                print(f"ModelStore Warning: zero-copy load not possible ({e}), copying the weights.", file=sys.__stderr__); model = None
+        if model is None:
+            model = Whisper(dims); model.load_state_dict(state_dict)
+        if manifest.get("alignment_heads"): model.set_alignment_heads(manifest["alignment_heads"].encode("ascii"))
+        return model
+
+    def load_model(self, name: str, device: typing.Union[str, object] = "cpu", log: typing.Optional[typing.Callable[[str], None]] = None) -> Whisper:
+        """Drop-in for whisper.load_model(name, device=device) backed by the store."""
+        manifest = self.ensure(name, log)
+        start = time.time()
+        state_dict = torch.load(os.path.join(self.model_dir(name), WEIGHTS_FILE), map_location="cpu", weights_only=True,
+                                **({"mmap": True} if MMAP_SUPPORTED else {}))
+        model = self._build(manifest, state_dict).to(device) # On CPU the weights stay mapped; other devices copy from the page cache
+        self.loads += 1; self.last_load_time = time.time() - start
+        return model
+
+    def stats(self) -> dict:
+        installed = self.installed()
+        return {"store_dir": os.path.abspath(self.store_dir), "offline": self.offline, "mmap": MMAP_SUPPORTED,
+                "models": [manifest["name"] for manifest in installed], "size_mb": round(sum(m["size"] for m in installed) / 2**20, 1),
+                "loads": self.loads, "installs": self.installs, "last_load_time": self.last_load_time}
+
+# Single store shared by every model load in the process
+model_store = ModelStore()
+
+# --- END OF FILE model_store.py ---
@@ -0,0 +1,179 @@
+# --- START OF FILE parallel_transcriber.py ---
+
+import os
+import time
+import typing
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+SAMPLE_RATE = 16000 # Whisper input rate
+FRAME_SECONDS = 0.02 # Energy frame for silence search
+SMOOTHING_FRAMES = 10 # 200 ms: a short dip inside a word must not win over a real pause
+DEFAULT_CHUNK_SECONDS = 300 # Target chunk length
+SPLIT_SEARCH_SECONDS = 15 # How far around each target point to look for the quietest spot
+OVERLAP_SECONDS = 1.0 # Audio shared by neighbouring chunks, removed again when stitching
+
+
+def find_silence_splits(audio: np.ndarray, chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+                        search_seconds: float = SPLIT_SEARCH_SECONDS) -> list[int]:
+    """
+    Returns the sample positions where the audio should be cut.
+
+    Near every multiple of chunk_seconds, the quietest point (smoothed RMS energy) within
+    +/- search_seconds is chosen. A short tail is merged into the last chunk.
+    """
+    frame = int(SAMPLE_RATE * FRAME_SECONDS)
+    n_frames = len(audio) // frame
+    if n_frames == 0: return []
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    energy = np.sqrt(np.mean(frames * frames, axis=1))
+    smoothed = np.convolve(energy, np.ones(SMOOTHING_FRAMES) / SMOOTHING_FRAMES, mode="same")
+
+    chunk_frames = int(chunk_seconds / FRAME_SECONDS)
+    search_frames = int(search_seconds / FRAME_SECONDS)
+    splits: list[int] = []
+    previous = 0; target = chunk_frames
+    while n_frames - target > chunk_frames // 2:
+        low = max(target - search_frames, previous + 1)
+        high = min(target + search_frames, n_frames)
+        best = low + int(np.argmin(smoothed[low:high]))
+        splits.append(best * frame)
+        previous = best; target = best + chunk_frames
+    return splits
+
+
+# --- Worker process side ---
+# Each worker process loads its own model once (pool initializer) and keeps it for all its chunks.
+_worker_model = None
+
+class _ChunkCancelled(Exception):
+    """Raised inside a worker's forward pass when the parent requested a stop."""
+
+def _init_worker(model_type: str, threads: int, stop_event, precision: str = "fp32", store_settings: typing.Optional[dict] = None):
+    global _worker_model
+    import torch
+    torch.set_num_threads(max(1, threads)) # Split the cores between workers instead of oversubscribing
+    from model_store import model_store
+    model_store.configure(**(store_settings or {})) # Same store as the parent: the workers map the same weights file
+    from model_cache import model_cache
+    from quantization import PRECISION_INT8, load_quantized_model
+    loader = (lambda: load_quantized_model(model_type, log=lambda message: None)) if precision == PRECISION_INT8 else None
+    _worker_model = model_cache.get(model_type, "cpu", precision, loader=loader)
+
+    def check_stop(module, inputs):
+        if stop_event.is_set(): raise _ChunkCancelled()
+    _worker_model.encoder.register_forward_pre_hook(check_stop)
+    _worker_model.decoder.register_forward_pre_hook(check_stop)
+
+def _transcribe_chunk(index: int, chunk: np.ndarray, offset_seconds: float, options: dict) -> tuple[int, typing.Optional[list[dict]]]:
+    """Decodes one chunk. Returns (index, segments) with times on the original timeline, or (index, None) if cancelled."""
+    try: result = _worker_model.transcribe(chunk, **options)
+    except _ChunkCancelled: return index, None
+    segments = []
+    for segment in result.get("segments", []):
+        text = segment.get("text", "").strip()
+        if not text: continue
+        segments.append({
+            "start": offset_seconds + segment["start"],
+            "end": offset_seconds + segment["end"],
+            "text": text,
+            "avg_logprob": segment.get("avg_logprob"),
+            "compression_ratio": segment.get("compression_ratio"),
+            "no_speech_prob": segment.get("no_speech_prob"),
+        })
+    return index, segments
+
+
+# --- Parent side ---
+class ParallelTranscriber:
+    """
+    Transcribes long audio by splitting it at silences and decoding the chunks in a pool of
+    worker processes, each holding its own model. Results are stitched back in timestamp
+    order; segments from the overlap between chunks are kept only by the chunk that owns
+    their midpoint.
+    """
+
+    def __init__(self, model_type: str, workers: int, stop_check: typing.Optional[typing.Callable[[], bool]] = None,
+                 chunk_seconds: float = DEFAULT_CHUNK_SECONDS, precision: str = "fp32"):
+        self.model_type = model_type
+        self.precision = precision
+        self.workers = max(1, int(workers))
+        self.stop_check = stop_check or (lambda: False)
+        self.chunk_seconds = chunk_seconds
+
+    def _plan_chunks(self, audio: np.ndarray) -> list[dict]:
+        """Chunk boundaries: 'own' is the range whose segments this chunk keeps, 'read' adds the overlap."""
+        bounds = [0] + find_silence_splits(audio, self.chunk_seconds) + [len(audio)]
+        overlap = int(OVERLAP_SECONDS * SAMPLE_RATE)
+        chunks = []
+        for index, (own_start, own_end) in enumerate(zip(bounds[:-1], bounds[1:])):
+            read_start = max(0, own_start - overlap); read_end = min(len(audio), own_end + overlap)
+            chunks.append({"index": index, "own_start": own_start / SAMPLE_RATE, "own_end": own_end / SAMPLE_RATE,
+                           "read_start": read_start, "read_end": read_end})
+        return chunks
+
+    @staticmethod
+    def _stitch(chunk: dict, segments: list[dict], previous: typing.Optional[dict]) -> list[dict]:
+        """Keeps the segments whose midpoint falls in the chunk's own range and drops repeats of the previous segment."""
+        kept = []
+        for segment in segments:
+            midpoint = (segment["start"] + segment["end"]) / 2
+            if not chunk["own_start"] <= midpoint < chunk["own_end"]: continue
+            last = kept[-1] if kept else previous
+            if last and segment["text"] == last["text"] and segment["start"] < last["end"] + OVERLAP_SECONDS: continue
+            kept.append(segment)
+        return kept
+
+    def transcribe(self, audio: np.ndarray, options: dict,
+                   segment_callback: typing.Optional[typing.Callable[[dict], None]] = None,
+                   progress_callback: typing.Optional[typing.Callable[[float, float], None]] = None,
+                   log_callback: typing.Optional[typing.Callable[[str], None]] = None) -> list[dict]:
+        """
+        Decodes the audio and returns the stitched segments (only the in-order prefix if stopped).
+        Segments are passed to segment_callback in timestamp order as soon as all earlier chunks are done.
+        """
+        log = log_callback or (lambda message: print(message, end=""))
+        chunks = self._plan_chunks(audio)
+        workers = min(self.workers, len(chunks))
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        log(f"Parallel transcription: {len(chunks)} chunks split at silences, {workers} worker processes x {threads} threads.\n")
+
+        from model_store import model_store
+        context = multiprocessing.get_context("spawn") # fork is unsafe with an initialized torch runtime
+        stop_event = context.Event()
+        results: dict[int, typing.Optional[list[dict]]] = {}
+        stitched: list[dict] = []
+        next_index = 0; audio_done = 0.0; total_seconds = len(audio) / SAMPLE_RATE
+        start_time = time.time()
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                                       initargs=(self.model_type, threads, stop_event, self.precision, model_store.settings()))
+        try:
+            pending = {executor.submit(_transcribe_chunk, c["index"], audio[c["read_start"]:c["read_end"]],
+                                       c["read_start"] / SAMPLE_RATE, options) for c in chunks}
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled(): continue
+                    index, segments = future.result()
+                    results[index] = segments
+                    if segments is not None: audio_done += chunks[index]["own_end"] - chunks[index]["own_start"]
+                # Emit every chunk whose predecessors are all done, in order
+                while next_index in results and results[next_index] is not None:
+                    new_segments = self._stitch(chunks[next_index], results[next_index], stitched[-1] if stitched else None)
+                    stitched.extend(new_segments)
+                    if segment_callback:
+                        for segment in new_segments: segment_callback(segment)
+                    next_index += 1
+                if progress_callback: progress_callback(audio_done, total_seconds)
+                if self.stop_check() and not stop_event.is_set():
+                    stop_event.set() # Running chunks abort at their next forward step
+                    for future in pending: future.cancel()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        elapsed = time.time() - start_time
+        log(f"Parallel transcription: {next_index}/{len(chunks)} chunks in {elapsed:.1f}s ({audio_done / elapsed if elapsed > 0 else 0.0:.1f}x real time).\n")
+        return stitched
+
+# --- END OF FILE parallel_transcriber.py ---
@@ -0,0 +1,125 @@
+# --- START OF FILE quantization.py ---
+"""
+Int8 dynamic quantization of Whisper models for CPU inference.
+
+The Linear layers (attention projections and MLPs, most of the compute) get int8 weights
+and dynamically quantized activations; convolutions, embeddings and layer norms stay fp32.
+The converted model is saved in the model store next to the fp32 weights it came from, so
+only the first load pays for the conversion.
+"""
+
+import os
+import sys
+import glob
+import time
+import warnings
+import typing
+
+import numpy as np
+import torch
+import whisper
+
+from model_store import model_store
+
+PRECISION_FP32 = "fp32"
+PRECISION_INT8 = "int8"
+PRECISIONS = [PRECISION_FP32, PRECISION_INT8]
+QUANTIZED_FORMAT_VERSION = 1 # Part of the file name: bump to force a reconversion
+
+
+def quantized_cache_path(model_type: str, weights_sha256: str) -> str:
+    """
+    <model store>/<model>/int8-v1-<SHA-256 prefix of weights.pt>.pt: a checkpoint imported or
+    downloaded again gets its own int8 file instead of the one converted from the old weights.
+    """
+    return os.path.join(model_store.model_dir(model_type), f"{PRECISION_INT8}-v{QUANTIZED_FORMAT_VERSION}-{weights_sha256[:16]}.pt")
+
+
+def quantize_model(model):
+    """Quantizes the model's Linear layers to int8 in place and returns it (CPU only)."""
+    model = model.cpu().eval()
+    # whisper.model.Linear only adds a dtype cast to nn.Linear; torch's quantizer accepts the exact
+    # nn.Linear type only, so the subclass is dropped first (same parameters, no copy).
+    for module in model.modules():
+        if type(module) is whisper.model.Linear: module.__class__ = torch.nn.Linear
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning) # torch.ao.quantization deprecation notice
+        torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    return model
+
+
+def load_quantized_model(model_type: str, log: typing.Optional[typing.Callable[[str], None]] = None):
+    """
+    Returns the int8 model, loading it from the on-disk cache or converting the fp32
+    checkpoint (and saving the result) on first use.
+    """
+    log = log or (lambda message: print(message, end=""))
+    manifest = model_store.ensure(model_type, log) # Store folder and offline mode apply to int8 too
+    path = quantized_cache_path(model_type, manifest["sha256"])
+    if os.path.exists(path):
+        try:
+            start = time.time()
+            model = torch.load(path, map_location="cpu", weights_only=False) # Locally generated file (see below)
+            log(f"Loaded int8 '{model_type}' from {path} in {time.time() - start:.1f}s.\n")
+            return model
+        except Exception as e:
+            print(f"Quantization Warning: cached model {path} unusable ({e}), converting again.", file=sys.__stderr__)
+
+    start = time.time()
+    model = quantize_model(model_store.load_model(model_type, "cpu", log=log))
+    log(f"Converted '{model_type}' to int8 in {time.time() - start:.1f}s.\n")
+    tmp_file = f"{path}.tmp{os.getpid()}"
+    try:
+        torch.save(model, tmp_file)
+        os.replace(tmp_file, path)
+        log(f"Saved int8 model to {path} ({os.path.getsize(path) / 2**20:.0f} MB).\n")
+        for stale in glob.glob(os.path.join(os.path.dirname(path), f"{PRECISION_INT8}-v*.pt")): # Converted from earlier weights or formats
+            if stale != path: os.remove(stale)
+    except OSError as e:
+        print(f"Quantization Warning: could not save {path} - {e}", file=sys.__stderr__)
+    return model
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level edit distance divided by the reference length."""
+    ref = reference.lower().split(); hyp = hypothesis.lower().split()
+    if not ref: return 0.0 if not hyp else 1.0
+    previous = np.arange(len(hyp) + 1)
+    for i, ref_word in enumerate(ref, start=1):
+        current = np.empty_like(previous); current[0] = i
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref_word != hyp_word))
+        previous = current
+    return float(previous[-1]) / len(ref)
+
+
+def compare_precisions(audio: np.ndarray, model_type: str, language: str,
+                       log: typing.Optional[typing.Callable[[str], None]] = None) -> dict:
+    """
+    Transcribes the same audio with the fp32 and the int8 model on CPU and reports load time,
+    decode time, real-time factor and the int8 word error rate against the fp32 text.
+    """
+    from model_cache import model_cache
+    log = log or (lambda message: print(message, end=""))
+    duration = len(audio) / whisper.audio.SAMPLE_RATE
+    report: dict = {"model": model_type, "language": language, "audio_seconds": round(duration, 2), "threads": torch.get_num_threads()}
+    texts = {}
+    for precision in PRECISIONS:
+        start = time.time()
+        loader = (lambda: load_quantized_model(model_type, log)) if precision == PRECISION_INT8 else None
+        model = model_cache.get(model_type, "cpu", precision, loader=loader)
+        load_time = time.time() - start
+        with model_cache.inference_lock(model_type, "cpu", precision):
+            model.transcribe(audio[:whisper.audio.N_SAMPLES], language=language, fp16=False, verbose=None) # Warm-up
+            start = time.time()
+            texts[precision] = model.transcribe(audio, language=language, fp16=False, verbose=None, temperature=0.0)["text"].strip()
+            decode_time = time.time() - start
+        report[precision] = {"load_time": round(load_time, 2), "decode_time": round(decode_time, 2),
+                             "rtf": round(decode_time / duration, 4) if duration else None,
+                             "model_mb": round(model_cache._model_size_bytes(model) / 2**20, 1)}
+        log(f"{precision}: decoded {duration:.0f}s of audio in {decode_time:.1f}s.\n")
+    report["speedup"] = round(report[PRECISION_FP32]["decode_time"] / report[PRECISION_INT8]["decode_time"], 2) if report[PRECISION_INT8]["decode_time"] else None
+    report["int8_wer_vs_fp32"] = round(word_error_rate(texts[PRECISION_FP32], texts[PRECISION_INT8]), 4)
+    return report
+
+# --- END OF FILE quantization.py ---
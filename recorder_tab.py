@@ -1,7 +1,7 @@
 # --- START OF REVISED recorder_tab.py ---
 
 import tkinter as tk
-from tkinter import ttk, simpledialog, messagebox, filedialog
+from tkinter import ttk, simpledialog, messagebox, filedialog, scrolledtext
 import numpy as np
 import threading
 import queue
@@ -12,6 +12,7 @@ import math
 import typing # Added for type hinting
 
 from audio_handler import AudioHandler
+from live_transcriber import LiveTranscriber, LATENCY_CHOICES, DEFAULT_LATENCY_SECONDS
 
 # Added for type hinting gui_app
 if typing.TYPE_CHECKING:
@@ -31,6 +32,7 @@ class RecorderTab:
     WAVEFORM_COLOR = 'cornflowerblue'
     CENTER_LINE_COLOR = 'red'
     SILENCE_LINE_COLOR = '#aaaaaa'
+    PARTIAL_TEXT_COLOR = '#888888'
 
     # Audio Parameter Options
     SAMPLE_RATES = [8000, 16000, 22050, 44100, 48000] # Common rates
@@ -67,6 +69,12 @@ class RecorderTab:
         default_channel_str = self.CHANNELS_MAP_REV.get(AudioHandler.DEFAULT_CHANNELS, "Mono")
         self.selected_channels_str = tk.StringVar(value=default_channel_str)
 
+        # Live transcription while recording
+        self.live_var = tk.BooleanVar(value=self.gui_app.loaded_config.get("live_transcription", False))
+        self.live_latency_var = tk.StringVar(value=f"{float(self.gui_app.loaded_config.get('live_latency_seconds', DEFAULT_LATENCY_SECONDS)):g}")
+        self.live_status_var = tk.StringVar(value="")
+        self.live_transcriber: typing.Optional[LiveTranscriber] = None
+
         # Initialize AudioHandler with defaults
         self.audio_handler = AudioHandler(
             status_callback=self.update_status, # Use local method
@@ -82,6 +90,7 @@ class RecorderTab:
         # self.frame.grid(row=0, column=0, sticky="nsew") # Frame is added to notebook, no grid needed here
         self.frame.columnconfigure(0, weight=1)
         self.frame.rowconfigure(2, weight=1) # Make canvas row expand
+        self.frame.rowconfigure(3, weight=1) # Live transcript shares the extra height
 
         self._create_widgets() # Call helper to create widgets
 
@@ -132,6 +141,13 @@ class RecorderTab:
         self.ch_combo.pack(side=tk.LEFT, padx=5)
         self.ch_combo.bind("<<ComboboxSelected>>", self._on_settings_changed)
 
+        self.live_check = ttk.Checkbutton(self.options_frame, text="", variable=self.live_var) # TEXT REMOVED
+        self.live_check.pack(side=tk.LEFT, padx=(15, 5))
+        self.live_latency_label = ttk.Label(self.options_frame, text="") # TEXT REMOVED
+        self.live_latency_label.pack(side=tk.LEFT, padx=(5, 5))
+        self.live_latency_combo = ttk.Combobox(self.options_frame, textvariable=self.live_latency_var, values=[f"{choice:g}" for choice in LATENCY_CHOICES], width=4, state='readonly')
+        self.live_latency_combo.pack(side=tk.LEFT, padx=5)
+
         # Time Display Label
         self.time_label = ttk.Label(self.options_frame, text="...", font=("Segoe UI", 10, "bold")) # Placeholder text
         self.time_label.pack(side=tk.RIGHT, padx=(10, 0))
@@ -150,6 +166,16 @@ class RecorderTab:
         self.canvas_height = 0
         self._static_elements_drawn = False
 
+        # --- Live Transcript Frame ---
+        self.live_frame = ttk.LabelFrame(self.frame, text="", padding=(10, 5)) # TEXT REMOVED
+        self.live_frame.grid(row=3, column=0, sticky="nsew", pady=(10, 0))
+        self.live_frame.columnconfigure(0, weight=1); self.live_frame.rowconfigure(0, weight=1)
+        self.live_text = scrolledtext.ScrolledText(self.live_frame, wrap=tk.WORD, height=6, font=("Segoe UI", 11), state=tk.DISABLED)
+        self.live_text.grid(row=0, column=0, sticky="nsew")
+        self.live_text.tag_configure("partial", foreground=self.PARTIAL_TEXT_COLOR)
+        self.live_status_label = ttk.Label(self.live_frame, textvariable=self.live_status_var, anchor=tk.W)
+        self.live_status_label.grid(row=1, column=0, sticky="ew", pady=(5, 0))
+
 
     def _initial_canvas_setup(self):
         """Perform initial canvas setup after widgets are mapped."""
@@ -193,6 +219,11 @@ class RecorderTab:
                       self.sr_label.config(text=self.gui_app.translate("sample_rate_label"))
                  if hasattr(self, 'ch_label') and self.ch_label.winfo_exists():
                       self.ch_label.config(text=self.gui_app.translate("channels_label"))
+                 self.live_check.config(text=self.gui_app.translate("live_transcription_check"))
+                 self.live_latency_label.config(text=self.gui_app.translate("live_latency_label"))
+
+            if hasattr(self, 'live_frame') and self.live_frame.winfo_exists():
+                 self.live_frame.config(text=self.gui_app.translate("live_transcript_frame"))
 
             # Update status if "Ready" or empty
             current_status = self.status_text.get()
@@ -334,6 +365,7 @@ class RecorderTab:
             def stop_thread():
                  if DEBUG_CANVAS: print("STOP THREAD: Calling handler stop_recording...")
                  recorded_data = self.audio_handler.stop_recording()
+                 self._stop_live_transcription() # Last pass over the buffered audio, then commits the rest
                  if DEBUG_CANVAS: print(f"STOP THREAD: Handler finished. Data len: {len(recorded_data) if recorded_data is not None else 'None'}")
                  if hasattr(self, 'frame') and self.frame.winfo_exists():
                      self.frame.after_idle(self._handle_recording_stopped, recorded_data)
@@ -360,6 +392,7 @@ class RecorderTab:
             self.last_saved_filepath = None
             self.last_loaded_filepath = None
 
+            if self.live_var.get(): self._start_live_transcription() # Before the stream starts, so no chunk is missed
             self.audio_handler.start_recording()
             # Small delay to check if handler status updated correctly
             self.frame.after(100, self._check_recording_start_status)
@@ -377,6 +410,7 @@ class RecorderTab:
                  print(f"Warning: Recording status mismatch. Expected something like '{expected_status}', got '{self.status_text.get()}'. Handler might have failed.")
                  # Assume failure if status isn't "Recording..."
                  self.is_recording = False
+                 self._stop_live_transcription(flush=False)
                  self._set_controls_state(recording=False, playing=False, busy=False)
                  # Status label should show the error from the handler callback
                  return
@@ -406,6 +440,8 @@ class RecorderTab:
             if hasattr(self, 'load_button'): self.load_button.config(state=load_state)
             if hasattr(self, 'sr_combo'): self.sr_combo.config(state=settings_state)
             if hasattr(self, 'ch_combo'): self.ch_combo.config(state=settings_state)
+            if hasattr(self, 'live_check'): self.live_check.config(state=tk.DISABLED if (recording or playing or busy) else tk.NORMAL)
+            if hasattr(self, 'live_latency_combo'): self.live_latency_combo.config(state=settings_state)
             # Update button text via update_ui_text (called AFTER setting state vars like is_recording)
             self.update_ui_text()
         except tk.TclError as e:
@@ -730,6 +766,50 @@ class RecorderTab:
              print(f"Error updating time display: {e}", file=sys.__stderr__)
 
 
+    # --- Live Transcription ---
+    def _start_live_transcription(self):
+        """Starts transcribing the microphone chunks with the model and language of the Transcription tab."""
+        try: latency = float(self.live_latency_var.get())
+        except ValueError: latency = DEFAULT_LATENCY_SECONDS
+        self.live_text.config(state=tk.NORMAL); self.live_text.delete("1.0", tk.END); self.live_text.config(state=tk.DISABLED)
+        gui = self.gui_app
+        self.live_transcriber = LiveTranscriber(gui.transcriber, gui.model_var.get(), gui.get_language_code(gui.transcription_language_var.get()),
+                                                gui.use_gpu_var.get(), gui.system_type, gui.precision_var.get(), latency,
+                                                on_update=self._on_live_update, on_status=self._on_live_status)
+        self.audio_handler.chunk_listeners.append(self.live_transcriber.feed)
+        self.live_transcriber.start()
+
+    def _stop_live_transcription(self, flush: bool = True):
+        """Detaches the live transcriber; flush=True waits for its last pass (call off the Tk thread)."""
+        live, self.live_transcriber = self.live_transcriber, None
+        if live is None: return
+        try: self.audio_handler.chunk_listeners.remove(live.feed)
+        except ValueError: pass
+        live.stop(flush=flush, timeout=None if flush else 2.0)
+
+    def _on_live_update(self, committed: str, partial: str):
+        """Called from the live worker thread after every pass."""
+        try:
+            if hasattr(self, 'frame') and self.frame.winfo_exists(): self.frame.after_idle(self._show_live_text, committed, partial)
+        except (RuntimeError, tk.TclError): pass # Tk shutting down
+
+    def _on_live_status(self, status_key: str, **kwargs):
+        try:
+            if hasattr(self, 'frame') and self.frame.winfo_exists():
+                self.frame.after_idle(lambda: self.live_status_var.set(self.gui_app.translate(status_key).format(**kwargs)))
+        except (RuntimeError, tk.TclError): pass
+
+    def _show_live_text(self, committed: str, partial: str):
+        """Appends committed text and replaces the partial (grey) tail."""
+        if not self.live_text.winfo_exists(): return
+        self.live_text.config(state=tk.NORMAL)
+        ranges = self.live_text.tag_ranges("partial")
+        if ranges: self.live_text.delete(ranges[0], ranges[-1])
+        self.live_text.insert(tk.END, committed)
+        if partial: self.live_text.insert(tk.END, partial, ("partial",))
+        self.live_text.see(tk.END)
+        self.live_text.config(state=tk.DISABLED)
+
     # --- Utility ---
     def clear_plot(self):
         if DEBUG_CANVAS: print("CANVAS CLEAR: Clearing waveform.")
@@ -752,6 +832,7 @@ class RecorderTab:
              except Exception as e: print(f"ON CLOSE ERROR: cancelling queue check: {e}", file=sys.__stderr__)
              self._check_audio_queue_id = None
 
+        self._stop_live_transcription(flush=False)
         if self.audio_handler:
             if self.is_recording:
                 print("ON CLOSE: Stopping active recording...")
@@ -0,0 +1,162 @@
+# --- START OF FILE resource_watchdog.py ---
+
+import os
+import sys
+import time
+import threading
+import typing
+
+import torch
+
+from model_cache import model_cache, ModelCache
+
+try: import psutil # Optional: current RSS on every platform (Linux and Windows work without it)
+except ImportError: psutil = None
+
+SAMPLE_INTERVAL_SECONDS = 5.0
+DEFAULT_IDLE_UNLOAD_MINUTES = 15 # Cached models unused this long are unloaded (0 = keep them)
+DEFAULT_MEMORY_LIMIT_PERCENT = 85 # Pressure threshold as a share of physical RAM (or of GPU memory) when no explicit limit is set
+
+
+def process_rss_bytes() -> typing.Optional[int]:
+    """Resident memory of this process right now, or None where it cannot be read."""
+    if psutil is not None:
+        try: return psutil.Process().memory_info().rss
+        except Exception: pass
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f: return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError): return None
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [(name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+            counters = PROCESS_MEMORY_COUNTERS(); counters.cb = ctypes.sizeof(counters)
+            ctypes.windll.kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            if ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+        except Exception: return None
+    return None
+
+
+def physical_memory_bytes() -> typing.Optional[int]:
+    if psutil is not None:
+        try: return psutil.virtual_memory().total
+        except Exception: pass
+    try: return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError): return None # Windows without psutil
+
+
+def accelerator_memory() -> typing.Optional[dict]:
+    """CUDA memory of the current device in bytes ('allocated' by tensors, 'reserved' by the caching allocator, 'total'), or None."""
+    if not torch.cuda.is_available(): return None
+    try:
+        free, total = torch.cuda.mem_get_info()
+        return {"allocated": torch.cuda.memory_allocated(), "reserved": torch.cuda.memory_reserved(), "total": total, "free": free}
+    except Exception as e:
+        print(f"ResourceWatchdog Warning: could not read CUDA memory - {e}", file=sys.__stderr__)
+        return None
+
+
+class ResourceWatchdog:
+    """
+    Samples process memory (and CUDA memory when present) every few seconds, unloads cached
+    models that have been idle for a while and reacts to memory pressure.
+
+    Under pressure (RSS over the limit, or CUDA reservations over DEFAULT_MEMORY_LIMIT_PERCENT
+    of the device) it first frees buffers (gc and the CUDA cache); if memory is still over the
+    limit at that point, the least recently used model not in use is unloaded, one per sample.
+    Listeners receive every sample (dict), e.g. for the status bar.
+    """
+
+    def __init__(self, cache: ModelCache = model_cache, idle_unload_minutes: float = DEFAULT_IDLE_UNLOAD_MINUTES,
+                 memory_limit_mb: int = 0, interval: float = SAMPLE_INTERVAL_SECONDS):
+        self.cache = cache
+        self.interval = interval
+        self.idle_unload_minutes = DEFAULT_IDLE_UNLOAD_MINUTES; self.memory_limit_mb = 0
+        self.configure(idle_unload_minutes, memory_limit_mb)
+        self.last_sample: dict = {}
+        self.idle_unloads = 0; self.pressure_events = 0; self.pressure_unloads = 0
+        self._listeners: list[typing.Callable[[dict], None]] = []
+        self._stop = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def configure(self, idle_unload_minutes: typing.Optional[float] = None, memory_limit_mb: typing.Optional[int] = None):
+        """idle_unload_minutes: 0 keeps models loaded. memory_limit_mb: 0 = DEFAULT_MEMORY_LIMIT_PERCENT of physical RAM."""
+        try:
+            if idle_unload_minutes is not None: self.idle_unload_minutes = max(0.0, float(idle_unload_minutes))
+            if memory_limit_mb is not None: self.memory_limit_mb = max(0, int(memory_limit_mb))
+        except (TypeError, ValueError): print(f"ResourceWatchdog Warning: invalid settings ({idle_unload_minutes}, {memory_limit_mb}), keeping current.", file=sys.__stderr__)
+
+    def memory_limit_bytes(self) -> typing.Optional[int]:
+        if self.memory_limit_mb: return self.memory_limit_mb * 2**20
+        total = physical_memory_bytes()
+        return int(total * DEFAULT_MEMORY_LIMIT_PERCENT / 100) if total else None
+
+    def add_listener(self, listener: typing.Callable[[dict], None]):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: typing.Callable[[dict], None]):
+        try: self._listeners.remove(listener)
+        except ValueError: pass
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive(): return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="ResourceWatchdog"); self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def sample(self) -> dict:
+        """Current memory figures in MB (None where unavailable) and the resident models."""
+        rss = process_rss_bytes(); limit = self.memory_limit_bytes(); cuda = accelerator_memory(); stats = self.cache.stats()
+        return {"time": time.time(), "rss_mb": rss / 2**20 if rss is not None else None, "limit_mb": limit / 2**20 if limit else None,
+                "cuda_allocated_mb": cuda["allocated"] / 2**20 if cuda else None, "cuda_reserved_mb": cuda["reserved"] / 2**20 if cuda else None,
+                "cuda_total_mb": cuda["total"] / 2**20 if cuda else None, "models_mb": stats["resident_mb"], "models": [key[0] for key in stats["models"]]}
+
+    def _under_pressure(self, sample: dict) -> bool:
+        if sample["rss_mb"] is not None and sample["limit_mb"] and sample["rss_mb"] > sample["limit_mb"]: return True
+        return bool(sample["cuda_reserved_mb"] and sample["cuda_reserved_mb"] > sample["cuda_total_mb"] * DEFAULT_MEMORY_LIMIT_PERCENT / 100)
+
+    def check(self) -> dict:
+        """One watchdog round: idle unload, pressure handling, then notifies listeners. Returns the sample."""
+        if self.idle_unload_minutes:
+            for key in self.cache.evict_idle(self.idle_unload_minutes * 60):
+                self.idle_unloads += 1
+                print(f"ResourceWatchdog: unloaded {key[0]} ({key[1]}, {key[2]}) after {self.idle_unload_minutes:g} idle minutes.")
+        sample = self.sample()
+        if self._under_pressure(sample):
+            self.pressure_events += 1
+            self.cache.release_memory()
+            sample = self.sample()
+            if self._under_pressure(sample):
+                key = self.cache.evict_least_recent_unused()
+                if key is not None:
+                    self.pressure_unloads += 1
+                    print(f"ResourceWatchdog: memory over the limit ({sample['rss_mb']:.0f} MB RSS), unloaded {key[0]} ({key[1]}, {key[2]}).")
+                    sample = self.sample()
+        self.last_sample = sample
+        for listener in list(self._listeners):
+            try: listener(sample)
+            except Exception as e: print(f"ResourceWatchdog Warning: listener failed - {e}", file=sys.__stderr__)
+        return sample
+
+    def stats(self) -> dict:
+        return {**self.last_sample, "idle_unload_minutes": self.idle_unload_minutes, "idle_unloads": self.idle_unloads,
+                "pressure_events": self.pressure_events, "pressure_unloads": self.pressure_unloads}
+
+    def _run(self):
+        while True:
+            try: self.check()
+            except Exception as e: print(f"ResourceWatchdog Error: {e}", file=sys.__stderr__)
+            if self._stop.wait(self.interval): return
+
+# Single watchdog for the process-wide model cache
+resource_watchdog = ResourceWatchdog()
+
+# --- END OF FILE resource_watchdog.py ---
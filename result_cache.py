@@ -0,0 +1,134 @@
+# --- START OF FILE result_cache.py ---
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+import typing
+
+RESULT_CACHE_DIR = "transcription_cache" # Created next to config.json
+DEFAULT_CACHE_BUDGET_MB = 200
+CACHE_FORMAT_VERSION = 1 # Bump when the stored segment format changes
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class ResultCache:
+    """
+    On-disk cache of finished transcriptions.
+
+    Entries are content-addressed: the key is a SHA-256 over the audio file's bytes plus the
+    model, language and decode options, so a renamed or copied file still hits and a changed
+    option misses. Each entry is one JSON file with the full segment list. When the cache
+    grows over its size budget, the least recently used entries (by file mtime, refreshed
+    on every hit) are deleted.
+    """
+
+    def __init__(self, cache_dir: str = RESULT_CACHE_DIR, budget_mb: int = DEFAULT_CACHE_BUDGET_MB):
+        self.cache_dir = cache_dir
+        self.budget_bytes = int(budget_mb) * 1024 * 1024
+        self._lock = threading.Lock()
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def set_budget_mb(self, budget_mb: int):
+        """Changes the size budget and evicts entries if the new budget is exceeded."""
+        try: budget_mb = int(budget_mb)
+        except (TypeError, ValueError): print(f"ResultCache Warning: invalid budget '{budget_mb}', keeping current.", file=sys.__stderr__); return
+        self.budget_bytes = max(0, budget_mb) * 1024 * 1024
+        self._evict_over_budget()
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """SHA-256 of the file content, read in blocks."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""): digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(audio_hash: str, model_type: str, language: str, options: dict) -> str:
+        """Combines the audio hash with everything that changes the decoded text."""
+        settings = json.dumps({"version": CACHE_FORMAT_VERSION, "model": model_type, "language": language, "options": options},
+                              sort_keys=True, default=str)
+        return hashlib.sha256(f"{audio_hash}:{settings}".encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> typing.Optional[dict]:
+        """Returns the stored entry ({"segments", "text", ...}) or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f: entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1; return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"ResultCache Warning: dropping unreadable entry {path} - {e}", file=sys.__stderr__)
+            try: os.remove(path)
+            except OSError: pass
+            self.misses += 1; return None
+        try: os.utime(path, None) # Mark as recently used
+        except OSError: pass
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, segments: list[dict], **metadata):
+        """Stores a finished result atomically, then enforces the size budget."""
+        entry = {"version": CACHE_FORMAT_VERSION, "created": time.time(), **metadata,
+                 "text": " ".join(segment["text"] for segment in segments), "segments": segments}
+        path = self._entry_path(key); tmp_file = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f: json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_file, path)
+        except OSError as e:
+            print(f"ResultCache Error: Failed to save {path} - {e}", file=sys.__stderr__)
+            return
+        self._evict_over_budget()
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) of every entry, oldest first."""
+        entries = []
+        try: names = os.listdir(self.cache_dir)
+        except OSError: return entries
+        for name in names:
+            if not name.endswith(".json"): continue
+            path = os.path.join(self.cache_dir, name)
+            try: stat = os.stat(path)
+            except OSError: continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict_over_budget(self):
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.budget_bytes: break
+                try: os.remove(path); total -= size; self.evictions += 1
+                except OSError as e: print(f"ResultCache Warning: could not evict {path} - {e}", file=sys.__stderr__)
+
+    def clear(self):
+        """Deletes every entry."""
+        with self._lock:
+            for _, _, path in self._entries():
+                try: os.remove(path); self.evictions += 1
+                except OSError: pass
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(entries),
+                "size_mb": sum(size for _, size, _ in entries) / 2**20, "budget_mb": self.budget_bytes / 2**20}
+
+# Single cache shared by every AudioTranscriber in the process
+result_cache = ResultCache()
+
+# --- END OF FILE result_cache.py ---
@@ -0,0 +1,111 @@
+# --- START OF FILE rtf_history.py ---
+"""
+Measured speed of past jobs, used for time estimates.
+
+Every completed transcription records its real-time factor (decode time / audio duration)
+and model load time per (model, device, precision, parallel workers, decode preset). Estimates use the
+median of the most recent runs, so one slow outlier (a busy machine, a cold disk) does not
+skew them. Until a configuration has history, a static per-model factor is used.
+"""
+
+import os
+import sys
+import json
+import time
+import statistics
+import threading
+import typing
+
+RTF_HISTORY_FILE = "rtf_history.json" # Next to config.json
+MAX_SAMPLES_PER_KEY = 20 # Recent runs kept per configuration (older hardware/settings age out)
+DEFAULT_RTF = {"tiny": 0.05, "base": 0.1, "small": 0.2, "medium": 0.5, "large": 1.0} # Used until a configuration has history
+ETA_PRIOR_WEIGHT_UNTIL = 0.2 # Live ETA blends in the estimate until this fraction of the audio is decoded
+
+
+class RtfHistory:
+    """Per-configuration history of real-time factors and load times, persisted as JSON."""
+
+    def __init__(self, history_file: str = RTF_HISTORY_FILE):
+        self.history_file = history_file
+        self._history: dict[str, dict] = {} # key -> {"rtf": [...], "load": [...]}
+        self._lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def make_key(model_type: str, device: typing.Union[str, object], precision: str = "fp32", parallel_workers: int = 1,
+                 preset: str = "balanced") -> str:
+        key = f"{model_type}|{device}|{precision}"
+        if parallel_workers > 1: key += f"|x{parallel_workers}"
+        return key + f"|{preset}" if preset != "balanced" else key # Balanced runs keep the keys recorded before presets existed
+
+    def load(self):
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f: data = json.load(f)
+        except FileNotFoundError: return
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"RtfHistory Warning: ignoring unreadable {self.history_file} - {e}", file=sys.__stderr__); return
+        with self._lock: self._history = data.get("history", {})
+
+    def save(self):
+        with self._lock: data = {"version": 1, "history": self._history}
+        tmp_file = self.history_file + ".tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f: json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.history_file)
+        except OSError as e:
+            print(f"RtfHistory Error: Failed to save {self.history_file} - {e}", file=sys.__stderr__)
+
+    def record(self, model_type: str, device: typing.Union[str, object], precision: str, audio_seconds: float,
+               transcribe_time: float, load_time: typing.Optional[float] = None, parallel_workers: int = 1, preset: str = "balanced"):
+        """
+        Adds one completed job. load_time is only given when the model actually had to be
+        loaded (a cache hit would drag the median towards zero).
+        """
+        if audio_seconds <= 0 or transcribe_time <= 0: return
+        key = self.make_key(model_type, device, precision, parallel_workers, preset)
+        with self._lock:
+            entry = self._history.setdefault(key, {"rtf": [], "load": []})
+            entry["rtf"] = (entry["rtf"] + [round(transcribe_time / audio_seconds, 5)])[-MAX_SAMPLES_PER_KEY:]
+            if load_time is not None: entry["load"] = (entry["load"] + [round(load_time, 3)])[-MAX_SAMPLES_PER_KEY:]
+            entry["updated_at"] = time.time()
+        self.save()
+
+    def estimate(self, model_type: str, device: typing.Union[str, object], precision: str, duration: float,
+                 parallel_workers: int = 1, include_load: bool = False, preset: str = "balanced") -> tuple[float, str]:
+        """Returns (estimated seconds, source) for transcribing 'duration' seconds of audio."""
+        with self._lock:
+            entry = self._history.get(self.make_key(model_type, device, precision, parallel_workers, preset))
+            rtf_samples = list(entry["rtf"]) if entry else []
+            load_samples = list(entry["load"]) if entry else []
+        if rtf_samples:
+            estimate = duration * statistics.median(rtf_samples); source = f"history, {len(rtf_samples)} runs"
+        else:
+            estimate = duration * DEFAULT_RTF.get(model_type, 1.5); source = "default"
+        if include_load and load_samples: estimate += statistics.median(load_samples)
+        return estimate, source
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {key: {"runs": len(entry["rtf"]), "median_rtf": statistics.median(entry["rtf"]) if entry["rtf"] else None,
+                          "median_load": statistics.median(entry["load"]) if entry["load"] else None}
+                    for key, entry in self._history.items()}
+
+
+def live_eta(done_seconds: float, total_seconds: float, elapsed: float, prior_remaining: typing.Optional[float] = None) -> typing.Optional[float]:
+    """
+    Remaining seconds from the observed decode rate (audio seconds per wall second). Early
+    in the job the first window's overhead distorts the rate, so the history-based estimate
+    is blended in until ETA_PRIOR_WEIGHT_UNTIL of the audio is done.
+    """
+    if total_seconds <= 0: return None
+    remaining_audio = max(0.0, total_seconds - done_seconds)
+    if done_seconds <= 0 or elapsed <= 0: return prior_remaining
+    observed = remaining_audio * elapsed / done_seconds
+    if prior_remaining is None: return observed
+    weight = min(1.0, (done_seconds / total_seconds) / ETA_PRIOR_WEIGHT_UNTIL)
+    return weight * observed + (1.0 - weight) * max(0.0, prior_remaining)
+
+# Single history shared by every AudioTranscriber in the process
+rtf_history = RtfHistory()
+
+# --- END OF FILE rtf_history.py ---
@@ -3,6 +3,8 @@
 import tkinter as tk
 from tkinter import ttk
 
+from resource_watchdog import resource_watchdog
+
 class StatusBar:
     """Manages the status bar at the bottom of the GUI."""
 
@@ -17,6 +19,29 @@ class StatusBar:
         self.status_label = ttk.Label(self.frame, textvariable=self.gui_app.status_var, style="Status.TLabel", anchor="w")
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=2)
 
-    # No specific update_ui_text needed here as the label uses textvariable
+        # Process memory, refreshed by the resource watchdog
+        self.memory_var = tk.StringVar(value="")
+        self.memory_label = ttk.Label(self.frame, textvariable=self.memory_var, style="Status.TLabel", anchor="e")
+        self.memory_label.pack(side=tk.RIGHT, padx=5, pady=2)
+        resource_watchdog.add_listener(self._on_memory_sample)
+
+    def _on_memory_sample(self, sample: dict):
+        """Called from the watchdog thread."""
+        try:
+            if self.frame.winfo_exists(): self.frame.after_idle(self._show_memory, sample)
+        except (RuntimeError, tk.TclError): pass # Tk shutting down
+
+    def _show_memory(self, sample: dict):
+        translate = self.gui_app.translate
+        parts = [translate("memory_status_ram").format(rss_gb=sample["rss_mb"] / 1024) if sample["rss_mb"] is not None else translate("memory_status_ram_unknown")]
+        if sample["cuda_allocated_mb"] is not None:
+            parts.append(translate("memory_status_gpu").format(allocated_gb=sample["cuda_allocated_mb"] / 1024, reserved_gb=sample["cuda_reserved_mb"] / 1024))
+        parts.append(translate("memory_status_models").format(models=", ".join(sample["models"]) or "-", models_gb=sample["models_mb"] / 1024))
+        self.memory_var.set("  |  ".join(parts))
+
+    def on_close(self):
+        resource_watchdog.remove_listener(self._on_memory_sample)
+
+    # No specific update_ui_text needed here: the labels use textvariables, the memory text follows the language at the next sample
 
 # --- END OF FILE status_bar.py ---
\ No newline at end of file
@@ -0,0 +1,41 @@
+# --- START OF FILE tests/test_audioscript.py ---
+
+import json
+
+import audioscript
+import transcriber
+
+
+def _fake_transcribe_audio(self, input_file, *args, **options):
+    self.last_run = {"duration": 1.0, "segments": 1}
+    return f"text of {input_file}", True, False
+
+
+def test_inputs_with_the_same_stem_write_separate_transcripts(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(transcriber.AudioTranscriber, "transcribe_audio", _fake_transcribe_audio)
+    inputs = []
+    for name in ("a.wav", "a.flac"):
+        path = tmp_path / name; path.write_bytes(b""); inputs.append(str(path))
+    output = tmp_path / "out"
+
+    assert audioscript.main(["transcribe", *inputs, "-o", str(output), "--quiet"]) == 0
+
+    captured = capsys.readouterr()
+    reports = [json.loads(line) for line in captured.out.splitlines()]
+    outputs = {report["file"]: report["output"] for report in reports}
+    assert sorted(outputs) == sorted(inputs) and len(set(outputs.values())) == 2
+    for input_file, output_file in outputs.items():
+        with open(output_file, encoding="utf-8") as f: assert f.read() == f"text of {input_file}"
+    assert str(output / "a_2_transcription.txt") in outputs.values() and "same name" in captured.err
+
+
+def test_directory_inputs_keep_their_subfolders(tmp_path):
+    for name in ("a.wav", "sub/a.wav"):
+        path = tmp_path / "in" / name; path.parent.mkdir(parents=True, exist_ok=True); path.write_bytes(b"")
+    roots: dict = {}
+    files = audioscript.expand_inputs([str(tmp_path / "in")], roots)
+    outputs = audioscript.output_paths_for(files, str(tmp_path / "out"), roots)
+    assert outputs[str(tmp_path / "in" / "a.wav")] == str(tmp_path / "out" / "a_transcription.txt")
+    assert outputs[str(tmp_path / "in" / "sub" / "a.wav")] == str(tmp_path / "out" / "sub" / "a_transcription.txt")
+
+# --- END OF FILE tests/test_audioscript.py ---
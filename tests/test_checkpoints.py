@@ -0,0 +1,53 @@
+# --- START OF FILE tests/test_checkpoints.py ---
+
+from checkpoints import CheckpointStore
+
+KEY = "job"
+TOTAL_SAMPLES = 16000 * 600
+
+
+def _window(index: int) -> dict:
+    return {"seek": (index + 1) * 480000, "segments": [{"start": index * 30.0, "end": index * 30.0 + 29.0, "text": f"window {index}"}],
+            "previous_text": f"text up to window {index}"}
+
+
+def _write_windows(writer, first: int, count: int):
+    for index in range(first, first + count):
+        window = _window(index)
+        writer.write_window(window["seek"], window["segments"], window["previous_text"])
+    writer.close()
+
+
+def _tear_last_line(store: CheckpointStore):
+    """Simulates a crash in the middle of writing a record."""
+    with open(store._path(KEY), 'a', encoding='utf-8') as f: f.write('{"seek": 99, "segments": [{"start": 1.0, "te')
+
+
+def test_resume_after_torn_record_keeps_every_window(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    _write_windows(store.open(KEY, TOTAL_SAMPLES), 0, 2)
+    _tear_last_line(store)
+
+    resume = store.load(KEY, TOTAL_SAMPLES)
+    assert resume["windows"] == 2 and resume["seek"] == _window(1)["seek"]
+    _write_windows(store.open(KEY, TOTAL_SAMPLES, resume), 2, 2)
+    _tear_last_line(store)
+
+    resume = store.load(KEY, TOTAL_SAMPLES)
+    assert resume["windows"] == 4
+    assert [segment["text"] for segment in resume["segments"]] == [f"window {index}" for index in range(4)]
+    assert resume["seek"] == _window(3)["seek"] and resume["previous_text"] == _window(3)["previous_text"]
+    _write_windows(store.open(KEY, TOTAL_SAMPLES, resume), 4, 1)
+
+    resume = store.load(KEY, TOTAL_SAMPLES)
+    assert resume["windows"] == 5
+    assert [segment["text"] for segment in resume["segments"]] == [f"window {index}" for index in range(5)]
+
+
+def test_checkpoint_of_other_audio_is_discarded(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    _write_windows(store.open(KEY, TOTAL_SAMPLES), 0, 1)
+    assert store.load(KEY, TOTAL_SAMPLES + 1) is None
+    assert store.load(KEY, TOTAL_SAMPLES) is None
+
+# --- END OF FILE tests/test_checkpoints.py ---
@@ -0,0 +1,113 @@
+# --- START OF FILE tests/test_job_queue.py ---
+
+import threading
+import time
+
+import job_queue
+from job_queue import JobQueue, STATUS_DONE
+from rtf_history import RtfHistory
+from transcriber import AudioTranscriber
+
+
+class _App:
+    def translate(self, key): return key
+    def _print(self, message): pass
+
+
+class _BlockingTranscriber:
+    """Stands in for AudioTranscriber: each job blocks until 'release' is set, like a long decode."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def __init__(self, host):
+        self.gui = host
+        self.stop_requested = False
+
+    def request_stop(self):
+        self.stop_requested = True # Only noted: the job returns when it is released, like a window still decoding
+
+    def transcribe_audio(self, input_file, *args, **options):
+        self.started.set()
+        self.release.wait(10)
+        if self.stop_requested: return "", False, True
+        return f"text of {input_file}", True, False
+
+
+def _wait_for(condition, timeout: float = 10.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition(): return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_start_while_stopped_job_is_still_running_restarts_the_queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_queue, "AudioTranscriber", _BlockingTranscriber)
+    _BlockingTranscriber.started.clear(); _BlockingTranscriber.release.clear()
+    files = []
+    for name in ("a.wav", "b.wav"):
+        path = tmp_path / name; path.write_bytes(b""); files.append(str(path))
+    queue = JobQueue(_App(), state_file=str(tmp_path / "queue.json"))
+    assert queue.add_files(files, "base", "en", False, "Linux", output_dir=str(tmp_path / "out")) == 2
+
+    queue.start(1)
+    assert _BlockingTranscriber.started.wait(10)
+    queue.stop()
+    queue.start(1) # The interrupted job has not returned yet
+    _BlockingTranscriber.release.set()
+
+    assert _wait_for(lambda: queue.count(STATUS_DONE) == 2 and not queue.is_running())
+    assert (tmp_path / "out" / "a_transcription.txt").exists()
+    assert (tmp_path / "out" / "b_transcription.txt").exists()
+
+
+def test_stop_cancels_a_queued_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_queue, "AudioTranscriber", _BlockingTranscriber)
+    _BlockingTranscriber.started.clear(); _BlockingTranscriber.release.clear()
+    path = tmp_path / "a.wav"; path.write_bytes(b"")
+    queue = JobQueue(_App(), state_file=str(tmp_path / "queue.json"))
+    queue.add_files([str(path)], "base", "en", False, "Linux")
+
+    queue.start(1)
+    assert _BlockingTranscriber.started.wait(10)
+    queue.stop(); queue.start(1); queue.stop()
+    _BlockingTranscriber.release.set()
+
+    assert _wait_for(lambda: not queue.is_running())
+    time.sleep(0.1)
+    assert not queue.is_running() and queue.count(STATUS_DONE) == 0
+
+
+def test_inputs_with_the_same_name_get_separate_transcripts(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_queue, "AudioTranscriber", _BlockingTranscriber)
+    _BlockingTranscriber.release.set()
+    source = tmp_path / "in"
+    for name in ("a.wav", "a.flac", "sub/a.wav"):
+        path = source / name; path.parent.mkdir(parents=True, exist_ok=True); path.write_bytes(b"")
+    output = tmp_path / "out"
+    queue = JobQueue(_App(), state_file=str(tmp_path / "queue.json"))
+    assert queue.add_folder(str(source), "base", "en", False, "Linux", output_dir=str(output)) == 3
+
+    queue.start(2)
+    assert _wait_for(lambda: queue.count(STATUS_DONE) == 3 and not queue.is_running())
+    outputs = {job["file"]: job["output_file"] for job in queue.snapshot()}
+    assert len(set(outputs.values())) == 3
+    assert outputs[str(source / "sub" / "a.wav")] == str(output / "sub" / "a_transcription.txt")
+    for input_file, output_file in outputs.items():
+        with open(output_file, encoding="utf-8") as f: assert f.read() == f"text of {input_file}"
+
+
+def test_gpu_job_estimate_uses_the_history_of_the_probed_device(tmp_path, monkeypatch):
+    history = RtfHistory(str(tmp_path / "rtf_history.json"))
+    history.record("base", "mps", "fp32", audio_seconds=100.0, transcribe_time=10.0)
+    monkeypatch.setattr(job_queue, "rtf_history", history)
+    monkeypatch.setitem(AudioTranscriber._device_cache, (True, "mac"), "mps")
+    path = tmp_path / "a.wav"; path.write_bytes(b"")
+    queue = JobQueue(_App(), state_file=str(tmp_path / "queue.json"))
+    queue.add_files([str(path)], "base", "en", True, "mac")
+    job = queue.snapshot()[0]; job["duration"] = 60.0
+
+    assert queue._job_device(job) == "mps"
+    assert abs(queue._estimate_job_time(job) - 6.0) < 1e-6 # RTF 0.1 measured on MPS, not the default
+
+# --- END OF FILE tests/test_job_queue.py ---
@@ -0,0 +1,60 @@
+# --- START OF FILE tests/test_two_pass.py ---
+
+import numpy as np
+import soundfile
+import torch
+
+import audio_loader
+import transcriber
+from audio_loader import AudioStream, open_stream
+from translations import translations_dict
+
+SEGMENT_SECONDS = 10.0
+
+
+class _Host:
+    def translate(self, key): return translations_dict["English"][key]
+    def _print(self, message): pass
+    def _set_progress_value(self, percent): pass
+    def result_text_append(self, text): pass
+    def result_segments_replace(self, first, last, text): pass
+
+
+class _FakeModel:
+    """Whisper stand-in: 10 s segments per window, every other one below the draft confidence threshold."""
+
+    def __init__(self, draft: bool):
+        self.draft = draft
+        self.encoder = torch.nn.Identity(); self.decoder = torch.nn.Identity()
+        self.calls = 0
+
+    def transcribe(self, audio, **options):
+        self.calls += 1
+        seconds = len(audio) / audio_loader.SAMPLE_RATE; segments = []; start = 0.0
+        while start < seconds:
+            index = len(segments)
+            segments.append({"start": start, "end": min(seconds, start + SEGMENT_SECONDS), "text": f"{'draft' if self.draft else 'refined'} {index}",
+                             "avg_logprob": -1.5 if self.draft and index % 2 == 0 else -0.1, "compression_ratio": 1.0, "no_speech_prob": 0.0})
+            start += SEGMENT_SECONDS
+        return {"segments": segments}
+
+
+def test_refine_spans_of_a_streamed_file_do_not_restart_decoding_per_span(tmp_path, monkeypatch):
+    path = str(tmp_path / "long.wav") # 22.05 kHz: streamed through the resampler, so backward reads re-decode from the top
+    soundfile.write(path, np.random.default_rng(0).uniform(-0.1, 0.1, 22050 * 200).astype(np.float32), 22050)
+    streams = []; original_init = AudioStream.__init__
+    def recording_init(self, *args, **kwargs): original_init(self, *args, **kwargs); streams.append(self)
+    monkeypatch.setattr(AudioStream, "__init__", recording_init)
+    models = {"tiny": _FakeModel(draft=True), "base": _FakeModel(draft=False)}
+    monkeypatch.setattr(transcriber.AudioTranscriber, "_load_model", lambda self, model_type, device, device_str, precision="fp32": (models[model_type], device, device_str))
+    monkeypatch.setattr(transcriber.AudioTranscriber, "_apply_thread_count", lambda self, *args, **kwargs: None)
+
+    audio = open_stream(path)
+    engine = transcriber.AudioTranscriber(_Host())
+    segments = engine._decode_two_pass("tiny", "base", "cpu", "cpu", audio, {}, "fp32", 0, lambda done, total: None)
+
+    assert engine.last_run["refined_spans"] > 2
+    assert sum(segment.get("refined", False) for segment in segments) == engine.last_run["refined_segments"] > 2
+    assert [stream.restarts for stream in streams] == [0, 0] # Draft pass, then one forward pass over the spans
+
+# --- END OF FILE tests/test_two_pass.py ---
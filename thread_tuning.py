@@ -0,0 +1,132 @@
+# --- START OF FILE thread_tuning.py ---
+"""
+Per-machine tuning of torch's intra-op thread count.
+
+A short calibration times the same warm-up workload (one 30 s encoder pass plus a few
+decoder steps) at several torch.set_num_threads values and keeps the fastest. Results are
+stored per (model, device, precision) in THREAD_PROFILE_FILE next to config.json.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import threading
+import typing
+
+import torch
+
+THREAD_PROFILE_FILE = "thread_profiles.json" # Next to config.json
+CALIBRATION_AUDIO_SECONDS = 30.0 # Audio covered by one workload run (one Whisper window)
+FEWER_THREADS_TOLERANCE = 0.05 # Prefer fewer threads if within 5% of the fastest (leaves cores for other work)
+
+
+def candidate_thread_counts(cpu_count: typing.Optional[int] = None) -> list[int]:
+    """Powers of two up to the core count, plus half and all logical cores."""
+    cpu_count = max(1, cpu_count or os.cpu_count() or 1)
+    candidates = {cpu_count, max(1, cpu_count // 2)}
+    value = 1
+    while value < cpu_count: candidates.add(value); value *= 2
+    return sorted(candidates)
+
+
+class ThreadProfiles:
+    """Calibrated thread counts, persisted as JSON and shared by every transcriber in the process."""
+
+    def __init__(self, profile_file: str = THREAD_PROFILE_FILE):
+        self.profile_file = profile_file
+        self.machine = {"node": platform.node(), "cpu_count": os.cpu_count() or 1}
+        self._profiles: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._calibrating: set[str] = set()
+        self._attempted: set[str] = set() # Keys calibrated (or tried) by this process
+        self.load()
+
+    @staticmethod
+    def make_key(model_type: str, device: typing.Union[str, object], precision: str) -> str:
+        return f"{model_type}|{device}|{precision}"
+
+    def load(self):
+        try:
+            with open(self.profile_file, 'r', encoding='utf-8') as f: data = json.load(f)
+        except FileNotFoundError: return
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"ThreadProfiles Warning: ignoring unreadable {self.profile_file} - {e}", file=sys.__stderr__); return
+        if data.get("machine") != self.machine:
+            print("ThreadProfiles: profiles were measured on a different machine, recalibrating when needed.")
+            return
+        with self._lock: self._profiles = data.get("profiles", {})
+
+    def save(self):
+        with self._lock: data = {"machine": self.machine, "profiles": self._profiles}
+        tmp_file = self.profile_file + ".tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f: json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.profile_file)
+        except OSError as e:
+            print(f"ThreadProfiles Error: Failed to save {self.profile_file} - {e}", file=sys.__stderr__)
+
+    def get(self, model_type: str, device: typing.Union[str, object], precision: str) -> typing.Optional[dict]:
+        with self._lock: return self._profiles.get(self.make_key(model_type, device, precision))
+
+    def needs_calibration(self, model_type: str, device: typing.Union[str, object], precision: str) -> bool:
+        """True if there is no profile for this key and this process has not tried to calibrate it yet."""
+        key = self.make_key(model_type, device, precision)
+        with self._lock: return key not in self._profiles and key not in self._attempted and key not in self._calibrating
+
+    def threads_for(self, model_type: str, device: typing.Union[str, object], precision: str,
+                    override: int = 0, concurrent_jobs: int = 1) -> tuple[int, str]:
+        """
+        Returns (threads, source). A manual override wins; otherwise the calibrated count,
+        or torch's default if not calibrated yet. With several jobs in the process the
+        cores are split between them so they do not oversubscribe.
+        """
+        if override and override > 0: return int(override), "manual"
+        profile = self.get(model_type, device, precision)
+        threads, source = (profile["threads"], "calibrated") if profile else (torch.get_num_threads(), "default")
+        if concurrent_jobs > 1:
+            threads = min(threads, max(1, self.machine["cpu_count"] // concurrent_jobs)); source += f", split over {concurrent_jobs} jobs"
+        return max(1, threads), source
+
+    def calibrate(self, model_type: str, device: typing.Union[str, object], precision: str,
+                  workload: typing.Callable[[], None], log: typing.Optional[typing.Callable[[str], None]] = None) -> typing.Optional[dict]:
+        """
+        Times 'workload' at each candidate thread count and stores the fastest setting.
+        Returns the new profile, or None if this key is being (or was already) calibrated by
+        this process, so a failing calibration is not repeated on every job.
+        The caller must hold the model's inference lock. The previous thread count is restored.
+        """
+        log = log or (lambda message: print(message, end=""))
+        key = self.make_key(model_type, device, precision)
+        with self._lock:
+            if key in self._calibrating or key in self._attempted: return None
+            self._calibrating.add(key); self._attempted.add(key)
+        original_threads = torch.get_num_threads()
+        timings: dict[str, float] = {}
+        try:
+            workload() # Kernel setup and caches, not timed
+            slower_in_a_row = 0; best_time = None
+            for threads in candidate_thread_counts(self.machine["cpu_count"]):
+                torch.set_num_threads(threads)
+                start = time.perf_counter(); workload(); elapsed = time.perf_counter() - start
+                timings[str(threads)] = round(elapsed / CALIBRATION_AUDIO_SECONDS, 4) # Real-time factor
+                if best_time is None or elapsed < best_time: best_time = elapsed; slower_in_a_row = 0
+                else:
+                    slower_in_a_row += 1
+                    if slower_in_a_row >= 2: break # Past the sweet spot
+            fastest = min(timings.values())
+            best = min(int(t) for t, rtf in timings.items() if rtf <= fastest * (1 + FEWER_THREADS_TOLERANCE))
+            profile = {"threads": best, "rtf": timings, "calibrated_at": time.time()}
+            with self._lock: self._profiles[key] = profile
+            self.save()
+            log(f"Thread calibration for {model_type} ({device}, {precision}): best {best} threads, RTF by threads {timings}.\n")
+            return profile
+        finally:
+            torch.set_num_threads(original_threads)
+            with self._lock: self._calibrating.discard(key)
+
+# Single profile store shared by every AudioTranscriber in the process
+thread_profiles = ThreadProfiles()
+
+# --- END OF FILE thread_tuning.py ---
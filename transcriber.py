@@ -2,15 +2,31 @@
 
 import whisper
 import time
-import wave
 import os
 import threading
-import tkinter as tk # Import base tk for type hinting if needed
-from tkinter import messagebox
+import contextlib
+import concurrent.futures
 import sys
 import torch
+import numpy as np
 import typing # **** FIX: Import the typing module ****
 
+from model_cache import model_cache
+from parallel_transcriber import ParallelTranscriber
+from vad import SpeechTimeline
+from result_cache import result_cache
+from daemon_client import DaemonClient, DaemonUnavailable
+from quantization import PRECISION_FP32, PRECISION_INT8, PRECISIONS, load_quantized_model
+from thread_tuning import thread_profiles
+from rtf_history import rtf_history, live_eta
+from decode_presets import DEFAULT_DECODE_PRESET, PRESET_FAST, decode_options_for, normalize_preset
+from two_pass import DRAFT_PROGRESS_SHARE, refinement_spans, spans_seconds
+from audio_loader import load_audio, open_stream
+from audio_metadata import audio_metadata
+from transcript_archive import transcript_archive
+from checkpoints import checkpoint_store, CheckpointWriter
+from model_store import model_store
+
 # Conditional import for DirectML on Windows
 if sys.platform == "win32":
     try:
@@ -27,12 +43,38 @@ if typing.TYPE_CHECKING:
     from gui import ModernTranscriptionApp
 
 
+# Segment streaming: audio is decoded one 30 s Whisper window at a time
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE # 16 kHz
+WINDOW_SAMPLES = whisper.audio.N_SAMPLES # 30 s
+PROMPT_CONTEXT_CHARS = 800 # Tail of the previous text passed as prompt to the next window
+PARALLEL_MIN_SECONDS = 600 # Shorter files are decoded in-process even if parallel workers are set
+STREAMING_MIN_SECONDS = 1800 # Longer files are read window by window instead of decoded whole (~115 MB of samples at this length)
+
+
+class TranscriptionCancelled(Exception):
+    """Raised from inside the model's forward pass when a stop has been requested."""
+
+
 class AudioTranscriber:
+    # Probed compute devices by (use_gpu, system_type), shared by every transcriber for the life of the process
+    _device_cache: dict[tuple[bool, str], typing.Union[str, object]] = {}
+    _device_cache_lock = threading.Lock()
+
     # Specify the type hint for gui_app using the forward reference
     def __init__(self, gui_app: 'ModernTranscriptionApp'):
         """Initializes the transcriber backend."""
         self.gui = gui_app # Reference to the main application instance
         self.stop_requested = False
+        self._stop_requested_at = 0.0 # time.time() of the last stop request, for latency reporting
+        self.is_running = False # True while a transcription job is active
+        self.model_replica = 0 # Model cache instance used by this transcriber (batch workers use their own)
+        self.concurrent_jobs = 1 # Jobs decoding at the same time in this process; CPU threads are split between them
+        self.record_results = True # False for synthetic runs (benchmark.py): nothing goes to the RTF history or the transcript archive
+        self.last_run: dict = {} # Facts about the last transcribe_audio call (duration, segments, timings) for headless callers
+        # Background preload state
+        self._preload_lock = threading.Lock()
+        self._preload_thread: typing.Optional[threading.Thread] = None
+        self._preload_request: typing.Optional[tuple[str, bool]] = None
 
     # Helper to safely print to GUI console via the main app
     def _print(self, message: str):
@@ -69,17 +111,43 @@ class AudioTranscriber:
         if hasattr(self.gui, '_show_info'):
             self.gui._show_info(info_key, **kwargs)
 
+    # Helper to stream a decoded segment into the result pane via the main app
+    def _append_result(self, text: str):
+        """Appends one segment's text to the result pane via the main app."""
+        if hasattr(self.gui, 'result_text_append'):
+            self.gui.result_text_append(text)
+
+    # Helper to replace already streamed segments (two-pass refinement) via the main app
+    def _replace_result_segments(self, first: int, last: int, text: str):
+        """Replaces streamed segments first..last (inclusive, in streaming order) with new text in the result pane."""
+        if hasattr(self.gui, 'result_segments_replace'):
+            self.gui.result_segments_replace(first, last, text)
+
+    # Helper to set determinate progress (0-100) via the main app
+    def _set_progress_value(self, percent: float):
+        """Sets the determinate progress value via the main app."""
+        if hasattr(self.gui, '_set_progress_value'):
+            self.gui._set_progress_value(percent)
+
+    # Helper to show the live remaining-time estimate via the main app
+    def _set_progress_eta(self, seconds: float):
+        """Shows the estimated remaining decode time via the main app."""
+        if hasattr(self.gui, '_set_progress_eta'):
+            self.gui._set_progress_eta(seconds)
+
+    # Helper to report background (preload) activity in the status bar via the main app
+    def _notify_background_status(self, status_key: str, **kwargs):
+        """Shows a background-activity message in the status bar via the main app."""
+        if hasattr(self.gui, '_set_background_status'):
+            self.gui._set_background_status(status_key, **kwargs)
+
     def get_audio_info(self, file_path: str) -> typing.Optional[tuple[float, int, int]]:
-        """Reads basic info (duration, channels, rate) from a WAV file."""
+        """Reads basic info (duration, channels, rate) from the file's headers (any supported format, cached)."""
         try:
-            with wave.open(file_path, 'r') as audio:
-                frames = audio.getnframes()
-                rate = audio.getframerate()
-                duration = frames / float(rate) if rate > 0 else 0.0
-                channels = audio.getnchannels()
-                return duration, channels, rate
-        except wave.Error as e:
-            error_msg = f"Wave Error reading info for {os.path.basename(file_path)}: {e}"
+            info = audio_metadata.get(file_path)
+            return info["duration"], info["channels"], info["rate"]
+        except ValueError as e:
+            error_msg = f"Header Error reading info for {os.path.basename(file_path)}: {e}"
             self._print(f"{error_msg}\n")
             self._show_error("error_reading_info", error=str(e))
             return None
@@ -90,19 +158,46 @@ class AudioTranscriber:
             return None
 
     def get_audio_duration(self, file_path: str) -> float:
-        """Gets the audio duration from a WAV file."""
+        """Gets the audio duration in seconds (0.0 if the file cannot be read)."""
         info = self.get_audio_info(file_path)
         return info[0] if info else 0.0
 
-    def estimate_time(self, duration: float, model_type: str) -> float:
-        """Estimates transcription time based on duration and model."""
-        speed_factors = {"tiny": 0.05, "base": 0.1, "small": 0.2, "medium": 0.5, "large": 1.0}
-        factor = speed_factors.get(model_type, 1.5)
-        estimated_time = duration * factor
-        return estimated_time
+    def estimate_time(self, duration: float, model_type: str, device: typing.Union[str, object] = "cpu", precision: str = PRECISION_FP32,
+                      parallel_workers: int = 1, include_load: bool = False, preset: str = DEFAULT_DECODE_PRESET) -> tuple[float, str]:
+        """Estimates transcription time from the measured speed of past jobs with the same settings. Returns (seconds, source)."""
+        return rtf_history.estimate(model_type, device, precision, duration, parallel_workers, include_load, preset)
+
+    def _progress_callback(self, decode_start: float, estimated_time: float, resumed: float = 0.0):
+        """
+        Progress callback for the decoders: sets the bar and a live ETA from the rate of decoded audio.
+        resumed: seconds restored from a checkpoint, left out of the rate (they took no time in this run).
+        """
+        def on_progress(done: float, total: float):
+            self._set_progress_value(100.0 * done / total)
+            elapsed = time.time() - decode_start
+            prior = estimated_time * (1.0 - resumed / total) - elapsed if estimated_time and total > 0 else None
+            eta = live_eta(done - resumed, total - resumed, elapsed, prior)
+            if eta is not None: self._set_progress_eta(eta)
+        return on_progress
 
     def get_device(self, use_gpu: bool, system_type: str) -> typing.Union[str, object]: # Use Union for type hint
-        """Determines the compute device (CPU, CUDA, MPS, DML)."""
+        """Determines the compute device (CPU, CUDA, MPS, DML). The backends are probed once per process."""
+        key = (bool(use_gpu), system_type)
+        with AudioTranscriber._device_cache_lock: # Concurrent jobs wait for a probe in progress instead of repeating it
+            device = AudioTranscriber._device_cache.get(key)
+            if device is None:
+                device = AudioTranscriber._device_cache[key] = self._probe_device(use_gpu, system_type)
+                return device
+        self._print(self.gui.translate("device_cached_info").format(device=str(device)))
+        return device
+
+    @staticmethod
+    def probed_device(use_gpu: bool, system_type: str) -> typing.Optional[typing.Union[str, object]]:
+        """The device get_device found for these settings earlier in this process, or None if not probed yet."""
+        with AudioTranscriber._device_cache_lock: return AudioTranscriber._device_cache.get((bool(use_gpu), system_type))
+
+    def _probe_device(self, use_gpu: bool, system_type: str) -> typing.Union[str, object]:
+        """Checks the GPU backends (DirectML with a test tensor), falling back to CPU."""
         device: typing.Union[str, object] = "cpu" # Default device
         if use_gpu:
             try:
@@ -127,9 +222,323 @@ class AudioTranscriber:
         else: self._print("GPU not requested, using CPU.\n")
         return device
 
-    def transcribe_audio(self, input_file: str, model_type: str, language: str, use_gpu: bool, system_type: str) -> tuple[str, bool, bool]:
-        """Performs the audio transcription process."""
-        self.stop_requested = False; transcription_result = ""; success = False; interrupted = False
+    def _warm_up(self, model):
+        """Runs one dummy 30 s mel pass through encoder and decoder so the first job skips kernel setup."""
+        silence = np.zeros(whisper.audio.N_SAMPLES, dtype=np.float32)
+        mel = whisper.log_mel_spectrogram(silence, n_mels=model.dims.n_mels).to(model.device)
+        with torch.no_grad():
+            whisper.decode(model, mel, whisper.DecodingOptions(language="en", fp16=False, without_timestamps=True, sample_len=4))
+
+    def preload_model(self, model_type: str, use_gpu: bool, system_type: str, precision: str = PRECISION_FP32):
+        """Loads and warms up a model on a background thread so the next job starts immediately."""
+        request = (model_type, use_gpu, precision)
+        with self._preload_lock:
+            if self._preload_thread and self._preload_thread.is_alive() and self._preload_request == request:
+                return # Already preloading this exact model
+            self._preload_request = request
+
+        def run_preload():
+            self._notify_background_status("status_preloading_model", model=model_type)
+            start_time = time.time()
+            try:
+                device = self.get_device(use_gpu, system_type)
+                model_precision = self._effective_precision(precision, device)
+                try: model = self._get_model(model_type, device, model_precision)
+                except Exception:
+                    if str(device) == "cpu": raise
+                    device = "cpu"; model = self._get_model(model_type, device, model_precision) # Same CPU fallback as transcribe_audio
+                with model_cache.inference_lock(model_type, device, model_precision, replica=self.model_replica):
+                    if not model_cache.is_warm(model_type, device, model_precision, replica=self.model_replica):
+                        self._warm_up(model)
+                        model_cache.mark_warm(model_type, device, model_precision, replica=self.model_replica)
+                    self._calibrate_threads(model, model_type, device, model_precision) # While the model is resident anyway
+                elapsed = time.time() - start_time
+                self._print(self.gui.translate("model_preloaded_info").format(model=model_type, device=str(device), seconds=elapsed))
+                self._notify_background_status("status_model_ready", model=model_type, seconds=elapsed)
+            except Exception as e:
+                self._print(self.gui.translate("error_model_preload").format(model=model_type, error=str(e)) + "\n")
+                self._notify_background_status("status_preload_failed", model=model_type)
+
+        thread = threading.Thread(target=run_preload, daemon=True)
+        with self._preload_lock: self._preload_thread = thread
+        thread.start()
+
+    @contextlib.contextmanager
+    def _cancellation_hooks(self, model):
+        """
+        Checks the stop flag before every encoder pass and every decoder step.
+
+        Whisper's decoding loop cleans up its KV-cache hooks in a finally block, so raising
+        from a forward pre-hook aborts the current window cleanly. Stop latency is therefore
+        bounded by a single encoder pass or decoder step instead of the whole file.
+        """
+        def check_stop(module, inputs):
+            if self.stop_requested: raise TranscriptionCancelled()
+        handles = [model.encoder.register_forward_pre_hook(check_stop), model.decoder.register_forward_pre_hook(check_stop)]
+        try: yield
+        finally:
+            for handle in handles: handle.remove()
+
+    def iter_segments(self, model, audio: np.ndarray, options: dict,
+                      progress_callback: typing.Optional[typing.Callable[[float, float], None]] = None,
+                      start_seek: int = 0, previous_text: str = "",
+                      on_window: typing.Optional[typing.Callable[[int, list[dict], str], None]] = None) -> typing.Iterator[dict]:
+        """
+        Decodes 16 kHz mono audio window by window and yields each segment as soon as its window is done.
+
+        Each segment is a dict with 'start'/'end' (seconds on the original timeline), 'text' and
+        Whisper's confidence fields. A segment that runs into the edge of a full window is dropped
+        and re-decoded at the start of the next window, so words are not cut in half.
+        start_seek/previous_text continue an earlier run from a window boundary; on_window(seek,
+        segments, prompt) is called once all of a window's segments have been consumed.
+        """
+        total_samples = len(audio); seek = start_seek; window_segments = []
+        while seek < total_samples:
+            if self.stop_requested: return # Cancellation point between windows
+            chunk = audio[seek:seek + WINDOW_SAMPLES]
+            is_last_window = seek + WINDOW_SAMPLES >= total_samples
+            window_options = dict(options)
+            if previous_text and window_options.get("condition_on_previous_text", True):
+                window_options["initial_prompt"] = previous_text[-PROMPT_CONTEXT_CHARS:]
+            result = model.transcribe(chunk, **window_options)
+            segments = result.get("segments", []) if result else []
+
+            advance = len(chunk)
+            if not is_last_window and len(segments) > 1:
+                last_complete_end = int(segments[-2]["end"] * SAMPLE_RATE)
+                if last_complete_end > 0: segments = segments[:-1]; advance = min(last_complete_end, len(chunk))
+
+            offset = seek / SAMPLE_RATE; window_segments = []
+            for segment in segments:
+                text = segment.get("text", "").strip()
+                if not text: continue
+                previous_text += " " + text
+                window_segments.append({
+                    "start": offset + segment["start"],
+                    "end": offset + segment["end"],
+                    "text": text,
+                    "avg_logprob": segment.get("avg_logprob"),
+                    "compression_ratio": segment.get("compression_ratio"),
+                    "no_speech_prob": segment.get("no_speech_prob"),
+                })
+                yield window_segments[-1]
+            seek += advance
+            if on_window: on_window(seek, window_segments, previous_text[-PROMPT_CONTEXT_CHARS:])
+            if progress_callback: progress_callback(min(seek, total_samples) / SAMPLE_RATE, total_samples / SAMPLE_RATE)
+
+    def _effective_precision(self, precision: str, device: typing.Union[str, object]) -> str:
+        """int8 dynamic quantization runs on CPU only; other devices use fp32."""
+        if precision == PRECISION_INT8 and str(device) != "cpu":
+            self._print(self.gui.translate("precision_int8_cpu_only_info")); return PRECISION_FP32
+        return precision if precision in PRECISIONS else PRECISION_FP32
+
+    def _get_model(self, model_type: str, device: typing.Union[str, object], precision: str = PRECISION_FP32):
+        """Gets a model from the cache; misses load from the model store, int8 models from the on-disk int8 cache (converted on a miss)."""
+        if precision == PRECISION_INT8: loader = lambda: load_quantized_model(model_type, self._print)
+        else: loader = lambda: model_store.load_model(model_type, device, log=self._print)
+        return model_cache.get(model_type, device, precision, loader=loader, replica=self.model_replica)
+
+    def _load_model(self, model_type: str, device: typing.Union[str, object], device_str: str, precision: str = PRECISION_FP32):
+        """Gets the model from the cache (waiting for a preload in progress), falling back to CPU."""
+        start_load_time = time.time(); model = None
+        if model_cache.is_loading(model_type, device, precision, replica=self.model_replica): self._print(self.gui.translate("waiting_for_preload_info"))
+        try: model = self._get_model(model_type, device, precision)
+        except Exception as e:
+            self._print(self.gui.translate("error_model_load").format(device=device_str, error=str(e)) + "\n")
+            if device_str != "cpu":
+                self._print("Retrying model load with CPU...\n"); device = "cpu"; device_str = "cpu"
+                model = self._get_model(model_type, device, precision)
+            else: raise
+        load_time = time.time() - start_load_time
+        self._print(self.gui.translate("model_loaded_info").format(minutes=int(load_time // 60), seconds=int(load_time % 60)))
+        stats = model_cache.stats()
+        self._print(self.gui.translate("model_cache_stats_info").format(hits=stats["hits"], misses=stats["misses"], resident_mb=stats["resident_mb"], budget_mb=stats["budget_mb"], load_time=stats["total_load_time"]))
+        return model, device, device_str
+
+    def _decode_sequential(self, model, model_type: str, device: typing.Union[str, object], audio: np.ndarray, options: dict,
+                           precision: str = PRECISION_FP32, progress_callback: typing.Optional[typing.Callable[[float, float], None]] = None,
+                           checkpoint: typing.Optional[CheckpointWriter] = None, resume: typing.Optional[dict] = None) -> list[dict]:
+        """
+        Decodes in this process window by window, streaming segments. Returns the segments decoded (partial on stop).
+        Each finished window is appended to checkpoint (closed on return); resume is a checkpoint state to continue from.
+        """
+        segments = list(resume["segments"]) if resume else []
+        for segment in segments: self._append_result(segment["text"])
+        progress_callback = progress_callback or (lambda done, total: self._set_progress_value(100.0 * done / total))
+        if resume: progress_callback(min(resume["seek"], len(audio)) / SAMPLE_RATE, len(audio) / SAMPLE_RATE)
+        try:
+            with model_cache.inference_lock(model_type, device, precision, replica=self.model_replica): # Waits for a warm-up pass still running on this model
+                try:
+                    with self._cancellation_hooks(model):
+                        for segment in self.iter_segments(model, audio, options, progress_callback=progress_callback,
+                                                          start_seek=resume["seek"] if resume else 0, previous_text=resume["previous_text"] if resume else "",
+                                                          on_window=checkpoint.write_window if checkpoint else None):
+                            segments.append(segment)
+                            self._append_result(segment["text"]) # Stream each segment into the result pane
+                except TranscriptionCancelled: pass # Stop requested mid-window: keep what was decoded so far
+        finally:
+            if checkpoint: checkpoint.close()
+        return segments
+
+    def _calibrate_threads(self, model: whisper.Whisper, model_type: str, device: typing.Union[str, object], precision: str):
+        """First CPU use of a model on this machine: measures the best thread count, once per process. Caller holds the inference lock."""
+        if str(device) != "cpu" or not thread_profiles.needs_calibration(model_type, device, precision): return
+        self._print(self.gui.translate("thread_calibration_info").format(model=model_type))
+        try: thread_profiles.calibrate(model_type, device, precision, lambda: self._warm_up(model), log=self._print)
+        except Exception as e: print(f"Transcriber Warning: thread calibration for {model_type} failed - {e}", file=sys.__stderr__)
+
+    def _apply_thread_count(self, model_type: str, device: typing.Union[str, object], precision: str, threads: int = 0,
+                            model: typing.Optional[whisper.Whisper] = None):
+        """
+        Sets torch's intra-op thread count for a CPU decode: manual override, calibrated profile or default.
+        With the loaded model passed and no override, an uncalibrated model is calibrated first.
+        """
+        if str(device) != "cpu": return
+        if model is not None and not (threads and threads > 0):
+            with model_cache.inference_lock(model_type, device, precision, replica=self.model_replica):
+                self._calibrate_threads(model, model_type, device, precision)
+        count, source = thread_profiles.threads_for(model_type, device, precision, override=threads, concurrent_jobs=self.concurrent_jobs)
+        torch.set_num_threads(count) # Process-wide: concurrent jobs all compute the same split
+        self.last_run["threads"] = count
+        self._print(self.gui.translate("cpu_threads_info").format(threads=count, source=source))
+
+    def _decode_two_pass(self, draft_model: str, model_type: str, device: typing.Union[str, object], device_str: str, audio: np.ndarray,
+                         options: dict, precision: str, threads: int, progress_callback: typing.Callable[[float, float], None]) -> list[dict]:
+        """
+        Draft pass with a small model (streamed at once), then re-decodes only the low-confidence
+        spans with the selected model, replacing the draft text in place. Returns the final segments.
+        """
+        total = len(audio) / SAMPLE_RATE
+        def report(fraction: float): progress_callback(fraction * total, total)
+
+        self._print(self.gui.translate("two_pass_draft_info").format(draft=draft_model, model=model_type))
+        draft, device, device_str = self._load_model(draft_model, device, device_str, precision)
+        self._apply_thread_count(draft_model, device, precision, threads, model=draft)
+        draft_options = {**options, **decode_options_for(PRESET_FAST)} # The draft only has to be quick
+        segments = self._decode_sequential(draft, draft_model, device, audio, draft_options, precision,
+                                           lambda done, total_seconds: report(DRAFT_PROGRESS_SHARE * done / total_seconds))
+        self.last_run["draft_segments"] = len(segments)
+        if self.stop_requested: return segments
+
+        spans = refinement_spans(segments, total); refine_seconds = spans_seconds(spans)
+        self._print(self.gui.translate("two_pass_refine_info").format(spans=len(spans), low=sum(span["last"] - span["first"] + 1 for span in spans),
+                                                                      segments=len(segments), seconds=int(refine_seconds), total=int(total)))
+        self.last_run.update(refined_spans=len(spans), refined_seconds=refine_seconds)
+        if not spans: report(1.0); return segments
+
+        load_start = time.time(); model, device, device_str = self._load_model(model_type, device, device_str, precision); self.last_run["load_time"] = time.time() - load_start
+        self._apply_thread_count(model_type, device, precision, threads, model=model)
+        replacements: dict[int, list[dict]] = {} # First draft index of a span -> refined segments
+        done_seconds = 0.0
+        # A streamed file was read to its end by the draft; spans come in file order, so one new forward pass reads them all
+        if not isinstance(audio, np.ndarray): audio = audio.reopened()
+        with model_cache.inference_lock(model_type, device, precision, replica=self.model_replica):
+            try:
+                with self._cancellation_hooks(model):
+                    for span in spans:
+                        if self.stop_requested: break
+                        previous_text = " ".join(segment["text"] for segment in segments[:span["first"]])[-PROMPT_CONTEXT_CHARS:]
+                        chunk = audio[int(span["start"] * SAMPLE_RATE):int(span["end"] * SAMPLE_RATE)] # At most MAX_SPAN_SECONDS (two_pass.py)
+                        span_progress = lambda done, total_span, before=done_seconds: report(DRAFT_PROGRESS_SHARE + (1.0 - DRAFT_PROGRESS_SHARE) * (before + done) / refine_seconds)
+                        refined = [{**segment, "start": span["start"] + segment["start"], "end": min(span["end"], span["start"] + segment["end"]), "refined": True}
+                                   for segment in self.iter_segments(model, chunk, options, progress_callback=span_progress, previous_text=previous_text)]
+                        if self.stop_requested: break # Half a span would drop draft text: the span keeps its draft
+                        replacements[span["first"]] = refined
+                        self._replace_result_segments(span["first"], span["last"], " ".join(segment["text"] for segment in refined))
+                        done_seconds += span["end"] - span["start"]
+                        report(DRAFT_PROGRESS_SHARE + (1.0 - DRAFT_PROGRESS_SHARE) * done_seconds / refine_seconds)
+            except TranscriptionCancelled: pass # Spans not refined yet keep their draft text
+
+        final_segments = []; index = 0
+        span_by_first = {span["first"]: span for span in spans}
+        while index < len(segments):
+            span = span_by_first.get(index)
+            if span is not None and index in replacements:
+                final_segments.extend(replacements[index]); index = span["last"] + 1
+            else: final_segments.append(segments[index]); index += 1
+        self.last_run["refined_segments"] = sum(len(refined) for refined in replacements.values())
+        return final_segments
+
+    def _decode_parallel(self, model_type: str, audio: np.ndarray, options: dict, workers: int, precision: str = PRECISION_FP32,
+                         progress_callback: typing.Optional[typing.Callable[[float, float], None]] = None) -> list[dict]:
+        """Splits the audio at silences and decodes the chunks in a process pool, streaming segments in order."""
+        parallel = ParallelTranscriber(model_type, workers, stop_check=lambda: self.stop_requested, precision=precision)
+        segments = parallel.transcribe(audio, options,
+                                       segment_callback=lambda segment: self._append_result(segment["text"]),
+                                       progress_callback=progress_callback or (lambda done, total: self._set_progress_value(100.0 * done / total)),
+                                       log_callback=self._print)
+        return segments
+
+    def _detect_speech(self, audio: np.ndarray) -> typing.Optional[SpeechTimeline]:
+        """Voice activity pre-pass. Returns the speech timeline, or None if there is too little silence to skip."""
+        start = time.time()
+        timeline = SpeechTimeline.from_audio(audio, SAMPLE_RATE)
+        elapsed_ms = int((time.time() - start) * 1000)
+        if timeline.regions and not timeline.is_worthwhile():
+            self._print(self.gui.translate("vad_not_applied_info").format(percent=100 * timeline.skipped_fraction, elapsed_ms=elapsed_ms))
+            return None
+        self._print(self.gui.translate("vad_info").format(regions=len(timeline.regions), skipped=int(timeline.skipped_seconds), duration=int(timeline.total_samples / SAMPLE_RATE), percent=100 * timeline.skipped_fraction, elapsed_ms=elapsed_ms))
+        return timeline
+
+    def _prepare_audio(self, input_file: str, stream: bool, skip_silence: bool) -> tuple[typing.Any, typing.Optional[SpeechTimeline], float]:
+        """
+        Decodes and resamples the audio (or opens it for window-by-window reading when stream is set)
+        and runs the voice activity pass, compacting the audio to its speech. Runs on a worker thread
+        while the model loads. Returns (audio, timeline or None, seconds spent).
+        """
+        start = time.time()
+        audio = open_stream(input_file) if stream else None
+        if audio is not None: self._print(self.gui.translate("streaming_audio_info").format(minutes=int(len(audio) / SAMPLE_RATE // 60), rate=audio.input_rate, source=audio.source))
+        else: audio = load_audio(input_file, log=self._print) # In-process for WAV/FLAC/OGG, ffmpeg otherwise
+        timeline = self._detect_speech(audio) if skip_silence else None
+        if timeline is not None and timeline.regions: audio = timeline.compact(audio)
+        return audio, timeline, time.time() - start
+
+    def _hash_audio(self, input_file: str) -> typing.Optional[str]:
+        """Hashes the audio content (result cache and archive key). Returns None if the file cannot be read."""
+        start = time.time()
+        try: audio_hash = result_cache.hash_file(input_file)
+        except OSError as e: print(f"ResultCache Warning: could not hash {input_file} - {e}", file=sys.__stderr__); return None
+        self._print(f"Result cache: hashed {os.path.basename(input_file)} in {(time.time() - start) * 1000:.0f} ms.\n")
+        return audio_hash
+
+    def _archive_transcript(self, audio_hash: typing.Optional[str], input_file: str, model_type: str, language: str,
+                            duration: float, segments: list[dict], replace: bool = True):
+        """Stores a finished transcript in the searchable archive (see transcript_archive.py)."""
+        if not audio_hash or not segments or not self.record_results: return
+        transcript_id = transcript_archive.add(audio_hash, segments, file=os.path.basename(input_file), path=os.path.abspath(input_file),
+                                               model=model_type, language=language, duration=duration, replace=replace)
+        if transcript_id is not None: self._print(self.gui.translate("archive_saved_info").format(segments=len(segments)))
+
+    def _open_checkpoint(self, checkpoint_key: str, total_samples: int, use_cache: bool, input_file: str,
+                         model_type: str) -> tuple[typing.Optional[CheckpointWriter], typing.Optional[dict]]:
+        """Loads the checkpoint of an interrupted run of this job (unless use_cache is off) and opens it for writing. Returns (writer, resume state)."""
+        resume = checkpoint_store.load(checkpoint_key, total_samples) if use_cache else None
+        if resume:
+            self._print(self.gui.translate("checkpoint_resume_info").format(segments=len(resume["segments"]), position=int(resume["seek"] / SAMPLE_RATE), total=int(total_samples / SAMPLE_RATE)))
+        checkpoint = checkpoint_store.open(checkpoint_key, total_samples, resume, file=os.path.basename(input_file), model=model_type)
+        return checkpoint, resume
+
+    def transcribe_audio(self, input_file: str, model_type: str, language: str, use_gpu: bool, system_type: str,
+                         parallel_workers: int = 1, skip_silence: bool = True, use_cache: bool = True,
+                         precision: str = PRECISION_FP32, threads: int = 0, preset: str = DEFAULT_DECODE_PRESET,
+                         draft_model: str = "") -> tuple[str, bool, bool]:
+        """
+        Performs the audio transcription process.
+
+        Args:
+            parallel_workers: Worker processes for long files on CPU (1 = decode in this process).
+            skip_silence: Run the voice activity pre-pass and decode only the speech regions.
+            use_cache: Return a stored result for the same audio and settings, or resume an interrupted run of
+                       it from its checkpoint; False recomputes (and refreshes the entry).
+            precision: "fp32" or "int8" (dynamic quantization of the Linear layers, CPU only).
+            threads: Torch CPU threads for this job (0 = calibrated value for this model and machine).
+            preset: Decode preset, "fast", "balanced" or "accurate" (see decode_presets.py).
+            draft_model: Small model ("tiny"/"base") for a quick draft pass; only low-confidence
+                         segments are then decoded with model_type (see two_pass.py). "" = single pass.
+        """
+        self.stop_requested = False; self._stop_requested_at = 0.0; transcription_result = ""; success = False; interrupted = False
+        self.last_run = {"duration": 0.0, "segments": 0, "cached": False, "load_time": 0.0, "transcribe_time": 0.0, "precision": precision}
         try:
             device = self.get_device(use_gpu, system_type)
             device_str = str(device) if not isinstance(device, str) else device # For logging
@@ -137,32 +546,85 @@ class AudioTranscriber:
 
             duration = self.get_audio_duration(input_file)
             if duration <= 0: self._print("Error: Invalid audio file or zero duration detected.\n"); raise ValueError("Invalid audio file or zero duration.")
-            estimated_time = self.estimate_time(duration, model_type)
+            self.last_run["duration"] = duration
             self._update_progress("progress_label_analyzing", "status_loading_model", progress_mode="indeterminate")
-            self._print(self.gui.translate("estimated_time_info").format(minutes=int(duration // 60), seconds=int(duration % 60), est_minutes=int(estimated_time // 60), est_seconds=int(estimated_time % 60)))
 
-            start_load_time = time.time(); model = None
-            try: model = whisper.load_model(model_type, device=device)
-            except Exception as e:
-                self._print(self.gui.translate("error_model_load").format(device=device_str, error=str(e)) + "\n")
-                if device_str != "cpu":
-                    self._print("Retrying model load with CPU...\n"); device = "cpu"; device_str = "cpu"
-                    model = whisper.load_model(model_type, device=device)
-                else: raise
-            if self.stop_requested: interrupted = True; transcription_result = self.gui.translate("progress_label_interrupted"); return transcription_result, success, interrupted
-            load_time = time.time() - start_load_time
-            self._print(self.gui.translate("model_loaded_info").format(minutes=int(load_time // 60), seconds=int(load_time % 60)))
-
-            self._update_progress("progress_label_transcribing", "status_transcribing", progress_mode="indeterminate")
+            precision = self._effective_precision(precision, device); self.last_run["precision"] = precision
+            preset = normalize_preset(preset); self.last_run["preset"] = preset
+            options = {'language': language, 'fp16': False, 'verbose': None, **decode_options_for(preset)}
+            if draft_model == model_type: draft_model = "" # Nothing to refine with
+            self.last_run["draft_model"] = draft_model
+            audio_hash = self._hash_audio(input_file)
+            cache_key = result_cache.make_key(audio_hash, model_type, language, {**options, 'skip_silence': skip_silence, 'precision': precision,
+                                                                                 **({'draft_model': draft_model} if draft_model else {})}) if audio_hash else None
+            if use_cache and cache_key:
+                cached = result_cache.get(cache_key)
+                if cached is not None:
+                    for segment in cached["segments"]: self._append_result(segment["text"])
+                    self._set_progress_value(100.0)
+                    self._print(self.gui.translate("result_cache_hit_info").format(segments=len(cached["segments"])))
+                    success = True; self.last_run.update(segments=len(cached["segments"]), cached=True)
+                    self._archive_transcript(audio_hash, input_file, model_type, language, duration, cached["segments"], replace=False)
+                    return cached["text"], success, interrupted
+
+            # Process-pool decoding only pays off for long files on CPU (each worker loads its own model)
+            use_parallel = parallel_workers > 1 and device_str == "cpu" and duration >= PARALLEL_MIN_SECONDS and not draft_model
+            checkpoint_key = cache_key if not use_parallel and not draft_model else None; checkpoint = resume = None # Single-pass in-process decoding is checkpointed per window
+            if parallel_workers > 1 and not use_parallel:
+                self._print(self.gui.translate("parallel_not_used_info").format(min_minutes=int(PARALLEL_MIN_SECONDS // 60)))
+            workers_used = parallel_workers if use_parallel else 1
+            model_resident = use_parallel or model_cache.is_loaded(model_type, device, precision, replica=self.model_replica)
+            history_preset = f"{preset}+draft-{draft_model}" if draft_model else preset # Two-pass runs have their own speed history
+            estimated_time, estimate_source = self.estimate_time(duration, model_type, device_str, precision, workers_used, preset=history_preset)
+            total_estimate = self.estimate_time(duration, model_type, device_str, precision, workers_used, include_load=not model_resident, preset=history_preset)[0]
+            self._print(self.gui.translate("estimated_time_info").format(minutes=int(duration // 60), seconds=int(duration % 60), est_minutes=int(total_estimate // 60), est_seconds=int(total_estimate % 60), source=estimate_source))
+            # Audio decode, resampling and the voice activity pass run on a worker thread while the model loads.
+            # Long files are sliced on demand so memory does not grow with the recording (the process pool needs the whole array)
+            audio_future: concurrent.futures.Future = concurrent.futures.Future()
+            def prepare_audio():
+                try: audio_future.set_result(self._prepare_audio(input_file, not use_parallel and duration >= STREAMING_MIN_SECONDS, skip_silence))
+                except BaseException as e: audio_future.set_exception(e)
+            threading.Thread(target=prepare_audio, daemon=True, name="AudioPrepare").start() # Daemon: a stop during the load leaves it behind
+            if not use_parallel and not draft_model: # The two-pass path loads the selected model after the draft is on screen
+                load_start = time.time(); model, device, device_str = self._load_model(model_type, device, device_str, precision); self.last_run["load_time"] = time.time() - load_start
+                if self.stop_requested: interrupted = True; transcription_result = self.gui.translate("progress_label_interrupted"); return transcription_result, success, interrupted
+            wait_start = time.time(); audio, timeline, audio_time = audio_future.result(); self.last_run["audio_time"] = audio_time
+            if not model_resident and not use_parallel and not draft_model:
+                self._print(self.gui.translate("audio_prepared_during_load_info").format(audio_seconds=audio_time, load_seconds=self.last_run["load_time"],
+                                                                                        waited_seconds=time.time() - wait_start))
+
+            self._update_progress("progress_label_transcribing", "status_transcribing", progress_mode="determinate")
             start_transcribe_time = time.time(); self._print(self.gui.translate("transcription_started_info"))
-            options = {'language': language, 'fp16': False, 'verbose': None}
-            result = model.transcribe(input_file, **options)
+            if timeline is not None and not timeline.regions:
+                self._print(self.gui.translate("vad_no_speech_info")); segments = []
+            else:
+                checkpoint, resume = self._open_checkpoint(checkpoint_key, len(audio), use_cache, input_file, model_type) if checkpoint_key else (None, None)
+                progress_callback = self._progress_callback(time.time(), estimated_time, resumed=resume["seek"] / SAMPLE_RATE if resume else 0.0)
+                if use_parallel: segments = self._decode_parallel(model_type, audio, options, parallel_workers, precision, progress_callback)
+                elif draft_model: segments = self._decode_two_pass(draft_model, model_type, device, device_str, audio, options, precision, threads, progress_callback)
+                else:
+                    self._apply_thread_count(model_type, device, precision, threads, model=model)
+                    segments = self._decode_sequential(model, model_type, device, audio, options, precision, progress_callback, checkpoint, resume)
+                if timeline is not None: segments = [timeline.remap_segment(segment) for segment in segments]
 
-            if self.stop_requested: interrupted = True; transcription_result = self.gui.translate("progress_label_interrupted"); self._print("\n" + transcription_result + "\n"); return transcription_result, success, interrupted
-            transcription_result = result["text"].strip() if result else ""
-            self.gui.result_text_set(transcription_result) # Call main app method
+            transcription_result = " ".join(segment["text"] for segment in segments)
+            self.last_run.update(segments=len(segments), transcribe_time=time.time() - start_transcribe_time)
+            if self.stop_requested:
+                # Return the partial transcript instead of discarding it
+                interrupted = True
+                stop_latency = time.time() - self._stop_requested_at if self._stop_requested_at else 0.0
+                processed = segments[-1]["end"] if segments else 0.0
+                self._print("\n" + self.gui.translate("transcription_stopped_partial_info").format(segments=len(segments), processed=int(processed), duration=int(duration), latency_ms=int(stop_latency * 1000)))
+                if checkpoint_key and (resume or (checkpoint and checkpoint.windows)): self._print(self.gui.translate("checkpoint_saved_info"))
+                return transcription_result, success, interrupted
             success = True
             transcribe_time = time.time() - start_transcribe_time
+            if cache_key: result_cache.put(cache_key, segments, file=os.path.basename(input_file), model=model_type, language=language, duration=duration, transcribe_time=transcribe_time)
+            if checkpoint_key: checkpoint_store.discard(checkpoint_key)
+            self._archive_transcript(audio_hash, input_file, model_type, language, duration, segments)
+            if not resume and self.record_results: # A resumed run decoded only part of the file, its time says nothing about the speed
+                rtf_history.record(model_type, device_str, precision, duration, transcribe_time,
+                                   load_time=None if model_resident else self.last_run["load_time"], parallel_workers=workers_used, preset=history_preset)
             self._print(self.gui.translate("transcription_finished_info").format(minutes=int(transcribe_time // 60), seconds=int(transcribe_time % 60)))
         except Exception as e:
             import traceback; detailed_error = traceback.format_exc()
@@ -171,10 +633,12 @@ class AudioTranscriber:
             transcription_result = f"{self.gui.translate('error_title')}: {e}"; success = False
         return transcription_result, success, interrupted
 
-    def start_transcription_async(self, input_file: str, model_type: str, language: str, use_gpu: bool, system_type: str):
-        """Starts the transcription process in a separate thread."""
+    def start_transcription_async(self, input_file: str, model_type: str, language: str, use_gpu: bool, system_type: str, **options):
+        """Starts the transcription process in a separate thread. Extra options are passed to transcribe_audio."""
         def run_transcription():
-            transcription, success, interrupted = self.transcribe_audio(input_file, model_type, language, use_gpu, system_type)
+            self.is_running = True
+            try: transcription, success, interrupted = self.transcribe_audio(input_file, model_type, language, use_gpu, system_type, **options)
+            finally: self.is_running = False
             # Finalize UI via main app's method (which delegates)
             self._finalize_ui(success=success, interrupted=interrupted)
             # Show popups/messages via main app's method
@@ -185,7 +649,76 @@ class AudioTranscriber:
 
     def request_stop(self):
         """Sets the flag to request transcription stop."""
-        self._print("Stop requested. Finishing current segment...\n")
+        self._print("Stop requested. Stopping after the current decoding step...\n")
+        self._stop_requested_at = time.time()
         self.stop_requested = True
 
+
+class RemoteTranscriber(AudioTranscriber):
+    """
+    AudioTranscriber that runs jobs on the local transcription daemon (daemon.py), so several
+    app instances share one resident copy of each model. Falls back to in-process decoding
+    when the daemon is not running.
+    """
+
+    def __init__(self, gui_app: 'ModernTranscriptionApp', daemon_url: str):
+        super().__init__(gui_app)
+        self.client = DaemonClient(daemon_url)
+        self._remote_job_id: typing.Optional[str] = None
+
+    def _ui_language(self) -> str:
+        language_var = getattr(self.gui, 'current_language', None)
+        return language_var.get() if language_var is not None else "English"
+
+    def preload_model(self, model_type: str, use_gpu: bool, system_type: str, precision: str = PRECISION_FP32):
+        """Asks the daemon to warm the model; preloads locally if the daemon is not running."""
+        def run_preload():
+            try:
+                self.client.preload(model_type, use_gpu, precision)
+                self._print(self.gui.translate("daemon_preload_info").format(model=model_type, url=self.client.url))
+            except DaemonUnavailable: AudioTranscriber.preload_model(self, model_type, use_gpu, system_type, precision)
+            except Exception as e: self._print(self.gui.translate("error_model_preload").format(model=model_type, error=str(e)) + "\n")
+        threading.Thread(target=run_preload, daemon=True).start()
+
+    def transcribe_audio(self, input_file: str, model_type: str, language: str, use_gpu: bool, system_type: str,
+                         **options) -> tuple[str, bool, bool]:
+        """Streams the job from the daemon into the GUI. Same options and return value as AudioTranscriber."""
+        self.stop_requested = False; self._stop_requested_at = 0.0; self._remote_job_id = None
+        handlers = {
+            "started": lambda event: setattr(self, '_remote_job_id', event["job_id"]),
+            "print": lambda event: self._print(event["message"]),
+            "progress_state": lambda event: self._update_progress(event["task_key"], event["status_key"], event["mode"]),
+            "progress": lambda event: self._set_progress_value(event["percent"]),
+            "eta": lambda event: self._set_progress_eta(event["seconds"]),
+            "segments_replace": lambda event: self._replace_result_segments(event["first"], event["last"], event["text"]),
+            "segment": lambda event: self._append_result(event["text"]),
+            "show_error": lambda event: self._show_error(event["key"], **event.get("kwargs", {})),
+        }
+        def on_event(event: dict):
+            handler = handlers.get(event.get("event"))
+            if handler: handler(event)
+            if event.get("event") == "started" and self.stop_requested: self.client.cancel(event["job_id"]) # Stop pressed while connecting
+        try:
+            done = self.client.transcribe(os.path.abspath(input_file), model_type, language, use_gpu, options,
+                                          ui_language=self._ui_language(), on_event=on_event)
+        except DaemonUnavailable as e:
+            self._print(self.gui.translate("daemon_unavailable_info").format(url=self.client.url, error=str(e)))
+            return super().transcribe_audio(input_file, model_type, language, use_gpu, system_type, **options)
+        except Exception as e:
+            self._print(f"\n--- TRANSCRIPTION ERROR (daemon) ---\n{e}\n--------------------------\n")
+            self._show_error("status_error", error=str(e))
+            return f"{self.gui.translate('error_title')}: {e}", False, False
+        finally:
+            self._remote_job_id = None
+        self.last_run = done.get("run", {})
+        return done.get("text", ""), bool(done.get("success")), bool(done.get("interrupted"))
+
+    def request_stop(self):
+        """Stops the daemon job (or the local fallback job)."""
+        super().request_stop()
+        job_id = self._remote_job_id
+        if job_id:
+            try: self.client.cancel(job_id)
+            except Exception as e: print(f"RemoteTranscriber Warning: cancel of job {job_id} failed - {e}", file=sys.__stderr__)
+
 # --- END OF CORRECTED transcriber.py ---
\ No newline at end of file
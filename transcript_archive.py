@@ -0,0 +1,189 @@
+# --- START OF FILE transcript_archive.py ---
+
+import os
+import re
+import sys
+import time
+import sqlite3
+import threading
+import typing
+
+ARCHIVE_DB_FILE = "transcripts.db" # Created next to config.json
+DEFAULT_SEARCH_LIMIT = 200
+SNIPPET_TOKENS = 16 # Words around the match in search snippets
+RANKED_MATCHES_MAX = 2000 # Queries matching more segments are listed newest first: bm25 over every match of a common word costs ~1 µs per row
+# Scripts written without spaces: the word tokenizer sees a whole sentence as one token, so they use substring search
+_UNSEGMENTED_SCRIPT = re.compile("[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    audio_hash TEXT NOT NULL,
+    file TEXT, path TEXT, model TEXT, language TEXT,
+    duration REAL, created_at REAL, segment_count INTEGER, text TEXT,
+    UNIQUE (audio_hash, model, language)
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    transcript_id INTEGER NOT NULL REFERENCES transcripts(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL, start_time REAL, end_time REAL, text TEXT
+);
+CREATE INDEX IF NOT EXISTS segments_by_transcript ON segments (transcript_id, position);
+"""
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(text, content='segments', content_rowid='id', tokenize='unicode61 remove_diacritics 2');
+CREATE TRIGGER IF NOT EXISTS segments_fts_insert AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_fts_delete AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts (segments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+class TranscriptArchive:
+    """
+    Local SQLite archive of finished transcriptions, searchable at segment level.
+
+    Each transcript is stored once per (audio hash, model, language), with its segments and
+    their timestamps; re-transcribing the same audio with the same settings replaces it.
+    Segment text is indexed with FTS5 (external content, kept in sync by triggers), so a
+    search across thousands of transcripts is an index lookup ranked by bm25. Queries in
+    scripts without word spacing (Chinese, Japanese, ...), or SQLite builds without FTS5,
+    fall back to a substring scan.
+    """
+
+    def __init__(self, db_path: str = ARCHIVE_DB_FILE):
+        self.db_path = db_path
+        self._lock = threading.Lock() # One connection shared by the GUI thread and transcription threads
+        self._conn: typing.Optional[sqlite3.Connection] = None
+        self.fts_enabled = False
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10.0) # Daemon and GUI processes may write concurrently
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL"); conn.execute("PRAGMA synchronous=NORMAL"); conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(_SCHEMA)
+            try: conn.executescript(_FTS_SCHEMA); self.fts_enabled = True
+            except sqlite3.OperationalError as e: print(f"TranscriptArchive Warning: FTS5 not available ({e}), using substring search.", file=sys.__stderr__)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def add(self, audio_hash: str, segments: list[dict], file: str = "", path: str = "", model: str = "", language: str = "",
+            duration: float = 0.0, replace: bool = True) -> typing.Optional[int]:
+        """
+        Stores a transcript with its segments ('start'/'end' seconds and 'text'). With replace=False an
+        existing transcript of the same audio and settings is kept. Returns the transcript id, None on error.
+        """
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    existing = conn.execute("SELECT id FROM transcripts WHERE audio_hash = ? AND model = ? AND language = ?",
+                                            (audio_hash, model, language)).fetchone()
+                    if existing is not None:
+                        if not replace: return existing["id"]
+                        conn.execute("DELETE FROM segments WHERE transcript_id = ?", (existing["id"],)) # Explicit, so the FTS trigger sees each row
+                        conn.execute("DELETE FROM transcripts WHERE id = ?", (existing["id"],))
+                    cursor = conn.execute(
+                        "INSERT INTO transcripts (audio_hash, file, path, model, language, duration, created_at, segment_count, text) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (audio_hash, file, path, model, language, duration, time.time(), len(segments), " ".join(segment["text"] for segment in segments)))
+                    transcript_id = cursor.lastrowid
+                    conn.executemany("INSERT INTO segments (transcript_id, position, start_time, end_time, text) VALUES (?, ?, ?, ?, ?)",
+                                     [(transcript_id, position, segment.get("start"), segment.get("end"), segment["text"]) for position, segment in enumerate(segments)])
+                return transcript_id
+        except sqlite3.Error as e:
+            print(f"TranscriptArchive Warning: could not store transcript of {file or audio_hash} - {e}", file=sys.__stderr__)
+            return None
+
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Turns free text into an FTS5 query: all words must match, the last one as a prefix; "..." searches a phrase."""
+        words = re.findall(r"\w+", query)
+        if not words: return ""
+        stripped = query.strip()
+        if len(stripped) > 1 and stripped[0] == stripped[-1] == '"': return '"' + " ".join(words) + '"'
+        return " ".join(f'"{word}"' for word in words[:-1]) + (" " if len(words) > 1 else "") + f'"{words[-1]}"*'
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> list[dict]:
+        """
+        Segments matching the query, best match first (newest first when more than
+        RANKED_MATCHES_MAX segments match). Each result has the transcript's
+        'transcript_id', 'file', 'path', 'model', 'language' and the segment's 'segment_id',
+        'position', 'start', 'end', 'text' and 'snippet' (matches wrapped in [ ]).
+        """
+        query = query.strip()
+        if not query: return []
+        fields = ("t.id AS transcript_id, t.file, t.path, t.model, t.language, s.id AS segment_id, s.position, "
+                  "s.start_time AS start, s.end_time AS end, s.text")
+        try:
+            with self._lock:
+                conn = self._connection()
+                fts_query = self._fts_query(query)
+                if self.fts_enabled and fts_query and not _UNSEGMENTED_SCRIPT.search(query):
+                    # Newest-first is an index walk that stops at the limit; bm25 has to score every match before sorting
+                    broad = len(conn.execute("SELECT rowid FROM segments_fts WHERE segments_fts MATCH ? ORDER BY rowid DESC LIMIT ?",
+                                             (fts_query, RANKED_MATCHES_MAX + 1)).fetchall()) > RANKED_MATCHES_MAX
+                    order = "segments_fts.rowid DESC" if broad else "bm25(segments_fts)"
+                    rows = conn.execute(
+                        f"SELECT {fields}, snippet(segments_fts, 0, '[', ']', '…', {SNIPPET_TOKENS}) AS snippet "
+                        "FROM segments_fts JOIN segments s ON s.id = segments_fts.rowid JOIN transcripts t ON t.id = s.transcript_id "
+                        f"WHERE segments_fts MATCH ? ORDER BY {order} LIMIT ?", (fts_query, limit)).fetchall()
+                else:
+                    pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                    rows = conn.execute(
+                        f"SELECT {fields}, s.text AS snippet FROM segments s JOIN transcripts t ON t.id = s.transcript_id "
+                        "WHERE s.text LIKE ? ESCAPE '\\' ORDER BY t.created_at DESC, s.position LIMIT ?", (pattern, limit)).fetchall()
+            return [dict(row) for row in rows]
+        except sqlite3.Error as e:
+            print(f"TranscriptArchive Warning: search for '{query}' failed - {e}", file=sys.__stderr__)
+            return []
+
+    def get_transcript(self, transcript_id: int) -> typing.Optional[dict]:
+        """The transcript's fields plus 'segments' (dicts with 'segment_id', 'start', 'end', 'text'), or None."""
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute("SELECT * FROM transcripts WHERE id = ?", (transcript_id,)).fetchone()
+                if row is None: return None
+                segments = conn.execute("SELECT id AS segment_id, start_time AS start, end_time AS end, text FROM segments "
+                                        "WHERE transcript_id = ? ORDER BY position", (transcript_id,)).fetchall()
+            transcript = dict(row); transcript["segments"] = [dict(segment) for segment in segments]
+            return transcript
+        except sqlite3.Error as e:
+            print(f"TranscriptArchive Warning: could not read transcript {transcript_id} - {e}", file=sys.__stderr__)
+            return None
+
+    def delete(self, transcript_id: int) -> bool:
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute("DELETE FROM segments WHERE transcript_id = ?", (transcript_id,))
+                    return conn.execute("DELETE FROM transcripts WHERE id = ?", (transcript_id,)).rowcount > 0
+        except sqlite3.Error as e:
+            print(f"TranscriptArchive Warning: could not delete transcript {transcript_id} - {e}", file=sys.__stderr__)
+            return False
+
+    def stats(self) -> dict:
+        try:
+            with self._lock:
+                conn = self._connection()
+                transcripts = conn.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+                segments = conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"TranscriptArchive Warning: could not read stats - {e}", file=sys.__stderr__)
+            transcripts = segments = 0
+        size_mb = os.path.getsize(self.db_path) / (1024 * 1024) if os.path.exists(self.db_path) else 0.0
+        return {"transcripts": transcripts, "segments": segments, "size_mb": round(size_mb, 1), "fts": self.fts_enabled}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None: self._conn.close(); self._conn = None
+
+# Process-wide instance shared by the transcriber, the batch queue and the Archive tab
+transcript_archive = TranscriptArchive()
+
+# --- END OF FILE transcript_archive.py ---
@@ -6,6 +6,8 @@ import os
 import sys
 import typing
 from utils import format_duration
+from decode_presets import DECODE_PRESET_NAMES, normalize_preset
+from two_pass import DRAFT_MODELS
 
 if typing.TYPE_CHECKING:
     from gui import ModernTranscriptionApp
@@ -13,6 +15,7 @@ if typing.TYPE_CHECKING:
 
 class TranscriptionTabUI:
     """Manages the UI and logic for the Transcription Tab."""
+    REFINED_TEXT_COLOR = '#1a5fb4' # Text re-decoded by the refine pass of a two-pass run
 
     def __init__(self, parent_notebook: ttk.Notebook, gui_app: 'ModernTranscriptionApp'):
         self.parent_notebook = parent_notebook
@@ -28,6 +31,16 @@ class TranscriptionTabUI:
         self.model_var = self.gui_app.model_var
         self.transcription_language_var = self.gui_app.transcription_language_var
         self.use_gpu_var = self.gui_app.use_gpu_var
+        self.parallel_workers_var = self.gui_app.parallel_workers_var
+        self.skip_silence_var = self.gui_app.skip_silence_var
+        self.bypass_cache_var = self.gui_app.bypass_cache_var
+        self.precision_var = self.gui_app.precision_var
+        self.threads_var = self.gui_app.threads_var
+        self.preset_var = self.gui_app.preset_var
+        self.two_pass_var = self.gui_app.two_pass_var
+        self.draft_model_var = self.gui_app.draft_model_var
+        self._streamed_segments = 0 # Segments in the result pane, each tagged "seg<N>" for in-place replacement
+        self.preset_display_var = tk.StringVar() # Translated name of the selected preset
         self.progress_var = self.gui_app.progress_var
         self.current_task_var = self.gui_app.current_task # Label above progress bar
         self.model_desc_var = self.gui_app.model_desc_var # Label next to model dropdown
@@ -80,12 +93,57 @@ class TranscriptionTabUI:
         self.language_combobox.grid(row=1, column=1, sticky="w", padx=5, pady=5)
         # self.language_combobox.set(self.transcription_language_var.get()) # Set happens via textvariable sync
 
+        preset_frame = ttk.Frame(self.options_frame)
+        preset_frame.grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
+        self.preset_label = ttk.Label(preset_frame, text="") # TEXT REMOVED
+        self.preset_label.pack(side=tk.LEFT, padx=(0, 5))
+        self.preset_combobox = ttk.Combobox(preset_frame, textvariable=self.preset_display_var, state="readonly", width=12)
+        self.preset_combobox.pack(side=tk.LEFT)
+        self.preset_combobox.bind("<<ComboboxSelected>>", self._on_preset_selected)
+        self.preset_desc_label = ttk.Label(preset_frame, text="", anchor="w") # TEXT REMOVED
+        self.preset_desc_label.pack(side=tk.LEFT, padx=(5, 0))
+        self.preset_var.trace_add("write", lambda *args: self.update_preset_display())
+
         self.acceleration_label = ttk.Label(self.options_frame, text="") # TEXT REMOVED
         self.acceleration_label.grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
         self.gpu_check = ttk.Checkbutton(self.options_frame, text="", variable=self.use_gpu_var) # TEXT REMOVED
-        self.gpu_check.grid(row=2, column=1, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        self.gpu_check.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
         self.gpu_check.bind("<Enter>", self.show_gpu_tooltip)
         self.gpu_check.bind("<Leave>", self._on_leave_tooltip)
+        precision_frame = ttk.Frame(self.options_frame)
+        precision_frame.grid(row=2, column=2, sticky=tk.W, padx=5, pady=5)
+        self.precision_label = ttk.Label(precision_frame, text="") # TEXT REMOVED
+        self.precision_label.pack(side=tk.LEFT, padx=(0, 5))
+        self.precision_combobox = ttk.Combobox(precision_frame, textvariable=self.precision_var, values=["fp32", "int8"], state="readonly", width=6)
+        self.precision_combobox.pack(side=tk.LEFT)
+        self.precision_hint_label = ttk.Label(precision_frame, text="") # TEXT REMOVED
+        self.precision_hint_label.pack(side=tk.LEFT, padx=(5, 0))
+
+        self.parallel_label = ttk.Label(self.options_frame, text="") # TEXT REMOVED
+        self.parallel_label.grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.parallel_spinbox = ttk.Spinbox(self.options_frame, from_=1, to=max(1, os.cpu_count() or 1), textvariable=self.parallel_workers_var, width=5, state="readonly")
+        self.parallel_spinbox.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+        self.parallel_hint_label = ttk.Label(self.options_frame, text="", anchor="w") # TEXT REMOVED
+        self.parallel_hint_label.grid(row=3, column=2, sticky="ew", padx=5, pady=5)
+
+        self.skip_silence_check = ttk.Checkbutton(self.options_frame, text="", variable=self.skip_silence_var) # TEXT REMOVED
+        self.skip_silence_check.grid(row=4, column=1, sticky=tk.W, padx=5, pady=5)
+        self.bypass_cache_check = ttk.Checkbutton(self.options_frame, text="", variable=self.bypass_cache_var) # TEXT REMOVED
+        self.bypass_cache_check.grid(row=5, column=1, columnspan=2, sticky=tk.W, padx=5, pady=5)
+
+        two_pass_frame = ttk.Frame(self.options_frame)
+        two_pass_frame.grid(row=4, column=2, sticky=tk.W, padx=5, pady=5)
+        self.two_pass_check = ttk.Checkbutton(two_pass_frame, text="", variable=self.two_pass_var) # TEXT REMOVED
+        self.two_pass_check.pack(side=tk.LEFT)
+        self.draft_model_combobox = ttk.Combobox(two_pass_frame, textvariable=self.draft_model_var, values=DRAFT_MODELS, state="readonly", width=6)
+        self.draft_model_combobox.pack(side=tk.LEFT, padx=(5, 0))
+
+        self.threads_label = ttk.Label(self.options_frame, text="") # TEXT REMOVED
+        self.threads_label.grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
+        self.threads_spinbox = ttk.Spinbox(self.options_frame, from_=0, to=max(1, os.cpu_count() or 1), textvariable=self.threads_var, width=5, state="readonly")
+        self.threads_spinbox.grid(row=6, column=1, sticky=tk.W, padx=5, pady=5)
+        self.threads_hint_label = ttk.Label(self.options_frame, text="", anchor="w") # TEXT REMOVED
+        self.threads_hint_label.grid(row=6, column=2, sticky="ew", padx=5, pady=5)
 
         # --- Buttons ---
         buttons_frame = ttk.Frame(self.frame)
@@ -134,6 +192,7 @@ class TranscriptionTabUI:
         result_text_frame.columnconfigure(0, weight=1)
         self.result_text = scrolledtext.ScrolledText(result_text_frame, wrap=tk.WORD, width=80, height=10, font=("Segoe UI", 11), background="white", foreground=self.gui_app.text_color, borderwidth=0, relief="flat")
         self.result_text.grid(row=0, column=0, sticky="nsew", padx=1, pady=1)
+        self.result_text.tag_configure("refined", foreground=self.REFINED_TEXT_COLOR)
 
         # --- Console Output Tab ---
         console_frame = ttk.Frame(self.results_notebook, padding=10)
@@ -169,6 +228,15 @@ class TranscriptionTabUI:
             self._safe_config(self.transcription_result_label, text=self.gui_app.translate("transcription_result_label"))
             self._safe_config(self.console_output_label, text=self.gui_app.translate("console_output_label"))
             self._safe_config(self.gpu_check, text=self.gui_app.translate("use_gpu_checkbox"))
+            self._safe_config(self.precision_label, text=self.gui_app.translate("precision_label"))
+            self._safe_config(self.precision_hint_label, text=self.gui_app.translate("precision_hint"))
+            self._safe_config(self.parallel_label, text=self.gui_app.translate("parallel_workers_label"))
+            self._safe_config(self.parallel_hint_label, text=self.gui_app.translate("parallel_workers_hint"))
+            self._safe_config(self.skip_silence_check, text=self.gui_app.translate("skip_silence_checkbox"))
+            self._safe_config(self.bypass_cache_check, text=self.gui_app.translate("bypass_cache_checkbox"))
+            self._safe_config(self.two_pass_check, text=self.gui_app.translate("two_pass_checkbox"))
+            self._safe_config(self.threads_label, text=self.gui_app.translate("cpu_threads_label"))
+            self._safe_config(self.threads_hint_label, text=self.gui_app.translate("cpu_threads_hint"))
             self._safe_config(self.browse_button, text=self.gui_app.translate("browse_button"))
             self._safe_config(self.start_button, text=self.gui_app.translate("start_button"))
             self._safe_config(self.stop_button, text=self.gui_app.translate("stop_button"))
@@ -186,6 +254,8 @@ class TranscriptionTabUI:
 
             # Update model description (this method already has internal checks)
             self.update_model_description()
+            self._safe_config(self.preset_label, text=self.gui_app.translate("preset_label"))
+            self.update_preset_display()
 
             # Update current task label if it's showing a placeholder/key
             current_task_text = self.current_task_var.get()
@@ -220,6 +290,19 @@ class TranscriptionTabUI:
         except tk.TclError as e: print(f"TclError updating model description: {e}", file=sys.__stderr__)
         except Exception as e: import traceback; print(f"Error in update_model_description: {e}\n{traceback.format_exc()}", file=sys.__stderr__)
 
+    def update_preset_display(self):
+        """Shows the selected decode preset's translated name and description."""
+        try:
+            preset = normalize_preset(self.preset_var.get())
+            self.preset_combobox.configure(values=[self.gui_app.translate(f"preset_{name}") for name in DECODE_PRESET_NAMES])
+            self.preset_display_var.set(self.gui_app.translate(f"preset_{preset}"))
+            self._safe_config(self.preset_desc_label, text=self.gui_app.translate(f"preset_{preset}_desc"))
+        except tk.TclError as e: print(f"TclError updating preset display: {e}", file=sys.__stderr__)
+
+    def _on_preset_selected(self, event=None):
+        index = self.preset_combobox.current()
+        if 0 <= index < len(DECODE_PRESET_NAMES): self.preset_var.set(DECODE_PRESET_NAMES[index])
+
     def select_file(self):
         # (Unchanged - seems robust)
         initial_dir = os.path.dirname(self.file_path_var.get()) if self.file_path_var.get() else os.path.expanduser("~")
@@ -238,21 +321,20 @@ class TranscriptionTabUI:
             filename = os.path.basename(file)
             # Use main app's print method to ensure it goes to console widget
             self.gui_app._print(f"{self.gui_app.translate('selected_file_label')}: {filename}\n")
-            # Try reading WAV info specifically
-            if file.lower().endswith(".wav"):
-                try:
-                    file_info = self.transcriber.get_audio_info(file)
-                    if file_info:
-                        duration, channels, rate = file_info
-                        duration_str = format_duration(duration)
-                        info_msg = self.gui_app.translate("selected_file_info").format(
-                            filename=filename, duration=duration_str, channels=channels, rate=rate
-                        )
-                        self.gui_app._print(info_msg + "\n")
-                    else:
-                        self.gui_app._print(f"{self.gui_app.translate('error_reading_wav_info').format(filename=filename)}\n")
-                except Exception as e:
-                    self.gui_app._print(f"Error reading WAV info for {filename}: {e}\n")
+            # Header metadata works for every format in the dialog (nothing is decoded)
+            try:
+                file_info = self.transcriber.get_audio_info(file)
+                if file_info:
+                    duration, channels, rate = file_info
+                    duration_str = format_duration(duration)
+                    info_msg = self.gui_app.translate("selected_file_info").format(
+                        filename=filename, duration=duration_str, channels=channels, rate=rate
+                    )
+                    self.gui_app._print(info_msg + "\n")
+                else:
+                    self.gui_app._print(f"{self.gui_app.translate('error_reading_wav_info').format(filename=filename)}\n")
+            except Exception as e:
+                self.gui_app._print(f"Error reading audio info for {filename}: {e}\n")
 
 
     def start_transcription(self):
@@ -277,7 +359,7 @@ class TranscriptionTabUI:
         self.console_output_delete_all() # Clear console
         self.result_text_clear() # Clear previous results
 
-        self.transcriber.start_transcription_async(input_file, model_type, language_code, use_gpu, self.gui_app.system_type)
+        self.transcriber.start_transcription_async(input_file, model_type, language_code, use_gpu, self.gui_app.system_type, **self.gui_app.get_transcription_options())
 
     def stop_transcription(self):
         # (Unchanged - seems robust)
@@ -413,9 +495,10 @@ class TranscriptionTabUI:
                     pb.config(mode="determinate")
                     self.progress_var.set(0)
                 elif progress_mode == "determinate":
-                    # For future use if specific progress % is available
-                    pb.config(mode="determinate")
-                    # self.progress_var.set(percentage_value) # Example
+                    # Value (0-100) is pushed by the transcriber through gui_app._set_progress_value
+                    pb.stop()
+                    pb.config(mode="determinate", maximum=100)
+                    self.progress_var.set(0)
         except tk.TclError:
             print(f"TranscriptionTab TclError updating progress: Task={task_text}", file=sys.__stderr__)
         except Exception as e:
@@ -455,6 +538,7 @@ class TranscriptionTabUI:
             try:
                 self.result_text.config(state=tk.NORMAL)
                 self.result_text.delete(1.0, tk.END)
+                self._streamed_segments = 0
                 self.result_text.insert(tk.END, text)
                 self.result_text.see(tk.END) # Scroll to the end
                 # Keep NORMAL state for potential copying
@@ -464,12 +548,42 @@ class TranscriptionTabUI:
                 print(f"Error in result_text_set: {e}", file=sys.__stderr__)
 
 
+    def result_text_append(self, text):
+        """Appends one streamed segment without re-inserting the whole document."""
+        if self._widget_exists('result_text'):
+            try:
+                self.result_text.config(state=tk.NORMAL)
+                # Separate from the previous segment unless the pane is still empty
+                if self.result_text.compare("end-1c", "!=", "1.0"): text = " " + text
+                self.result_text.insert(tk.END, text, f"seg{self._streamed_segments}")
+                self._streamed_segments += 1
+                self.result_text.see(tk.END)
+            except tk.TclError:
+                print("TclError appending result text.", file=sys.__stderr__)
+            except Exception as e:
+                print(f"Error in result_text_append: {e}", file=sys.__stderr__)
+
+    def result_segments_replace(self, first, last, text):
+        """Replaces streamed segments first..last (inclusive) with refined text, keeping the scroll position."""
+        if not self._widget_exists('result_text'): return
+        try:
+            first_range = self.result_text.tag_ranges(f"seg{first}"); last_range = self.result_text.tag_ranges(f"seg{last}")
+            if not first_range or not last_range: return
+            start, end = first_range[0], last_range[-1]
+            leading_space = self.result_text.get(start) == " "
+            self.result_text.config(state=tk.NORMAL)
+            self.result_text.delete(start, end)
+            if text: self.result_text.insert(start, (" " if leading_space else "") + text, (f"seg{first}", "refined"))
+        except tk.TclError:
+            print("TclError replacing result segments.", file=sys.__stderr__)
+
     def result_text_clear(self):
         # (Unchanged - seems robust)
          if self._widget_exists('result_text'):
             try:
                  self.result_text.config(state=tk.NORMAL)
                  self.result_text.delete(1.0, tk.END)
+                 self._streamed_segments = 0
             except tk.TclError:
                 print("TclError clearing result text.", file=sys.__stderr__)
             except Exception as e:
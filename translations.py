@@ -44,10 +44,10 @@ base = {
     "welcome_message": "Welcome to AudioScript! Select an audio file and options, then start transcription.",
     "selected_file_label": "Selected file", # Used in console log
     "selected_file_info": "Selected: {filename} (Duration: {duration}, Channels: {channels}, Rate: {rate} Hz)",
-    "error_reading_wav_info": "Could not read WAV info for {filename}",
-    "stop_requested_info": "Stop requested. Finishing current segment...",
+    "error_reading_wav_info": "Could not read audio info for {filename}",
+    "stop_requested_info": "Stop requested. Stopping after the current decoding step...",
     "transcriber_config_info": "Starting transcription: Model={model_type}, Language={language}, Device={device}\n",
-    "estimated_time_info": "Audio duration: {minutes:02d}:{seconds:02d}. Estimated time: ~{est_minutes:02d}:{est_seconds:02d}.\n",
+    "estimated_time_info": "Audio duration: {minutes:02d}:{seconds:02d}. Estimated time: ~{est_minutes:02d}:{est_seconds:02d} ({source}).\n",
     "model_loaded_info": "Model loaded in {minutes:02d}:{seconds:02d}.\n",
     "transcription_started_info": "Transcription process started...\n",
     "transcription_finished_info": "\nTranscription finished in {minutes:02d}:{seconds:02d}.",
@@ -82,6 +82,102 @@ base = {
     "text_files_label": "Text Files",
     "save_transcription_title": "Save Transcription As...",
     "transcription_saved_to": "Transcription saved to", # Console message
+    "model_cache_stats_info": "Model cache: {hits} hits, {misses} misses, {resident_mb:.0f}/{budget_mb:.0f} MB resident, {load_time:.1f}s total load time.\n",
+    "status_preloading_model": "Preloading model '{model}'...",
+    "status_model_ready": "Model '{model}' ready ({seconds:.1f}s)",
+    "status_preload_failed": "Model '{model}' preload failed",
+    "model_preloaded_info": "Model '{model}' preloaded and warmed up on {device} in {seconds:.1f}s.\n",
+    "error_model_preload": "ERROR preloading model '{model}': {error}",
+    "waiting_for_preload_info": "Waiting for the background model preload to finish...\n",
+    "transcription_stopped_partial_info": "Transcription stopped after {segments} segments ({processed}s of {duration}s processed, stop latency {latency_ms} ms). Partial transcript kept.\n",
+    "tab_batch": "Batch",
+    "batch_add_files_button": "Add Files...",
+    "batch_add_folder_button": "Add Folder...",
+    "batch_start_button": "▶ Start Queue",
+    "batch_stop_button": "■ Stop Queue",
+    "batch_retry_button": "Retry Failed",
+    "batch_clear_button": "Clear Finished",
+    "batch_options_frame": "Batch Options",
+    "batch_workers_label": "Workers:",
+    "batch_output_dir_label": "Output folder (empty = next to audio):",
+    "batch_column_file": "File",
+    "batch_column_status": "Status",
+    "batch_column_progress": "Progress",
+    "batch_column_duration": "Duration",
+    "batch_column_elapsed": "Elapsed",
+    "batch_status_pending": "Pending",
+    "batch_status_running": "Running",
+    "batch_status_done": "Done",
+    "batch_status_error": "Error",
+    "batch_summary": "Jobs: {done}/{total} done, {running} running, {failed} failed | Throughput: {throughput:.2f}x real time | ETA: {eta}",
+    "batch_jobs_added_info": "Batch: {count} job(s) added to the queue.",
+    "batch_warning_no_jobs": "There are no pending jobs in the queue.",
+    "batch_stop_requested_info": "Batch: stop requested. Running jobs will be re-queued.",
+    "batch_resuming_info": "Batch: resuming {count} pending job(s) from the previous session.",
+    "parallel_workers_label": "Parallel processes:",
+    "parallel_workers_hint": "CPU only, files over 10 min are split at silences (each process loads its own model).",
+    "parallel_not_used_info": "Parallel processes not used: requires CPU and audio longer than {min_minutes} minutes.\n",
+    "skip_silence_checkbox": "Skip silent regions (voice activity detection)",
+    "vad_info": "Voice activity: {regions} speech regions, skipping {skipped}s of silence out of {duration}s ({percent:.0f}%), analysis {elapsed_ms} ms.\n",
+    "vad_not_applied_info": "Voice activity: only {percent:.0f}% silence found ({elapsed_ms} ms), decoding the full audio.\n",
+    "vad_no_speech_info": "Voice activity: no speech detected, nothing to transcribe.\n",
+    "bypass_cache_checkbox": "Bypass result cache (always transcribe again)",
+    "result_cache_hit_info": "Result cache hit: same audio and settings already transcribed, {segments} segments loaded without decoding.\n",
+    "daemon_preload_info": "Daemon at {url} is preloading model '{model}'.\n",
+    "daemon_unavailable_info": "Transcription daemon not reachable ({error}), transcribing in this process.\n",
+    "precision_label": "Precision:",
+    "precision_hint": "(int8 = quantized, faster on CPU)",
+    "precision_int8_cpu_only_info": "int8 precision is only available on CPU, using fp32 on this device.\n",
+    "cpu_threads_label": "CPU threads:",
+    "cpu_threads_hint": "(0 = automatic, calibrated per model)",
+    "thread_calibration_info": "Calibrating CPU threads for '{model}' (first use on this machine)...\n",
+    "cpu_threads_info": "Using {threads} CPU threads ({source}).\n",
+    "progress_label_transcribing_eta": "Transcribing audio... ~{minutes:02d}:{seconds:02d} remaining",
+    "preset_label": "Preset:",
+    "preset_fast": "Fast",
+    "preset_balanced": "Balanced",
+    "preset_accurate": "Accurate",
+    "preset_fast_desc": "(greedy, no fallback)",
+    "preset_balanced_desc": "(Whisper defaults)",
+    "preset_accurate_desc": "(beam search, slower)",
+    "two_pass_checkbox": "Quick draft first with:",
+    "two_pass_draft_info": "Two-pass: draft with '{draft}', then refining low-confidence segments with '{model}'.\n",
+    "two_pass_refine_info": "Draft done: {low} of {segments} segments below the confidence thresholds, refining {spans} spans ({seconds}s of {total}s).\n",
+    "streaming_audio_info": "Long file ({minutes} min): reading audio window by window ({source}, {rate} Hz) instead of decoding it whole.\n",
+    "archive_saved_info": "Transcript archived ({segments} segments, searchable in the Archive tab).\n",
+    "tab_archive": "Archive",
+    "archive_search_label": "Search:",
+    "archive_search_button": "Search",
+    "archive_summary": "{transcripts} transcripts archived ({segments} segments, {size_mb} MB). Type to search; \"quoted words\" match a phrase.",
+    "archive_results_summary": "{count} matching segments in {transcripts} transcripts ({elapsed_ms:.1f} ms).",
+    "archive_column_file": "File",
+    "archive_column_time": "Time",
+    "archive_column_text": "Segment",
+    "archive_transcript_frame": "Transcript",
+    "archive_play_button": "Play from Here",
+    "archive_stop_button": "Stop",
+    "archive_delete_button": "Delete Transcript",
+    "archive_confirm_delete": "Delete the archived transcript of {file}?",
+    "archive_file_missing": "The audio file is no longer available:\n{path}",
+    "archive_play_error": "Cannot play {file}: {error}",
+    "checkpoint_resume_info": "Checkpoint found: resuming an interrupted run of this file after {segments} segments ({position}s of {total}s already decoded).\n",
+    "checkpoint_saved_info": "Progress saved: transcribing this file again with the same settings resumes from here.\n",
+    "live_transcription_check": "Live transcription",
+    "live_latency_label": "Latency (s):",
+    "live_transcript_frame": "Live Transcript",
+    "live_status_loading": "Loading model '{model}' for live transcription...",
+    "live_status_listening": "Listening (target latency {latency:g} s).",
+    "live_status_behind": "Falling behind: {lag:.1f} s of audio waiting (target {latency:g} s). Choose a smaller model or a higher latency.",
+    "live_status_model_busy": "Model busy with another transcription, live text paused.",
+    "live_status_error": "Live transcription error: {error}",
+    "live_status_finished": "Live transcription finished ({passes} passes, {skipped:.1f} s of audio skipped).",
+    "memory_status_ram": "RAM {rss_gb:.1f} GB",
+    "memory_status_ram_unknown": "RAM n/a",
+    "memory_status_gpu": "GPU {allocated_gb:.1f} GB ({reserved_gb:.1f} GB reserved)",
+    "memory_status_models": "Models: {models} ({models_gb:.1f} GB)",
+    "device_cached_info": "Using {device} (detected earlier in this session).\n",
+    "audio_prepared_during_load_info": "Audio prepared in {audio_seconds:.1f}s while the model loaded ({load_seconds:.1f}s), waited {waited_seconds:.1f}s for it.\n",
+    "batch_output_renamed_warning": "Warning: {other} already wrote a transcript with the same name, {file} is saved as {output}.\n",
 
     # LLM Tab Keys
     "llm_input_label": "Input Text:",
@@ -233,10 +329,10 @@ it.update({
     "welcome_message": "Benvenuto in AudioScript! Seleziona un file audio, imposta le opzioni e avvia la trascrizione.",
     "selected_file_label": "File selezionato",
     "selected_file_info": "Selezionato: {filename} (Durata: {duration}, Canali: {channels}, Freq: {rate} Hz)",
-    "error_reading_wav_info": "Impossibile leggere info WAV per {filename}",
-    "stop_requested_info": "Interruzione richiesta. Completamento segmento corrente...",
+    "error_reading_wav_info": "Impossibile leggere info audio per {filename}",
+    "stop_requested_info": "Interruzione richiesta. Arresto dopo il passo di decodifica corrente...",
     "transcriber_config_info": "Avvio trascrizione: Modello={model_type}, Lingua={language}, Device={device}\n",
-    "estimated_time_info": "Durata audio: {minutes:02d}:{seconds:02d}. Tempo stimato: ~{est_minutes:02d}:{est_seconds:02d}.\n",
+    "estimated_time_info": "Durata audio: {minutes:02d}:{seconds:02d}. Tempo stimato: ~{est_minutes:02d}:{est_seconds:02d} ({source}).\n",
     "model_loaded_info": "Modello caricato in {minutes:02d}:{seconds:02d}.\n",
     "transcription_started_info": "Processo di trascrizione avviato...\n",
     "transcription_finished_info": "\nTrascrizione completata in {minutes:02d}:{seconds:02d}.",
@@ -271,6 +367,102 @@ it.update({
     "text_files_label": "File di Testo",
     "save_transcription_title": "Salva Trascrizione Come...",
     "transcription_saved_to": "Trascrizione salvata in",
+    "model_cache_stats_info": "Cache modelli: {hits} hit, {misses} miss, {resident_mb:.0f}/{budget_mb:.0f} MB residenti, {load_time:.1f}s di caricamento totale.\n",
+    "status_preloading_model": "Precaricamento modello '{model}'...",
+    "status_model_ready": "Modello '{model}' pronto ({seconds:.1f}s)",
+    "status_preload_failed": "Precaricamento modello '{model}' fallito",
+    "model_preloaded_info": "Modello '{model}' precaricato e inizializzato su {device} in {seconds:.1f}s.\n",
+    "error_model_preload": "ERRORE precaricamento modello '{model}': {error}",
+    "waiting_for_preload_info": "In attesa del termine del precaricamento del modello...\n",
+    "transcription_stopped_partial_info": "Trascrizione interrotta dopo {segments} segmenti ({processed}s di {duration}s elaborati, latenza di arresto {latency_ms} ms). Trascrizione parziale mantenuta.\n",
+    "tab_batch": "Batch",
+    "batch_add_files_button": "Aggiungi File...",
+    "batch_add_folder_button": "Aggiungi Cartella...",
+    "batch_start_button": "▶ Avvia Coda",
+    "batch_stop_button": "■ Ferma Coda",
+    "batch_retry_button": "Riprova Falliti",
+    "batch_clear_button": "Rimuovi Completati",
+    "batch_options_frame": "Opzioni Batch",
+    "batch_workers_label": "Worker:",
+    "batch_output_dir_label": "Cartella output (vuota = accanto all'audio):",
+    "batch_column_file": "File",
+    "batch_column_status": "Stato",
+    "batch_column_progress": "Avanzamento",
+    "batch_column_duration": "Durata",
+    "batch_column_elapsed": "Tempo",
+    "batch_status_pending": "In attesa",
+    "batch_status_running": "In corso",
+    "batch_status_done": "Completato",
+    "batch_status_error": "Errore",
+    "batch_summary": "Job: {done}/{total} completati, {running} in corso, {failed} falliti | Velocità: {throughput:.2f}x tempo reale | Fine stimata: {eta}",
+    "batch_jobs_added_info": "Batch: {count} job aggiunti alla coda.",
+    "batch_warning_no_jobs": "Non ci sono job in attesa nella coda.",
+    "batch_stop_requested_info": "Batch: interruzione richiesta. I job in corso verranno rimessi in coda.",
+    "batch_resuming_info": "Batch: ripresa di {count} job in attesa dalla sessione precedente.",
+    "parallel_workers_label": "Processi paralleli:",
+    "parallel_workers_hint": "Solo CPU, file oltre 10 min divisi nei silenzi (ogni processo carica il proprio modello).",
+    "parallel_not_used_info": "Processi paralleli non usati: richiedono CPU e audio più lungo di {min_minutes} minuti.\n",
+    "skip_silence_checkbox": "Salta le parti silenziose (rilevamento voce)",
+    "vad_info": "Attività vocale: {regions} regioni di parlato, saltati {skipped}s di silenzio su {duration}s ({percent:.0f}%), analisi {elapsed_ms} ms.\n",
+    "vad_not_applied_info": "Attività vocale: solo {percent:.0f}% di silenzio ({elapsed_ms} ms), decodifica dell'audio completo.\n",
+    "vad_no_speech_info": "Attività vocale: nessun parlato rilevato, niente da trascrivere.\n",
+    "bypass_cache_checkbox": "Ignora la cache dei risultati (trascrivi sempre di nuovo)",
+    "result_cache_hit_info": "Risultato trovato in cache: stesso audio e impostazioni già trascritti, {segments} segmenti caricati senza decodifica.\n",
+    "daemon_preload_info": "Il demone su {url} sta precaricando il modello '{model}'.\n",
+    "daemon_unavailable_info": "Demone di trascrizione non raggiungibile ({error}), trascrizione in questo processo.\n",
+    "precision_label": "Precisione:",
+    "precision_hint": "(int8 = quantizzato, più veloce su CPU)",
+    "precision_int8_cpu_only_info": "La precisione int8 è disponibile solo su CPU, uso fp32 su questo dispositivo.\n",
+    "cpu_threads_label": "Thread CPU:",
+    "cpu_threads_hint": "(0 = automatico, calibrato per modello)",
+    "thread_calibration_info": "Calibrazione dei thread CPU per '{model}' (primo utilizzo su questa macchina)...\n",
+    "cpu_threads_info": "Uso {threads} thread CPU ({source}).\n",
+    "progress_label_transcribing_eta": "Trascrizione audio... ~{minutes:02d}:{seconds:02d} rimanenti",
+    "preset_label": "Preset:",
+    "preset_fast": "Veloce",
+    "preset_balanced": "Bilanciato",
+    "preset_accurate": "Accurato",
+    "preset_fast_desc": "(greedy, senza fallback)",
+    "preset_balanced_desc": "(predefiniti di Whisper)",
+    "preset_accurate_desc": "(beam search, più lento)",
+    "two_pass_checkbox": "Bozza rapida prima con:",
+    "two_pass_draft_info": "Due passaggi: bozza con '{draft}', poi rifinitura dei segmenti poco affidabili con '{model}'.\n",
+    "two_pass_refine_info": "Bozza completata: {low} segmenti su {segments} sotto le soglie di affidabilità, rifinitura di {spans} intervalli ({seconds}s su {total}s).\n",
+    "streaming_audio_info": "File lungo ({minutes} min): audio letto una finestra alla volta ({source}, {rate} Hz) invece di decodificarlo per intero.\n",
+    "archive_saved_info": "Trascrizione archiviata ({segments} segmenti, ricercabile nella scheda Archivio).\n",
+    "tab_archive": "Archivio",
+    "archive_search_label": "Cerca:",
+    "archive_search_button": "Cerca",
+    "archive_summary": "{transcripts} trascrizioni archiviate ({segments} segmenti, {size_mb} MB). Scrivi per cercare; \"parole tra virgolette\" cercano una frase.",
+    "archive_results_summary": "{count} segmenti trovati in {transcripts} trascrizioni ({elapsed_ms:.1f} ms).",
+    "archive_column_file": "File",
+    "archive_column_time": "Tempo",
+    "archive_column_text": "Segmento",
+    "archive_transcript_frame": "Trascrizione",
+    "archive_play_button": "Riproduci da Qui",
+    "archive_stop_button": "Stop",
+    "archive_delete_button": "Elimina Trascrizione",
+    "archive_confirm_delete": "Eliminare la trascrizione archiviata di {file}?",
+    "archive_file_missing": "Il file audio non è più disponibile:\n{path}",
+    "archive_play_error": "Impossibile riprodurre {file}: {error}",
+    "checkpoint_resume_info": "Checkpoint trovato: ripresa di una trascrizione interrotta di questo file dopo {segments} segmenti ({position}s di {total}s già decodificati).\n",
+    "checkpoint_saved_info": "Avanzamento salvato: trascrivendo di nuovo questo file con le stesse impostazioni si riprende da qui.\n",
+    "live_transcription_check": "Trascrizione dal vivo",
+    "live_latency_label": "Latenza (s):",
+    "live_transcript_frame": "Trascrizione dal Vivo",
+    "live_status_loading": "Caricamento del modello '{model}' per la trascrizione dal vivo...",
+    "live_status_listening": "In ascolto (latenza obiettivo {latency:g} s).",
+    "live_status_behind": "In ritardo: {lag:.1f} s di audio in attesa (obiettivo {latency:g} s). Scegli un modello più piccolo o una latenza più alta.",
+    "live_status_model_busy": "Modello occupato da un'altra trascrizione, testo dal vivo in pausa.",
+    "live_status_error": "Errore della trascrizione dal vivo: {error}",
+    "live_status_finished": "Trascrizione dal vivo terminata ({passes} passaggi, {skipped:.1f} s di audio saltati).",
+    "memory_status_ram": "RAM {rss_gb:.1f} GB",
+    "memory_status_ram_unknown": "RAM n/d",
+    "memory_status_gpu": "GPU {allocated_gb:.1f} GB ({reserved_gb:.1f} GB riservati)",
+    "memory_status_models": "Modelli: {models} ({models_gb:.1f} GB)",
+    "device_cached_info": "Uso {device} (rilevato in precedenza in questa sessione).\n",
+    "audio_prepared_during_load_info": "Audio preparato in {audio_seconds:.1f}s durante il caricamento del modello ({load_seconds:.1f}s), attesa {waited_seconds:.1f}s.\n",
+    "batch_output_renamed_warning": "Attenzione: {other} ha già scritto una trascrizione con lo stesso nome, {file} viene salvato come {output}.\n",
      # LLM Tab Keys
     "llm_input_label": "Testo di Input:",
     "llm_load_transcription": "Carica Trascrizione",
@@ -421,10 +613,10 @@ fr.update({
     "welcome_message": "Bienvenue dans AudioScript ! Sélectionnez un fichier audio, définissez les options et démarrez la transcription.",
     "selected_file_label": "Fichier sélectionné",
     "selected_file_info": "Sélectionné : {filename} (Durée : {duration}, Canaux : {channels}, Fréq : {rate} Hz)",
-    "error_reading_wav_info": "Impossible de lire infos WAV pour {filename}",
-    "stop_requested_info": "Arrêt demandé. Fin du segment actuel...",
+    "error_reading_wav_info": "Impossible de lire infos audio pour {filename}",
+    "stop_requested_info": "Arrêt demandé. Arrêt après l'étape de décodage en cours...",
     "transcriber_config_info": "Début transcription : Modèle={model_type}, Langue={language}, Device={device}\n",
-    "estimated_time_info": "Durée audio : {minutes:02d}:{seconds:02d}. Temps estimé : ~{est_minutes:02d}:{est_seconds:02d}.\n",
+    "estimated_time_info": "Durée audio : {minutes:02d}:{seconds:02d}. Temps estimé : ~{est_minutes:02d}:{est_seconds:02d} ({source}).\n",
     "model_loaded_info": "Modèle chargé en {minutes:02d}:{seconds:02d}.\n",
     "transcription_started_info": "Processus de transcription démarré...\n",
     "transcription_finished_info": "\nTranscription terminée en {minutes:02d}:{seconds:02d}.",
@@ -459,6 +651,102 @@ fr.update({
     "text_files_label": "Fichiers Texte",
     "save_transcription_title": "Sauvegarder Transcription Sous...",
     "transcription_saved_to": "Transcription sauvegardée dans",
+    "model_cache_stats_info": "Cache modèles : {hits} succès, {misses} échecs, {resident_mb:.0f}/{budget_mb:.0f} Mo résidents, {load_time:.1f}s de chargement total.\n",
+    "status_preloading_model": "Préchargement du modèle '{model}'...",
+    "status_model_ready": "Modèle '{model}' prêt ({seconds:.1f}s)",
+    "status_preload_failed": "Échec du préchargement du modèle '{model}'",
+    "model_preloaded_info": "Modèle '{model}' préchargé et initialisé sur {device} en {seconds:.1f}s.\n",
+    "error_model_preload": "ERREUR préchargement du modèle '{model}' : {error}",
+    "waiting_for_preload_info": "Attente de la fin du préchargement du modèle...\n",
+    "transcription_stopped_partial_info": "Transcription arrêtée après {segments} segments ({processed}s sur {duration}s traités, latence d'arrêt {latency_ms} ms). Transcription partielle conservée.\n",
+    "tab_batch": "Lot",
+    "batch_add_files_button": "Ajouter Fichiers...",
+    "batch_add_folder_button": "Ajouter Dossier...",
+    "batch_start_button": "▶ Démarrer la File",
+    "batch_stop_button": "■ Arrêter la File",
+    "batch_retry_button": "Relancer Échecs",
+    "batch_clear_button": "Retirer Terminés",
+    "batch_options_frame": "Options du Lot",
+    "batch_workers_label": "Workers :",
+    "batch_output_dir_label": "Dossier de sortie (vide = à côté de l'audio) :",
+    "batch_column_file": "Fichier",
+    "batch_column_status": "État",
+    "batch_column_progress": "Progression",
+    "batch_column_duration": "Durée",
+    "batch_column_elapsed": "Temps",
+    "batch_status_pending": "En attente",
+    "batch_status_running": "En cours",
+    "batch_status_done": "Terminé",
+    "batch_status_error": "Erreur",
+    "batch_summary": "Tâches : {done}/{total} terminées, {running} en cours, {failed} en échec | Débit : {throughput:.2f}x temps réel | Fin estimée : {eta}",
+    "batch_jobs_added_info": "Lot : {count} tâche(s) ajoutée(s) à la file.",
+    "batch_warning_no_jobs": "Aucune tâche en attente dans la file.",
+    "batch_stop_requested_info": "Lot : arrêt demandé. Les tâches en cours seront remises en file.",
+    "batch_resuming_info": "Lot : reprise de {count} tâche(s) en attente de la session précédente.",
+    "parallel_workers_label": "Processus parallèles :",
+    "parallel_workers_hint": "CPU uniquement, fichiers de plus de 10 min découpés aux silences (chaque processus charge son modèle).",
+    "parallel_not_used_info": "Processus parallèles non utilisés : nécessitent le CPU et un audio de plus de {min_minutes} minutes.\n",
+    "skip_silence_checkbox": "Ignorer les passages silencieux (détection de voix)",
+    "vad_info": "Activité vocale : {regions} régions de parole, {skipped}s de silence ignorées sur {duration}s ({percent:.0f}%), analyse {elapsed_ms} ms.\n",
+    "vad_not_applied_info": "Activité vocale : seulement {percent:.0f}% de silence ({elapsed_ms} ms), décodage de l'audio complet.\n",
+    "vad_no_speech_info": "Activité vocale : aucune parole détectée, rien à transcrire.\n",
+    "bypass_cache_checkbox": "Ignorer le cache des résultats (toujours retranscrire)",
+    "result_cache_hit_info": "Résultat trouvé en cache : même audio et réglages déjà transcrits, {segments} segments chargés sans décodage.\n",
+    "daemon_preload_info": "Le démon sur {url} précharge le modèle '{model}'.\n",
+    "daemon_unavailable_info": "Démon de transcription injoignable ({error}), transcription dans ce processus.\n",
+    "precision_label": "Précision :",
+    "precision_hint": "(int8 = quantifié, plus rapide sur CPU)",
+    "precision_int8_cpu_only_info": "La précision int8 n'est disponible que sur CPU, utilisation de fp32 sur cet appareil.\n",
+    "cpu_threads_label": "Threads CPU :",
+    "cpu_threads_hint": "(0 = automatique, calibré par modèle)",
+    "thread_calibration_info": "Calibrage des threads CPU pour '{model}' (première utilisation sur cette machine)...\n",
+    "cpu_threads_info": "Utilisation de {threads} threads CPU ({source}).\n",
+    "progress_label_transcribing_eta": "Transcription audio... ~{minutes:02d}:{seconds:02d} restantes",
+    "preset_label": "Préréglage :",
+    "preset_fast": "Rapide",
+    "preset_balanced": "Équilibré",
+    "preset_accurate": "Précis",
+    "preset_fast_desc": "(glouton, sans repli)",
+    "preset_balanced_desc": "(paramètres Whisper par défaut)",
+    "preset_accurate_desc": "(beam search, plus lent)",
+    "two_pass_checkbox": "Brouillon rapide d'abord avec :",
+    "two_pass_draft_info": "Deux passes : brouillon avec '{draft}', puis affinage des segments peu fiables avec '{model}'.\n",
+    "two_pass_refine_info": "Brouillon terminé : {low} segments sur {segments} sous les seuils de confiance, affinage de {spans} plages ({seconds}s sur {total}s).\n",
+    "streaming_audio_info": "Fichier long ({minutes} min) : audio lu fenêtre par fenêtre ({source}, {rate} Hz) au lieu d'être décodé en entier.\n",
+    "archive_saved_info": "Transcription archivée ({segments} segments, consultable dans l'onglet Archives).\n",
+    "tab_archive": "Archives",
+    "archive_search_label": "Rechercher :",
+    "archive_search_button": "Rechercher",
+    "archive_summary": "{transcripts} transcriptions archivées ({segments} segments, {size_mb} Mo). Tapez pour rechercher ; des \"mots entre guillemets\" cherchent une phrase.",
+    "archive_results_summary": "{count} segments trouvés dans {transcripts} transcriptions ({elapsed_ms:.1f} ms).",
+    "archive_column_file": "Fichier",
+    "archive_column_time": "Temps",
+    "archive_column_text": "Segment",
+    "archive_transcript_frame": "Transcription",
+    "archive_play_button": "Lire à partir d'ici",
+    "archive_stop_button": "Arrêter",
+    "archive_delete_button": "Supprimer la Transcription",
+    "archive_confirm_delete": "Supprimer la transcription archivée de {file} ?",
+    "archive_file_missing": "Le fichier audio n'est plus disponible :\n{path}",
+    "archive_play_error": "Impossible de lire {file} : {error}",
+    "checkpoint_resume_info": "Point de reprise trouvé : reprise d'une transcription interrompue de ce fichier après {segments} segments ({position}s sur {total}s déjà décodés).\n",
+    "checkpoint_saved_info": "Progression enregistrée : transcrire à nouveau ce fichier avec les mêmes réglages reprendra d'ici.\n",
+    "live_transcription_check": "Transcription en direct",
+    "live_latency_label": "Latence (s) :",
+    "live_transcript_frame": "Transcription en Direct",
+    "live_status_loading": "Chargement du modèle '{model}' pour la transcription en direct...",
+    "live_status_listening": "À l'écoute (latence cible {latency:g} s).",
+    "live_status_behind": "En retard : {lag:.1f} s d'audio en attente (cible {latency:g} s). Choisissez un modèle plus petit ou une latence plus élevée.",
+    "live_status_model_busy": "Modèle occupé par une autre transcription, texte en direct en pause.",
+    "live_status_error": "Erreur de transcription en direct : {error}",
+    "live_status_finished": "Transcription en direct terminée ({passes} passes, {skipped:.1f} s d'audio ignorées).",
+    "memory_status_ram": "RAM {rss_gb:.1f} Go",
+    "memory_status_ram_unknown": "RAM n/d",
+    "memory_status_gpu": "GPU {allocated_gb:.1f} Go ({reserved_gb:.1f} Go réservés)",
+    "memory_status_models": "Modèles : {models} ({models_gb:.1f} Go)",
+    "device_cached_info": "Utilisation de {device} (détecté plus tôt dans cette session).\n",
+    "audio_prepared_during_load_info": "Audio préparé en {audio_seconds:.1f}s pendant le chargement du modèle ({load_seconds:.1f}s), attente {waited_seconds:.1f}s.\n",
+    "batch_output_renamed_warning": "Attention : {other} a déjà écrit une transcription du même nom, {file} est enregistré sous {output}.\n",
     # LLM Tab Keys
     "llm_input_label": "Texte d'Entrée :",
     "llm_load_transcription": "Charger Transcription",
@@ -609,10 +897,10 @@ cn.update({
     "welcome_message": "欢迎使用 AudioScript! 选择音频文件, 设置选项, 然后开始转录。",
     "selected_file_label": "已选文件",
     "selected_file_info": "已选: {filename} (时长: {duration}, 声道: {channels}, 采样率: {rate} Hz)",
-    "error_reading_wav_info": "无法读取 {filename} 的 WAV 信息",
-    "stop_requested_info": "已请求停止。正在完成当前片段...",
+    "error_reading_wav_info": "无法读取 {filename} 的音频信息",
+    "stop_requested_info": "已请求停止。将在当前解码步骤后停止...",
     "transcriber_config_info": "开始转录: 模型={model_type}, 语言={language}, 设备={device}\n",
-    "estimated_time_info": "音频时长: {minutes:02d}:{seconds:02d}. 预计时间: ~{est_minutes:02d}:{est_seconds:02d}.\n",
+    "estimated_time_info": "音频时长: {minutes:02d}:{seconds:02d}. 预计时间: ~{est_minutes:02d}:{est_seconds:02d} ({source}).\n",
     "model_loaded_info": "模型加载用时 {minutes:02d}:{seconds:02d}.\n",
     "transcription_started_info": "转录进程已开始...\n",
     "transcription_finished_info": "\n转录完成于 {minutes:02d}:{seconds:02d}.",
@@ -647,6 +935,102 @@ cn.update({
     "text_files_label": "文本文件",
     "save_transcription_title": "转录另存为...",
     "transcription_saved_to": "转录已保存至",
+    "model_cache_stats_info": "模型缓存: 命中 {hits} 次, 未命中 {misses} 次, 常驻 {resident_mb:.0f}/{budget_mb:.0f} MB, 总加载时间 {load_time:.1f}s.\n",
+    "status_preloading_model": "正在预加载模型 '{model}'...",
+    "status_model_ready": "模型 '{model}' 已就绪 ({seconds:.1f}s)",
+    "status_preload_failed": "模型 '{model}' 预加载失败",
+    "model_preloaded_info": "模型 '{model}' 已在 {device} 上预加载并预热, 用时 {seconds:.1f}s.\n",
+    "error_model_preload": "预加载模型 '{model}' 时出错: {error}",
+    "waiting_for_preload_info": "等待后台模型预加载完成...\n",
+    "transcription_stopped_partial_info": "转录在 {segments} 个片段后停止 (已处理 {processed}s / {duration}s, 停止延迟 {latency_ms} ms)。已保留部分转录。\n",
+    "tab_batch": "批量",
+    "batch_add_files_button": "添加文件...",
+    "batch_add_folder_button": "添加文件夹...",
+    "batch_start_button": "▶ 开始队列",
+    "batch_stop_button": "■ 停止队列",
+    "batch_retry_button": "重试失败项",
+    "batch_clear_button": "清除已完成",
+    "batch_options_frame": "批量选项",
+    "batch_workers_label": "工作线程:",
+    "batch_output_dir_label": "输出文件夹 (空 = 与音频相同):",
+    "batch_column_file": "文件",
+    "batch_column_status": "状态",
+    "batch_column_progress": "进度",
+    "batch_column_duration": "时长",
+    "batch_column_elapsed": "用时",
+    "batch_status_pending": "等待中",
+    "batch_status_running": "进行中",
+    "batch_status_done": "已完成",
+    "batch_status_error": "错误",
+    "batch_summary": "任务: {done}/{total} 已完成, {running} 进行中, {failed} 失败 | 吞吐: {throughput:.2f}x 实时 | 预计剩余: {eta}",
+    "batch_jobs_added_info": "批量: 已添加 {count} 个任务到队列。",
+    "batch_warning_no_jobs": "队列中没有等待中的任务。",
+    "batch_stop_requested_info": "批量: 已请求停止。进行中的任务将重新排队。",
+    "batch_resuming_info": "批量: 正在恢复上次会话的 {count} 个等待任务。",
+    "parallel_workers_label": "并行进程:",
+    "parallel_workers_hint": "仅 CPU, 超过 10 分钟的文件在静音处切分 (每个进程加载自己的模型)。",
+    "parallel_not_used_info": "未使用并行进程: 需要 CPU 且音频长于 {min_minutes} 分钟。\n",
+    "skip_silence_checkbox": "跳过静音部分 (语音活动检测)",
+    "vad_info": "语音活动: {regions} 个语音区域, 跳过 {duration}s 中的 {skipped}s 静音 ({percent:.0f}%), 分析 {elapsed_ms} ms。\n",
+    "vad_not_applied_info": "语音活动: 仅有 {percent:.0f}% 静音 ({elapsed_ms} ms), 解码完整音频。\n",
+    "vad_no_speech_info": "语音活动: 未检测到语音, 无需转录。\n",
+    "bypass_cache_checkbox": "绕过结果缓存 (始终重新转录)",
+    "result_cache_hit_info": "命中结果缓存: 相同音频和设置已转录, 直接加载 {segments} 个片段, 无需解码。\n",
+    "daemon_preload_info": "{url} 上的守护进程正在预加载模型 '{model}'。\n",
+    "daemon_unavailable_info": "无法连接转录守护进程 ({error}), 在本进程中转录。\n",
+    "precision_label": "精度:",
+    "precision_hint": "(int8 = 量化, CPU 上更快)",
+    "precision_int8_cpu_only_info": "int8 精度仅适用于 CPU, 此设备上使用 fp32。\n",
+    "cpu_threads_label": "CPU 线程:",
+    "cpu_threads_hint": "(0 = 自动, 按模型校准)",
+    "thread_calibration_info": "正在为 '{model}' 校准 CPU 线程 (本机首次使用)...\n",
+    "cpu_threads_info": "使用 {threads} 个 CPU 线程 ({source})。\n",
+    "progress_label_transcribing_eta": "转录音频... 剩余约 {minutes:02d}:{seconds:02d}",
+    "preset_label": "预设:",
+    "preset_fast": "快速",
+    "preset_balanced": "均衡",
+    "preset_accurate": "精确",
+    "preset_fast_desc": "(贪心解码, 无回退)",
+    "preset_balanced_desc": "(Whisper 默认设置)",
+    "preset_accurate_desc": "(束搜索, 较慢)",
+    "two_pass_checkbox": "先用快速草稿模型:",
+    "two_pass_draft_info": "两遍模式: 先用 '{draft}' 生成草稿, 再用 '{model}' 重新转录低置信度片段。\n",
+    "two_pass_refine_info": "草稿完成: {segments} 个片段中有 {low} 个低于置信度阈值, 正在重新转录 {spans} 个区间 ({seconds}秒/{total}秒)。\n",
+    "streaming_audio_info": "长文件 ({minutes} 分钟): 按窗口逐段读取音频 ({source}, {rate} Hz), 而不是整体解码。\n",
+    "archive_saved_info": "转录已归档 ({segments} 个片段, 可在归档标签页中搜索)。\n",
+    "tab_archive": "归档",
+    "archive_search_label": "搜索:",
+    "archive_search_button": "搜索",
+    "archive_summary": "已归档 {transcripts} 个转录 ({segments} 个片段, {size_mb} MB)。输入即可搜索; \"带引号的词\" 匹配短语。",
+    "archive_results_summary": "在 {transcripts} 个转录中找到 {count} 个匹配片段 ({elapsed_ms:.1f} ms)。",
+    "archive_column_file": "文件",
+    "archive_column_time": "时间",
+    "archive_column_text": "片段",
+    "archive_transcript_frame": "转录",
+    "archive_play_button": "从此处播放",
+    "archive_stop_button": "停止",
+    "archive_delete_button": "删除转录",
+    "archive_confirm_delete": "删除 {file} 的归档转录?",
+    "archive_file_missing": "音频文件已不可用:\n{path}",
+    "archive_play_error": "无法播放 {file}: {error}",
+    "checkpoint_resume_info": "发现检查点: 从 {segments} 个片段后继续此文件被中断的转录 (已解码 {position}s / {total}s)。\n",
+    "checkpoint_saved_info": "进度已保存: 使用相同设置再次转录此文件将从此处继续。\n",
+    "live_transcription_check": "实时转录",
+    "live_latency_label": "延迟 (秒):",
+    "live_transcript_frame": "实时转录",
+    "live_status_loading": "正在加载实时转录模型 '{model}'...",
+    "live_status_listening": "正在收听 (目标延迟 {latency:g} 秒)。",
+    "live_status_behind": "处理落后: {lag:.1f} 秒音频等待中 (目标 {latency:g} 秒)。请选择更小的模型或更高的延迟。",
+    "live_status_model_busy": "模型正被其他转录占用, 实时文本暂停。",
+    "live_status_error": "实时转录错误: {error}",
+    "live_status_finished": "实时转录完成 ({passes} 次处理, 跳过 {skipped:.1f} 秒音频)。",
+    "memory_status_ram": "内存 {rss_gb:.1f} GB",
+    "memory_status_ram_unknown": "内存 不可用",
+    "memory_status_gpu": "GPU {allocated_gb:.1f} GB (已预留 {reserved_gb:.1f} GB)",
+    "memory_status_models": "模型: {models} ({models_gb:.1f} GB)",
+    "device_cached_info": "使用 {device}（本次会话中已检测）。\n",
+    "audio_prepared_during_load_info": "音频在模型加载期间准备完成，用时 {audio_seconds:.1f}s（模型加载 {load_seconds:.1f}s），额外等待 {waited_seconds:.1f}s。\n",
+    "batch_output_renamed_warning": "警告: {other} 已写入同名的转录文件, {file} 另存为 {output}。\n",
     # LLM Tab Keys
     "llm_input_label": "输入文本:",
     "llm_load_transcription": "加载转录",
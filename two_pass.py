@@ -0,0 +1,56 @@
+# --- START OF FILE two_pass.py ---
+"""
+Confidence rules for two-pass (draft, then refine) transcription.
+
+A small model decodes the whole file first; only the draft segments that look unreliable
+are decoded again with the selected model. Adjacent unreliable segments are merged into
+one span, padded into the silence around them but never into a neighbouring reliable
+segment, so refined text cannot duplicate words that are kept from the draft. Long runs of
+unreliable segments are split into spans of at most MAX_SPAN_SECONDS, so a noisy recording
+never has to be sliced into memory as one piece.
+"""
+
+import typing
+
+DRAFT_MODELS = ["tiny", "base"]
+LOGPROB_THRESHOLD = -0.7 # Draft segments with a lower average token log-probability are re-decoded
+COMPRESSION_RATIO_THRESHOLD = 2.2 # Higher = repetitive text, a typical small-model failure
+NO_SPEECH_THRESHOLD = 0.4 # Text over audio the model thinks may be silence (possible hallucination)
+SPAN_PADDING_SECONDS = 0.5 # Context added on each side of a span (clamped to the neighbours)
+MAX_SPAN_SECONDS = 120.0 # Longest span decoded at once (4 Whisper windows, ~7.7 MB of samples)
+DRAFT_PROGRESS_SHARE = 0.25 # Part of the progress bar used by the draft pass
+
+
+def needs_refinement(segment: dict) -> bool:
+    """True if a draft segment fails any of the confidence checks."""
+    avg_logprob = segment.get("avg_logprob"); compression_ratio = segment.get("compression_ratio"); no_speech_prob = segment.get("no_speech_prob")
+    return ((avg_logprob is not None and avg_logprob < LOGPROB_THRESHOLD)
+            or (compression_ratio is not None and compression_ratio > COMPRESSION_RATIO_THRESHOLD)
+            or (no_speech_prob is not None and no_speech_prob > NO_SPEECH_THRESHOLD))
+
+
+def refinement_spans(segments: list[dict], total_seconds: float) -> list[dict]:
+    """
+    Groups consecutive low-confidence segments, up to MAX_SPAN_SECONDS per group. Each span is a
+    dict with 'first'/'last' (indices into segments, inclusive) and 'start'/'end' (seconds of
+    audio to re-decode).
+    """
+    spans: list[dict] = []
+    for index, segment in enumerate(segments):
+        if not needs_refinement(segment): continue
+        if spans and spans[-1]["last"] == index - 1 and segment["end"] - segments[spans[-1]["first"]]["start"] <= MAX_SPAN_SECONDS:
+            spans[-1]["last"] = index
+        else: spans.append({"first": index, "last": index})
+    for span in spans:
+        first, last = span["first"], span["last"]
+        lower = segments[first - 1]["end"] if first > 0 else 0.0
+        upper = segments[last + 1]["start"] if last + 1 < len(segments) else total_seconds
+        span["start"] = max(lower, segments[first]["start"] - SPAN_PADDING_SECONDS)
+        span["end"] = min(upper, segments[last]["end"] + SPAN_PADDING_SECONDS)
+    return [span for span in spans if span["end"] > span["start"]]
+
+
+def spans_seconds(spans: typing.Iterable[dict]) -> float:
+    return sum(span["end"] - span["start"] for span in spans)
+
+# --- END OF FILE two_pass.py ---
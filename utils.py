@@ -1,14 +1,15 @@
 # utils.py remains unchanged as it doesn't involve UI text
+import os
+import typing
 from datetime import timedelta
-import wave
+
+from audio_metadata import audio_metadata
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg", ".m4a") # Same formats as the file dialog
 
 def get_audio_duration(file_path):
     try:
-        with wave.open(file_path, 'r') as audio:
-            frames = audio.getnframes()
-            rate = audio.getframerate()
-            if rate <= 0: return 0 # Avoid division by zero
-            return frames / float(rate)
+        return audio_metadata.get(file_path)["duration"] # Header only, cached by path/mtime/size
     except Exception as e:
         # Optionally log the error here if needed for debugging
         # print(f"Error getting duration for {file_path}: {e}")
@@ -23,4 +24,27 @@ def format_duration(seconds):
     if hours > 0:
         return f"{hours:02}:{minutes:02}:{seconds:02}"
     else:
-        return f"{minutes:02}:{seconds:02}"
\ No newline at end of file
+        return f"{minutes:02}:{seconds:02}"
+
+
+def transcription_output_path(input_file: str, output_dir: str = "", source_root: str = "",
+                              claimed: typing.Optional[dict] = None) -> tuple[str, typing.Optional[str]]:
+    """
+    Where a transcript is written: <output_dir>/<name>_transcription.txt, next to the audio if no
+    directory is given. Files found under source_root (a folder added recursively) keep their
+    subfolders below output_dir. 'claimed' maps output paths already used in this run to their
+    input file and is updated; if the path belongs to another input (a.wav and a.flac, say), a
+    numeric suffix is added. Returns (path, the other input or None).
+    """
+    directory = output_dir or os.path.dirname(input_file)
+    if output_dir and source_root:
+        relative_dir = os.path.relpath(os.path.dirname(os.path.abspath(input_file)), os.path.abspath(source_root))
+        if relative_dir != "." and not relative_dir.startswith(".."): directory = os.path.join(output_dir, relative_dir)
+    stem = os.path.splitext(os.path.basename(input_file))[0]
+    path = os.path.join(directory, stem + "_transcription.txt")
+    if claimed is None: return path, None
+    owner = claimed.get(os.path.normcase(os.path.abspath(path))); number = 1
+    while claimed.get(os.path.normcase(os.path.abspath(path)), input_file) != input_file:
+        number += 1; path = os.path.join(directory, f"{stem}_{number}_transcription.txt")
+    claimed[os.path.normcase(os.path.abspath(path))] = input_file
+    return path, owner if owner != input_file else None
@@ -0,0 +1,201 @@
+# --- START OF FILE vad.py ---
+
+import typing
+
+import numpy as np
+
+SAMPLE_RATE = 16000 # Whisper input rate
+FRAME_SECONDS = 0.03 # Analysis frame
+NOISE_PERCENTILE = 10 # Quietest frames estimate the noise floor
+SPEECH_PERCENTILE = 90 # Loudest frames estimate the speech level
+ENERGY_MARGIN_DB = 12.0 # Speech must be this much louder than the noise floor...
+SPEECH_RANGE_DB = 15.0 # ...but a frame this close to the speech level always counts (recordings without pauses)
+ABSOLUTE_FLOOR_DB = -60.0 # Never treat anything quieter than this as speech
+FRICATIVE_MARGIN_DB = 6.0 # Unvoiced consonants are quieter...
+FRICATIVE_ZCR = 0.25 # ...but cross zero far more often than noise hum or voiced speech
+MIN_SPEECH_SECONDS = 0.25 # Shorter bursts are clicks, not words
+MIN_SILENCE_SECONDS = 0.6 # Shorter pauses stay inside the speech region
+PADDING_SECONDS = 0.3 # Context kept on both sides of every region
+MIN_SKIP_FRACTION = 0.05 # Below this much silence, compacting the audio is not worth it
+
+
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Returns start and end indices (end exclusive) of the True runs in a boolean array."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _frame_features(audio: np.ndarray, frame: int) -> tuple[np.ndarray, np.ndarray]:
+    """Energy (dB) and zero-crossing rate of each whole frame of the audio."""
+    n_frames = len(audio) // frame
+    frames = audio[:n_frames * frame].reshape(n_frames, frame).astype(np.float32, copy=False)
+    energy_db = 10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+    signs = np.signbit(frames)
+    return energy_db, np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+
+def detect_speech(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> list[tuple[int, int]]:
+    """
+    Finds the speech regions of mono float PCM using frame energy and zero-crossing rate.
+
+    The energy threshold adapts to the recording: a margin above the noise floor, capped
+    relative to the speech level. Regions are padded and pauses shorter than
+    MIN_SILENCE_SECONDS are merged. Returns (start, end) sample ranges, end exclusive.
+    """
+    energy_db, zcr = _frame_features(audio, int(sample_rate * FRAME_SECONDS))
+    return _regions_from_features(energy_db, zcr, len(audio), sample_rate)
+
+
+def detect_speech_blocks(blocks: typing.Iterable[np.ndarray], total_samples: int, sample_rate: int = SAMPLE_RATE) -> list[tuple[int, int]]:
+    """
+    Same as detect_speech over consecutive blocks of one recording (e.g. AudioStream.iter_blocks()),
+    so a long file is analysed without holding its samples: only the per-frame features are kept.
+    """
+    frame = int(sample_rate * FRAME_SECONDS)
+    energy_parts, zcr_parts = [], []; carry = np.zeros(0, dtype=np.float32)
+    for block in blocks:
+        samples = np.concatenate([carry, block]) if len(carry) else block
+        whole = len(samples) // frame * frame
+        energy_db, zcr = _frame_features(samples[:whole], frame)
+        energy_parts.append(energy_db); zcr_parts.append(zcr)
+        carry = samples[whole:]
+    if not energy_parts: return _regions_from_features(np.zeros(0), np.zeros(0), total_samples, sample_rate)
+    return _regions_from_features(np.concatenate(energy_parts), np.concatenate(zcr_parts), total_samples, sample_rate)
+
+
+def _regions_from_features(energy_db: np.ndarray, zcr: np.ndarray, total_samples: int, sample_rate: int) -> list[tuple[int, int]]:
+    frame = int(sample_rate * FRAME_SECONDS)
+    n_frames = len(energy_db)
+    if n_frames == 0: return [(0, total_samples)] if total_samples else []
+
+    noise_db = np.percentile(energy_db, NOISE_PERCENTILE)
+    level_db = np.percentile(energy_db, SPEECH_PERCENTILE)
+    threshold = max(min(noise_db + ENERGY_MARGIN_DB, level_db - SPEECH_RANGE_DB), ABSOLUTE_FLOOR_DB)
+    speech = energy_db > threshold
+    speech |= (energy_db > threshold - FRICATIVE_MARGIN_DB) & (zcr > FRICATIVE_ZCR)
+
+    # Drop bursts too short to be words
+    starts, ends = _runs(speech)
+    keep = (ends - starts) * FRAME_SECONDS >= MIN_SPEECH_SECONDS
+    starts, ends = starts[keep], ends[keep]
+    if len(starts) == 0: return []
+
+    # Pad, then merge regions separated by short pauses (padding can make them overlap)
+    pad = int(PADDING_SECONDS * sample_rate); min_gap = int(MIN_SILENCE_SECONDS * sample_rate)
+    regions: list[tuple[int, int]] = []
+    for start, end in zip(starts * frame, ends * frame):
+        start = max(0, int(start) - pad); end = min(total_samples, int(end) + pad)
+        if regions and start - regions[-1][1] < min_gap: regions[-1] = (regions[-1][0], end)
+        else: regions.append((start, end))
+    if n_frames * frame < total_samples and regions and regions[-1][1] >= n_frames * frame:
+        regions[-1] = (regions[-1][0], total_samples) # Keep the partial last frame with its region
+    return regions
+
+
+class SpeechTimeline:
+    """
+    Speech regions of one recording and the mapping between the compacted
+    (speech-only) timeline and the original one.
+    """
+
+    def __init__(self, regions: list[tuple[int, int]], total_samples: int, sample_rate: int = SAMPLE_RATE):
+        self.regions = regions
+        self.total_samples = total_samples
+        self.sample_rate = sample_rate
+        lengths = np.array([end - start for start, end in regions], dtype=np.int64)
+        self._compact_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(regions) else np.zeros(0, dtype=np.int64)
+        self._original_starts = np.array([start for start, _ in regions], dtype=np.int64)
+        self.speech_samples = int(lengths.sum()) if len(regions) else 0
+
+    @classmethod
+    def from_audio(cls, audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> 'SpeechTimeline':
+        """Analyses an array, or a stream with iter_blocks() (audio_loader.AudioStream) block by block."""
+        if hasattr(audio, "iter_blocks"): return cls(detect_speech_blocks(audio.iter_blocks(), len(audio), sample_rate), len(audio), sample_rate)
+        return cls(detect_speech(audio, sample_rate), len(audio), sample_rate)
+
+    @property
+    def speech_seconds(self) -> float:
+        return self.speech_samples / self.sample_rate
+
+    @property
+    def skipped_seconds(self) -> float:
+        return (self.total_samples - self.speech_samples) / self.sample_rate
+
+    @property
+    def skipped_fraction(self) -> float:
+        return (self.total_samples - self.speech_samples) / self.total_samples if self.total_samples else 0.0
+
+    def is_worthwhile(self) -> bool:
+        """True if enough silence was found for compacting the audio to pay off."""
+        return self.skipped_fraction >= MIN_SKIP_FRACTION
+
+    def compact(self, audio: np.ndarray) -> typing.Union[np.ndarray, 'CompactedAudio']:
+        """Concatenates the speech regions (for a stream, returns a view that reads them on demand)."""
+        if not isinstance(audio, np.ndarray): return CompactedAudio(self, audio)
+        if not self.regions: return audio[:0]
+        return np.concatenate([audio[start:end] for start, end in self.regions])
+
+    def to_original(self, seconds: float, is_end: bool = False) -> float:
+        """
+        Maps a time on the compacted timeline to the original one. A time on the border
+        between two regions maps to the end of the earlier region for segment ends, and to
+        the start of the later region otherwise.
+        """
+        if not self.regions: return seconds
+        sample = seconds * self.sample_rate
+        index = int(np.searchsorted(self._compact_starts, sample, side="left" if is_end else "right")) - 1
+        index = min(max(index, 0), len(self.regions) - 1)
+        return (self._original_starts[index] + sample - self._compact_starts[index]) / self.sample_rate
+
+    def remap_segment(self, segment: dict) -> dict:
+        """Returns a copy of the segment with start/end on the original timeline."""
+        remapped = dict(segment)
+        remapped["start"] = self.to_original(segment["start"])
+        remapped["end"] = max(remapped["start"], self.to_original(segment["end"], is_end=True))
+        return remapped
+
+
+class CompactedAudio:
+    """
+    The speech regions of a sliceable source (an AudioStream) joined end to end, read lazily:
+    len() is the speech length and compacted[start:stop] reads just the regions it covers.
+
+    Consecutive windows overlap (a window restarts at its last complete segment), so the last
+    read is kept and the overlap served from it; the source then only ever reads forward.
+    """
+
+    def __init__(self, timeline: SpeechTimeline, source):
+        self.timeline = timeline
+        self.source = source
+        self._last = np.zeros(0, dtype=np.float32); self._last_start = 0
+
+    def __len__(self) -> int:
+        return self.timeline.speech_samples
+
+    def reopened(self) -> 'CompactedAudio':
+        """The same view over a reopened source, for a second forward pass."""
+        return CompactedAudio(self.timeline, self.source.reopened())
+
+    def _read(self, start: int, stop: int) -> list[np.ndarray]:
+        timeline = self.timeline; parts = []
+        first = int(np.searchsorted(timeline._compact_starts, start, side="right")) - 1
+        for region in range(max(first, 0), len(timeline.regions)):
+            compact_start = int(timeline._compact_starts[region])
+            if compact_start >= stop: break
+            region_start, region_end = timeline.regions[region]
+            offset = max(start - compact_start, 0)
+            count = min(region_end - region_start, stop - compact_start) - offset
+            if count > 0: parts.append(self.source[region_start + offset:region_start + offset + count])
+        return parts
+
+    def __getitem__(self, index: slice) -> np.ndarray:
+        start, stop, _ = index.indices(len(self))
+        if stop <= start: return np.zeros(0, dtype=np.float32)
+        last_end = self._last_start + len(self._last)
+        if self._last_start <= start < last_end:
+            parts = [self._last[start - self._last_start:stop - self._last_start]] + (self._read(last_end, stop) if stop > last_end else [])
+        else: parts = self._read(start, stop)
+        self._last = np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32); self._last_start = start
+        return self._last.copy()
+
+# --- END OF FILE vad.py ---